@@ -2,11 +2,17 @@ from flask import Flask, request, send_file
 from flask_cors import CORS
 from flask_restx import Api
 from config.settings import Config
-from routes.pdf_routes import api as pdf_api
+from routes.pdf_routes import (
+    api as pdf_api, admission_controlled, pdf_worker_error_response, preflight_error_response,
+    resolve_fields_argument, resolve_early_stop_argument, extract_and_parse_resume
+)
 from routes.prediction_routes import api as prediction_api
-from routes.ai_routes import api as ai_api
+from routes.ai_routes import api as ai_api, analyze_resume_upload
+from services.admission_control import admission_info
 from services.pdf_service import PDFService
-from services.resume_parser_service import ResumeParserService
+from services.pdf_fonts import get_pdf_font_name
+from services.pdf_worker_pool import PDFExtractionTimeout, PDFExtractionMemoryExceeded
+from services.prediction_pool import run_prediction
 from utils.file_utils import allowed_file
 import tempfile
 import os
@@ -19,6 +25,9 @@ def create_app():
     # 설정 적용
     Config.init_app(app)
     
+    # PDF 생성용 한글 폰트 등록 (프로세스당 한 번, 첫 요청 전에 글꼴 파일을 읽어 둠)
+    get_pdf_font_name()
+    
     # CORS 설정
     CORS(app)
     
@@ -62,6 +71,7 @@ def create_app():
     
     # 기존 URL과의 호환성을 위한 추가 라우트
     @app.route('/analyze-probability', methods=['POST'])
+    @admission_controlled('prediction')
     def legacy_analyze_probability():
         """
         스프링과의 호환성을 위한 기업 확률 분석 엔드포인트
@@ -90,8 +100,8 @@ def create_app():
                         'details': '모델 파일을 확인해주세요.'
                     }, 500
             
-            # 예측 수행
-            probabilities = ai_service.predict_company_probabilities(request_data)
+            # 예측 수행 (BULKHEAD_ENABLED이면 예측 스레드 풀에서 실행)
+            probabilities = run_prediction(ai_service.predict_company_probabilities, request_data)
             
             # 가장 높은 확률의 기업 찾기
             top_company = max(probabilities.items(), key=lambda x: x[1])
@@ -114,6 +124,7 @@ def create_app():
             }, 500
 
     @app.route('/documents/convert', methods=['POST'])
+    @admission_controlled('pdf_extraction')
     def legacy_document_convert():
         """
         기존 URL과의 호환성을 위한 PDF 텍스트 변환 엔드포인트
@@ -163,6 +174,10 @@ def create_app():
                 temp_file_path = temp_file.name
             
             try:
+                preflight_error = preflight_error_response(temp_file_path)
+                if preflight_error:
+                    return preflight_error
+                
                 # PDF에서 텍스트 추출
                 extracted_text = PDFService.extract_text_from_pdf(temp_file_path)
                 
@@ -183,6 +198,9 @@ def create_app():
                 if os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
                 
+        except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+            return pdf_worker_error_response(e)
+                
         except Exception as e:
             return {
                 'error': '텍스트 추출 중 오류가 발생했습니다.',
@@ -191,6 +209,7 @@ def create_app():
             }, 500
 
     @app.route('/documents/parse-resume', methods=['POST'])
+    @admission_controlled('pdf_extraction')
     def legacy_resume_parse():
         """
         기존 URL과의 호환성을 위한 이력서 PDF 파싱 엔드포인트
@@ -211,6 +230,10 @@ def create_app():
                     'details': 'PDF 파일을 선택해주세요.'
                 }, 400
             
+            fields, fields_error = resolve_fields_argument()
+            if fields_error:
+                return fields_error
+            
             file = request.files['file']
             
             if not file:
@@ -240,37 +263,21 @@ def create_app():
                 temp_file_path = temp_file.name
             
             try:
-                # PDF에서 텍스트 추출
-                extracted_text = PDFService.extract_text_from_pdf(temp_file_path)
+                preflight_error = preflight_error_response(temp_file_path)
+                if preflight_error:
+                    return preflight_error
                 
-                if not extracted_text:
-                    return {
-                        'error': 'PDF에서 텍스트를 추출할 수 없습니다.',
-                        'code': 'NO_TEXT_EXTRACTED',
-                        'details': 'PDF 파일이 텍스트를 포함하지 않거나 이미지로만 구성되어 있습니다.'
-                    }, 400
-                
-                # 이력서 정보 파싱
-                parsed_resume = ResumeParserService.parse_resume(extracted_text)
-                
-                from datetime import datetime
-                import uuid
-                
-                return {
-                    'id': str(uuid.uuid4()),
-                    'type': 'parsed_resume',
-                    'parsed_data': parsed_resume,
-                    'raw_text': extracted_text,
-                    'file_size': len(extracted_text.encode('utf-8')),
-                    'created_at': datetime.now().isoformat(),
-                    'status': 'completed'
-                }
+                # PDF에서 텍스트 추출 후 이력서 정보 파싱 (요청한 필드만)
+                return extract_and_parse_resume(temp_file_path, fields, resolve_early_stop_argument())
                 
             finally:
                 # 임시 파일 삭제
                 if os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
                 
+        except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+            return pdf_worker_error_response(e)
+                
         except Exception as e:
             return {
                 'error': '이력서 파싱 중 오류가 발생했습니다.',
@@ -278,6 +285,21 @@ def create_app():
                 'details': str(e)
             }, 500
 
+    @app.route('/analyze-resume', methods=['POST'])
+    @admission_controlled('pdf_extraction')
+    def legacy_analyze_resume():
+        """
+        기존 URL 체계와 같은 경로의 이력서 PDF 기업 확률 분석 엔드포인트
+        """
+        return analyze_resume_upload()
+
+    @app.route('/admission')
+    def admission_status():
+        """
+        작업 종류별(PDF 추출, PDF 생성, 예측) 동시 실행 제한과 현재 점유 상태
+        """
+        return admission_info()
+
     @app.route('/')
     def index():
         return {
@@ -288,9 +310,17 @@ def create_app():
                 'api_base': '/api',
                 'pdf_conversion': '/api/documents/convert',
                 'resume_parsing': '/api/documents/parse-resume',
+                'pdf_inspection': '/api/documents/inspect',
+                'pdf_analysis': '/api/documents/analyze',
+                'batch_pdf_conversion': '/api/documents/convert/batch',
+                'batch_resume_parsing': '/api/documents/parse-resume/batch',
+                'bulk_pdf_generation': '/api/documents/generate/batch',
                 'prediction': '/api/predictions/',
+                'resume_analysis': '/api/ai/analyze-resume',
+                'legacy_resume_analysis': '/analyze-resume',
                 'legacy_pdf_conversion': '/documents/convert',
-                'legacy_resume_parsing': '/documents/parse-resume'
+                'legacy_resume_parsing': '/documents/parse-resume',
+                'admission_status': '/admission'
             }
         }
 
@@ -0,0 +1,88 @@
+"""
+업로드 폭주 중 예측 API 지연 시간 벤치마크 (작업 종류별 동시 실행 제한)
+
+업로드 스레드 여러 개가 큰 PDF를 /api/documents/convert로 계속 보내는 동안
+/api/ai/analyze-probability를 순서대로 호출하여 예측 요청의 지연 시간을 측정합니다.
+
+- off: 동시 실행 제한 없음 (모든 업로드가 요청 스레드에서 동시에 추출)
+- on: PDF 추출 동시 실행 2, 대기열 2 (넘치는 업로드는 바로 429)
+
+실행: python -m benchmarks.admission_control
+"""
+import contextlib
+import io
+import logging
+import statistics
+import threading
+import time
+from app import create_app
+from benchmarks.fixtures import PREDICTION_REQUEST, build_text_pdf
+from config.settings import Config
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+def run(app, pdf_bytes, uploaders, duration):
+    stop = threading.Event()
+    upload_status = []
+    
+    def upload():
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.post(
+                '/api/documents/convert',
+                data={'file': (io.BytesIO(pdf_bytes), 'resume.pdf')},
+                content_type='multipart/form-data'
+            )
+            upload_status.append(response.status_code)
+            if response.status_code == 429:
+                # Retry-After 대신 짧게 쉬고 다시 시도 (폭주 유지)
+                time.sleep(0.05)
+    
+    threads = [threading.Thread(target=upload) for _ in range(uploaders)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    
+    client = app.test_client()
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = client.post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.get_json()
+        time.sleep(0.02)
+    
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, upload_status
+
+def main(uploaders=16, duration=10):
+    logging.disable(logging.WARNING)
+    Config.ADMISSION_PDF_EXTRACTION_LIMIT = 2
+    Config.ADMISSION_PDF_EXTRACTION_QUEUE = 2
+    pdf_bytes = build_text_pdf(pages=20)
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = create_app()
+        # 모델 로드와 첫 예측은 측정에서 제외
+        app.test_client().post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+    
+    print(f"uploaders={uploaders}, pdf={len(pdf_bytes)} bytes, duration={duration}s")
+    print(f"{'admission':<11}{'predictions':>12}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'uploads ok':>12}{'429':>7}")
+    print("-" * 69)
+    for enabled in (False, True):
+        Config.ADMISSION_CONTROL_ENABLED = enabled
+        with contextlib.redirect_stdout(io.StringIO()):
+            latencies, upload_status = run(app, pdf_bytes, uploaders, duration)
+        print(
+            f"{'on' if enabled else 'off':<11}{len(latencies):>12}{statistics.median(latencies):>9.1f}"
+            f"{percentile(latencies, 0.99):>9.1f}{max(latencies):>9.1f}"
+            f"{upload_status.count(200):>12}{upload_status.count(429):>7}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+이력서 PDF 일괄 생성 벤치마크
+
+serial은 현재 프로세스에서 create_pdf_from_data를 차례로 호출한 처리량, pool 행은
+렌더러 프로세스 풀(BulkPDFService.stream_zip)로 ZIP까지 만든 처리량과 첫 ZIP 조각까지의
+시간입니다. 풀 생성(프로세스 시작, 템플릿/폰트 예열)은 측정에서 제외하며,
+CPU 코어 수보다 많은 프로세스는 처리량을 높이지 않습니다.
+
+실행: python -m benchmarks.bulk_pdf
+"""
+import logging
+import os
+import time
+from benchmarks.fixtures import build_resume_data
+from services.bulk_pdf_service import BulkPDFService
+from services.pdf_render_pool import PDFRenderPool
+from services.pdf_service import PDFService
+
+def main(count=200):
+    logging.disable(logging.WARNING)
+    documents = [build_resume_data(3, seed=seed) for seed in range(count)]
+    
+    print(f"{count} resumes, {os.cpu_count()} CPUs")
+    print(f"{'mode':<12}{'PDFs/sec':>10}{'first chunk (ms)':>18}{'zip bytes':>12}")
+    print("-" * 52)
+    
+    start = time.perf_counter()
+    for resume_data in documents:
+        PDFService.create_pdf_from_data(resume_data)
+    print(f"{'serial':<12}{count / (time.perf_counter() - start):>10.1f}{'-':>18}{'-':>12}")
+    
+    for processes in (1, 2, 4):
+        pool = PDFRenderPool(processes)
+        try:
+            # 프로세스 시작과 예열이 끝나도록 한 번 실행
+            list(BulkPDFService.stream_zip(documents[:processes * 2], pool))
+            
+            start = time.perf_counter()
+            first_chunk_ms, size = None, 0
+            for chunk in BulkPDFService.stream_zip(documents, pool):
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - start) * 1000
+                size += len(chunk)
+            throughput = count / (time.perf_counter() - start)
+        finally:
+            pool.shutdown()
+        
+        print(f"{f'pool x{processes}':<12}{throughput:>10.1f}{first_chunk_ms:>18.1f}{size:>12}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+문서 작업과 예측이 섞인 부하에서 예측 API 지연 시간 벤치마크 (벌크헤드)
+
+업로드 스레드 절반은 큰 PDF를 /api/documents/parse-resume로, 나머지 절반은 여러 페이지가 되는
+이력서 데이터를 /api/documents/로 계속 보내는 동안 /api/ai/analyze-probability를 순서대로 호출하여
+예측 요청의 지연 시간을 측정합니다. 벌크헤드 효과만 보기 위해 동시 실행 제한과 PDF 캐시는 끕니다.
+문서 요청은 모두 200이어야 하며, 하나라도 실패하면 AssertionError로 중단합니다.
+
+- off: 추출/파싱/렌더링과 예측을 모두 요청 스레드에서 실행 (GIL을 함께 사용)
+- on: BULKHEAD_ENABLED만 켜서 추출/파싱은 PDF 워커 프로세스 풀,
+  렌더링은 렌더러 프로세스 풀, 예측은 예측 스레드 풀에서 실행
+
+실행: python -m benchmarks.bulkheads
+"""
+import contextlib
+import io
+import logging
+import statistics
+import threading
+import time
+from app import create_app
+from benchmarks.fixtures import PREDICTION_REQUEST, build_resume_data, build_text_pdf
+from config.settings import Config
+from services.pdf_render_pool import get_pdf_render_pool
+from services.pdf_worker_pool import get_pdf_worker_pool
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+def build_document_data(paragraphs=40):
+    """/api/documents/ 요청 모델(resume_model)을 통과하면서 여러 페이지로 렌더링되는 이력서 데이터"""
+    resume_data = build_resume_data()
+    return {
+        'name': resume_data['name'],
+        'age': 30,
+        'experience': 0,
+        'skills': resume_data['skills'],
+        'introduction': resume_data['introduction'] * paragraphs
+    }
+
+def run(app, pdf_bytes, resume_data, uploaders, duration):
+    stop = threading.Event()
+    document_status = []
+    
+    def parse_upload():
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.post(
+                '/api/documents/parse-resume',
+                data={'file': (io.BytesIO(pdf_bytes), 'resume.pdf')},
+                content_type='multipart/form-data'
+            )
+            document_status.append(response.status_code)
+    
+    def generate():
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.post('/api/documents/', json=resume_data)
+            document_status.append(response.status_code)
+    
+    threads = [
+        threading.Thread(target=parse_upload if i % 2 == 0 else generate)
+        for i in range(uploaders)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    
+    client = app.test_client()
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = client.post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.get_json()
+        time.sleep(0.02)
+    
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, document_status
+
+def main(uploaders=8, duration=10):
+    logging.disable(logging.WARNING)
+    Config.ADMISSION_CONTROL_ENABLED = False
+    Config.PDF_CACHE_ENABLED = False
+    pdf_bytes = build_text_pdf(pages=20)
+    resume_data = build_document_data()
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = create_app()
+        # 모델 로드와 첫 예측은 측정에서 제외
+        app.test_client().post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+    
+    print(
+        f"uploaders={uploaders}, pdf={len(pdf_bytes)} bytes, duration={duration}s, "
+        f"extraction processes={Config.PDF_WORKER_PROCESSES}, render processes={Config.PDF_RENDER_PROCESSES}, "
+        f"prediction threads={Config.PREDICTION_POOL_THREADS}"
+    )
+    print(f"{'bulkhead':<10}{'predictions':>12}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'documents ok':>14}")
+    print("-" * 63)
+    for enabled in (False, True):
+        Config.BULKHEAD_ENABLED = enabled
+        if enabled:
+            # 워커/렌더러 프로세스 생성 비용은 측정에서 제외
+            for _ in range(Config.PDF_WORKER_PROCESSES):
+                get_pdf_worker_pool().extract_text(pdf_bytes)
+            list(get_pdf_render_pool().render_many([resume_data] * Config.PDF_RENDER_PROCESSES * 2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            latencies, document_status = run(app, pdf_bytes, resume_data, uploaders, duration)
+        assert document_status and set(document_status) == {200}, sorted(set(document_status))
+        print(
+            f"{'on' if enabled else 'off':<10}{len(latencies):>12}{statistics.median(latencies):>9.1f}"
+            f"{percentile(latencies, 0.99):>9.1f}{max(latencies):>9.1f}{document_status.count(200):>14}"
+        )
+
+if __name__ == "__main__":
+    main()
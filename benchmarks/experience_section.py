@@ -0,0 +1,42 @@
+"""
+긴 경력 섹션의 직책 위치 조회 벤치마크
+
+경력 항목 수를 늘려가며 _extract_experiences 실행 시간을 측정합니다.
+legacy 열은 매치마다 섹션을 줄 단위로 다시 나누고 선형 탐색하던
+이전 방식(O(매치 수 × 줄 수))의 직책 조회 시간입니다.
+
+실행: python -m benchmarks.experience_section
+"""
+import re
+import time
+from benchmarks.fixtures import build_experience_section
+from services.resume_parser_service import ResumeParserService
+
+# 이전 방식의 회사명/기간 패턴 (비교용)
+LEGACY_EXPERIENCE_PATTERN = re.compile(r'([가-힣a-zA-Z\s&]+)\s*\(?(\d{4}\.?\d{2})\s*[-~]\s*(\d{4}\.?\d{2}|현재|Present)\)?')
+
+def legacy_position_lookup(section_text):
+    """이전 방식의 직책 조회 (비교용)"""
+    for match in LEGACY_EXPERIENCE_PATTERN.finditer(section_text):
+        company = match.group(1).strip()
+        lines = section_text.split('\n')
+        for i, line in enumerate(lines):
+            if company in line:
+                break
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    print(f"{'entries':>8}{'chars':>10}{'indexed (ms)':>15}{'legacy (ms)':>14}")
+    print("-" * 47)
+    for entries in (100, 500, 1000, 2000, 4000):
+        section_text = build_experience_section(entries)
+        indexed = timed(ResumeParserService._extract_experiences, section_text)
+        legacy = timed(legacy_position_lookup, section_text)
+        print(f"{entries:>8}{len(section_text):>10}{indexed:>15.1f}{legacy:>14.1f}")
+
+if __name__ == "__main__":
+    main()
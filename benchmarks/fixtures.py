@@ -0,0 +1,244 @@
+import io
+import random
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+SAMPLE_RESUME_TEXT = """홍길동
+010-1234-5678 hong@example.com https://github.com/hong https://hong.tistory.com
+자기소개: 백엔드 개발자로서 대용량 트래픽 처리 경험이 있습니다.
+경력
+네이버 2020.03 - 2022.02
+백엔드 개발자
+카카오 2022.03 - 현재
+서버 개발자
+기술
+Python, Flask, Spring, Docker, Kubernetes, MySQL, Redis
+수상
+교내 해커톤 대상 (2019.11), 공개SW 개발자대회 은상 (2020.10)
+자격증
+정보처리기사 (2019.08), SQLD (2020.05)
+어학
+영어 상급, 일본어 중급
+프로젝트
+채용 추천 시스템 2021.01 - 2021.06, 실시간 채팅 서버 2021.07 - 2021.12
+"""
+
+# 기업 확률 분석 API(/api/ai/analyze-probability) 요청 데이터
+PREDICTION_REQUEST = {
+    'user_id': 1, 'recruitment_id': 1, 'job_category': 'backend',
+    'age': 25, 'school': 1, 'major': 1, 'gpa': 3.5,
+    'language_score': 2, 'activity_score': 4, 'internship_score': 6, 'award_score': 3
+}
+
+def build_graphics_heavy_pdf(pages=1, shapes_per_page=400, with_photo=True, seed=0):
+    """
+    장식 그래픽과 사진이 많은 이력서 형태의 PDF를 생성합니다.
+    
+    Args:
+        pages: 페이지 수
+        shapes_per_page: 페이지당 선/사각형/곡선 개수
+        with_photo: 페이지마다 증명사진 크기의 이미지를 넣을지 여부
+        seed: 난수 시드
+        
+    Returns:
+        bytes: PDF 데이터
+    """
+    rng = random.Random(seed)
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    photo = _build_photo() if with_photo else None
+    
+    for page_no in range(pages):
+        for i in range(shapes_per_page):
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+            kind = i % 3
+            if kind == 0:
+                c.rect(x, y, rng.uniform(2, 40), rng.uniform(2, 20), stroke=1, fill=i % 2)
+            elif kind == 1:
+                c.line(x, y, x + rng.uniform(-60, 60), y + rng.uniform(-60, 60))
+            else:
+                c.bezier(x, y, x + 10, y + 30, x + 30, y - 30, x + 40, y)
+        
+        if photo is not None:
+            c.drawImage(photo, width - 140, height - 170, width=100, height=130)
+        
+        text = c.beginText(50, height - 60)
+        text.setFont('Helvetica', 10)
+        for line in _ascii_resume_lines(page_no):
+            text.textLine(line)
+        c.drawText(text)
+        c.showPage()
+    
+    c.save()
+    return buffer.getvalue()
+
+def build_text_pdf(pages=1, lines_per_page=50):
+    """그래픽 없이 텍스트만 있는 PDF를 생성합니다."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    
+    for page_no in range(pages):
+        text = c.beginText(50, height - 60)
+        text.setFont('Helvetica', 10)
+        for i in range(lines_per_page):
+            text.textLine(f"Page {page_no + 1} line {i + 1}: Python Flask Docker 2021.01 - 2021.06")
+        c.drawText(text)
+        c.showPage()
+    
+    c.save()
+    return buffer.getvalue()
+
+def build_portfolio_pdf(pages=20, lines_per_page=50):
+    """첫 페이지는 이력서, 나머지는 포트폴리오 설명으로 구성된 긴 PDF를 생성합니다."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    
+    for page_no in range(pages):
+        text = c.beginText(50, height - 60)
+        text.setFont('Helvetica', 10)
+        if page_no == 0:
+            lines = _ascii_resume_lines(page_no) + ["Projects", "Chat Server 2021.01 - 2021.06"]
+        else:
+            lines = [f"Portfolio page {page_no + 1} detail {i + 1}: Python Kubernetes Docker" for i in range(lines_per_page)]
+        for line in lines:
+            text.textLine(line)
+        c.drawText(text)
+        c.showPage()
+    
+    c.save()
+    return buffer.getvalue()
+
+def build_styled_resume_pdf(experiences=3):
+    """
+    섹션 헤더는 큰 굵은 글꼴, 회사명은 본문 크기의 굵은 글꼴로 쓴 이력서 PDF를 생성합니다.
+    
+    경력 설명에 섹션 키워드로 시작하는 본문 줄('Tools: ...', 'Skills used: ...')이 있어
+    키워드 탐지로는 경력 섹션이 중간에 끊깁니다.
+    """
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    y = height - 60
+    
+    def line(text, font='Helvetica', size=10):
+        nonlocal y
+        if y < 60:
+            c.showPage()
+            y = height - 60
+        c.setFont(font, size)
+        c.drawString(50, y, text)
+        y -= size + 6
+    
+    line('Hong Gildong', 'Helvetica-Bold', 20)
+    line('010-1234-5678 hong@example.com https://github.com/hong')
+    line('Experience', 'Helvetica-Bold', 14)
+    for i in range(experiences):
+        year = 2000 + i % 20
+        line(f'Company {chr(65 + i % 26)} {year}.03 - {year + 1}.02', 'Helvetica-Bold')
+        line('Backend Engineer')
+        line('Tools: Jira, Confluence, Grafana')
+        line('Skills used: Python, Redis')
+    line('Skills', 'Helvetica-Bold', 14)
+    line('Python, Flask, Spring, Docker, Kubernetes, MySQL, Redis')
+    line('Awards', 'Helvetica-Bold', 14)
+    line('Campus Hackathon Grand Prize (2019.11)')
+    
+    c.save()
+    return buffer.getvalue()
+
+def build_resume_text(repeat=1):
+    """파서 벤치마크용 이력서 텍스트를 반환합니다."""
+    return "\n".join([SAMPLE_RESUME_TEXT] * repeat)
+
+def build_experience_section(entries=100):
+    """회사/기간 줄과 직책 줄이 반복되는 긴 경력 섹션 텍스트를 생성합니다."""
+    lines = []
+    for i in range(entries):
+        year = 2000 + i % 20
+        lines.append(f"회사{i % 26:02d} {year}.03 - {year + 1}.02")
+        lines.append(f"백엔드 개발자 {i}")
+    return "\n".join(lines)
+
+def build_resume_data(experiences=3, seed=0):
+    """
+    PDF 생성 API(/api/documents/, /api/pdf/text-to-pdf)에 보내는 이력서 JSON 데이터를 생성합니다.
+    
+    Args:
+        experiences: 경력 항목 수 (항목이 많을수록 페이지가 늘어남)
+        seed: 내용을 바꾸기 위한 번호 (같은 값이면 같은 데이터)
+    """
+    return {
+        'name': f'Hong Gildong {seed}',
+        'email': f'hong{seed}@example.com',
+        'phone': '010-1234-5678',
+        'address': 'Seoul, Korea',
+        'education': [
+            {'school': 'Sejong University', 'period': '2014.03 - 2020.02',
+             'major': 'Computer Science', 'degree': 'Bachelor'}
+        ],
+        'experience': [
+            {
+                'company': f'Company {i}',
+                'period': f'{2010 + i % 10}.03 - {2011 + i % 10}.02',
+                'position': 'Backend Engineer',
+                'description': 'Designed and operated high-traffic APIs with Python, Flask and Redis. ' * 3
+            }
+            for i in range(experiences)
+        ],
+        'skills': ['Python', 'Flask', 'Spring', 'Docker', 'Kubernetes', 'MySQL', 'Redis'],
+        'introduction': 'Backend engineer experienced in large-scale traffic handling. ' * 5
+    }
+
+def build_korean_resume_data(experiences=3, seed=0):
+    """한글 이력서 JSON 데이터를 생성합니다. (build_resume_data와 같은 구조)"""
+    return {
+        'name': f'홍길동 {seed}',
+        'email': f'hong{seed}@example.com',
+        'phone': '010-1234-5678',
+        'address': '서울특별시 강남구 테헤란로 123',
+        'education': [
+            {'school': '세종대학교', 'period': '2014.03 - 2020.02', 'major': '컴퓨터공학과', 'degree': '학사'}
+        ],
+        'experience': [
+            {
+                'company': f'회사 {i}',
+                'period': f'{2010 + i % 10}.03 - {2011 + i % 10}.02',
+                'position': '백엔드 개발자',
+                'description': 'Python, Flask, Redis로 대용량 트래픽 API를 설계하고 운영했습니다. ' * 3
+            }
+            for i in range(experiences)
+        ],
+        'skills': ['Python', 'Flask', 'Spring', 'Docker', 'Kubernetes', 'MySQL', 'Redis'],
+        'introduction': '대용량 트래픽 처리 경험이 있는 백엔드 개발자입니다. 안정적인 서비스 운영을 중요하게 생각합니다. ' * 5
+    }
+
+def _ascii_resume_lines(page_no):
+    return [
+        f"Hong Gildong - page {page_no + 1}",
+        "010-1234-5678 hong@example.com https://github.com/hong",
+        "Experience",
+        "Naver 2020.03 - 2022.02 Backend Engineer",
+        "Kakao 2022.03 - Present Server Engineer",
+        "Skills",
+        "Python, Flask, Spring, Docker, Kubernetes, MySQL, Redis",
+        "Awards",
+        "Campus Hackathon Grand Prize (2019.11)",
+    ]
+
+def _build_photo():
+    from PIL import Image
+    
+    image = Image.new('RGB', (300, 390))
+    pixels = image.load()
+    for x in range(300):
+        for y in range(390):
+            pixels[x, y] = ((x * 7) % 256, (y * 3) % 256, ((x + y) * 5) % 256)
+    
+    data = io.BytesIO()
+    image.save(data, format='JPEG')
+    data.seek(0)
+    return ImageReader(data)
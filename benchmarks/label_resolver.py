@@ -0,0 +1,70 @@
+"""
+학교/전공 라벨 변환기 벤치마크
+
+기본 라벨 테이블에 합성 학교를 추가하여 테이블 크기를 늘려가며, 색인 생성 시간과
+정확 일치/유사 일치 조회 1회당 시간(µs)을 모든 이름과 비교하는 방식(naive 열)과 비교합니다.
+
+실행: python -m benchmarks.label_resolver
+"""
+import json
+import time
+from config.settings import Config
+from services.label_resolver import LabelResolver
+
+# (종류, 질의, 정확 일치 여부)
+QUERIES = [
+    ('school', '세종 대학교', True),
+    ('school', 'Yonsei Univ', True),
+    ('major', '컴퓨터공학부', True),
+    ('major', '컴퓨터정보공학과', False),
+    ('major', '소프트웨어융합학과', False),
+    ('major', 'Computer Sci.', False)
+]
+
+def build_spec(extra_schools):
+    """기본 테이블에 합성 학교 extra_schools개를 추가한 테이블을 만듭니다."""
+    with open(Config.LABEL_TABLE_PATH, encoding='utf-8') as spec_file:
+        spec = json.load(spec_file)
+    spec['school'] += [
+        {'label': 100.0 + i, 'name': f'합성{i}대학교', 'aliases': [f'합성{i}대', f'Synthetic {i} University']}
+        for i in range(extra_schools)
+    ]
+    return spec
+
+def naive_resolve(resolver, kind, text):
+    """모든 이름의 n-gram과 비교 (비교용)"""
+    grams = resolver._ngrams(resolver.normalize(kind, text))
+    return max(resolver._names[kind], key=lambda name: 2 * len(grams & name[3]) / (len(grams) + len(name[3])))
+
+def per_call_us(func, *args, repeat=2000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+def main():
+    print(f"{'schools':>8}{'build (ms)':>12}{'exact (µs)':>12}{'fuzzy (µs)':>12}{'naive (µs)':>12}")
+    print("-" * 56)
+    for extra_schools in (0, 1000, 10000):
+        spec = build_spec(extra_schools)
+        start = time.perf_counter()
+        resolver = LabelResolver(spec)
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        exact = [(kind, text) for kind, text, is_exact in QUERIES if is_exact]
+        fuzzy = [(kind, text) for kind, text, is_exact in QUERIES if not is_exact]
+        fuzzy.append(('school', '합성7대학원'))
+        
+        exact_us = sum(per_call_us(resolver.resolve, kind, text) for kind, text in exact) / len(exact)
+        fuzzy_us = sum(per_call_us(resolver.resolve, kind, text) for kind, text in fuzzy) / len(fuzzy)
+        naive_us = sum(per_call_us(naive_resolve, resolver, kind, text, repeat=50) for kind, text in fuzzy) / len(fuzzy)
+        
+        print(f"{len(spec['school']):>8}{build_ms:>12.1f}{exact_us:>12.2f}{fuzzy_us:>12.2f}{naive_us:>12.1f}")
+    
+    resolver = LabelResolver.load()
+    print()
+    for kind, text, _ in QUERIES:
+        print(f"{kind:>7} {text!r:<24} → {resolver.resolve(kind, text)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+이력서 파서 최악 입력 퍼즈 벤치마크
+
+정규식 역추적을 유발하기 쉬운 입력(쉼표 없는 긴 구간, 긴 문자/공백/숫자 연속,
+날짜와 비슷한 토큰 반복, 무작위 구조 문자 조합)을 길이별로 생성하여
+추출기별 최대 실행 시간을 측정합니다. 모든 추출기가 선형 시간이면
+입력 길이가 4배가 될 때 최대 시간도 약 4배로만 증가합니다 (growth 열).
+
+실행: python -m benchmarks.parser_fuzz [--lengths 1000,4000,16000,64000] [--random-cases 5]
+"""
+import argparse
+import random
+import time
+from services.resume_parser_service import ResumeParserService
+from services.resume_patterns import PATTERNS
+
+# 무작위 입력에 사용할 구조 문자 (구분자, 괄호, 날짜 구성 문자, 한글/영문)
+FUZZ_ALPHABET = ' \t\n,，()-~.:@/&가나Aa019현재'
+
+def adversarial_inputs(length, random_cases=5, seed=0):
+    """길이가 length인 최악 입력 후보들을 생성합니다."""
+    def repeat(unit):
+        return (unit * (length // len(unit) + 1))[:length]
+    
+    cases = {
+        'comma_free_run': repeat('수상 내역 '),
+        'letter_run': repeat('a'),
+        'hangul_run': repeat('가'),
+        'whitespace_run': 'a' + ' ' * (length - 2) + '!',
+        'digit_run': repeat('1'),
+        'near_dates': repeat('2019.1 '),
+        'dangling_periods': repeat('회사 2020.03 - '),
+        'open_parens': repeat('영어('),
+        'dotted_words': repeat('a.'),
+        'email_like': 'a@' + repeat('a.')[:length - 2],
+        'colon_gaps': repeat('영어 : : '),
+    }
+    rng = random.Random(seed)
+    for i in range(random_cases):
+        cases[f'random_{i}'] = ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(length))
+    return cases
+
+def extractors():
+    """(이름, 입력 텍스트를 받는 함수) 목록"""
+    return [
+        ('preprocess', ResumeParserService._preprocess_text),
+        ('section_index', ResumeParserService._build_section_index),
+        ('entity_scan', PATTERNS.scan_entities),
+        ('introduction', ResumeParserService._extract_introduction),
+        ('experiences', ResumeParserService._extract_experiences),
+        ('skills', ResumeParserService._extract_skills),
+        ('awards', ResumeParserService._extract_awards),
+        ('certificates', ResumeParserService._extract_certificates),
+        ('languages', ResumeParserService._extract_languages),
+        ('projects', ResumeParserService._extract_projects),
+        ('parse_resume', lambda text: ResumeParserService.parse_resume('수상\n' + text)),
+    ]
+
+def max_latency(func, cases):
+    """모든 입력 중 가장 오래 걸린 실행 시간(ms)과 입력 이름을 반환합니다."""
+    worst_ms, worst_case = 0.0, ''
+    for name, text in cases.items():
+        start = time.perf_counter()
+        func(text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > worst_ms:
+            worst_ms, worst_case = elapsed_ms, name
+    return worst_ms, worst_case
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lengths', default='1000,4000,16000,64000')
+    parser.add_argument('--random-cases', type=int, default=5)
+    args = parser.parse_args()
+    lengths = [int(length) for length in args.lengths.split(',')]
+    
+    inputs = {length: adversarial_inputs(length, args.random_cases) for length in lengths}
+    
+    header = f"{'extractor':<15}" + ''.join(f"{f'{length} (ms)':>14}" for length in lengths)
+    print(header + f"{'growth':>9}  worst input")
+    print("-" * (len(header) + 24))
+    for name, func in extractors():
+        results = [max_latency(func, inputs[length]) for length in lengths]
+        # 입력 길이 배율 대비 최대 시간 배율 (1.0이면 선형)
+        growth = (results[-1][0] / max(results[0][0], 1e-3)) / (lengths[-1] / lengths[0])
+        row = f"{name:<15}" + ''.join(f"{ms:>14.2f}" for ms, _ in results)
+        print(row + f"{growth:>9.2f}  {results[-1][1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+PDF 통합 분석(한 번 열기) 벤치마크
+
+- separate: 텍스트, 단어, 표, 메타데이터를 결과물마다 pdfplumber.open으로 따로 계산
+- single: PDFService._analyze로 한 번 열어 같은 페이지 해석 결과에서 함께 계산
+- text only: 결과물 선택으로 텍스트만 요청했을 때와 기존 텍스트 추출 비교
+
+실행: python -m benchmarks.pdf_analysis
+"""
+import io
+import time
+import pdfplumber
+from benchmarks.fixtures import build_graphics_heavy_pdf, build_resume_data, build_text_pdf
+from services.pdf_service import PDF_ANALYSIS_ARTIFACTS, PDFService
+
+def analyze_separately(pdf_bytes):
+    """결과물마다 문서를 새로 열어 계산 (기존 방식)"""
+    result = {'text': PDFService._extract_text(io.BytesIO(pdf_bytes), lean=False)}
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        result['words'] = [page.extract_words(extra_attrs=['size', 'fontname']) for page in pdf.pages]
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        result['tables'] = [page.extract_tables() for page in pdf.pages]
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        result['metadata'] = pdf.metadata
+    return result
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(repeat=5):
+    fixtures = (
+        ('resume', b''.join(PDFService.render_pdf(build_resume_data(20)).chunks)),
+        ('text 10p', build_text_pdf(pages=10)),
+        ('graphics 3p', build_graphics_heavy_pdf(pages=3))
+    )
+    
+    print(f"{'fixture':<14}{'separate ms':>13}{'single ms':>11}{'speedup':>9}{'extract ms':>12}{'text only ms':>14}")
+    print("-" * 73)
+    for label, pdf_bytes in fixtures:
+        separate_ms = measure(lambda: analyze_separately(pdf_bytes), repeat)
+        single_ms = measure(lambda: PDFService._analyze(io.BytesIO(pdf_bytes), PDF_ANALYSIS_ARTIFACTS, lean=False), repeat)
+        extract_ms = measure(lambda: PDFService._extract_text(io.BytesIO(pdf_bytes)), repeat)
+        text_only_ms = measure(lambda: PDFService._analyze(io.BytesIO(pdf_bytes), ('text',)), repeat)
+        print(
+            f"{label:<14}{separate_ms:>13.1f}{single_ms:>11.1f}{separate_ms / single_ms:>8.2f}x"
+            f"{extract_ms:>12.1f}{text_only_ms:>14.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+생성된 PDF 캐시 벤치마크 (/api/pdf/text-to-pdf, requests/sec)
+
+miss는 매 요청 전에 캐시를 비워 렌더링까지 포함한 처리량, memory와 disk는 각 계층에서
+적중했을 때의 처리량(disk는 매 요청 전에 메모리 계층만 비움), 304는 If-None-Match가
+ETag와 일치하여 렌더링과 캐시 조회 없이 응답한 처리량입니다.
+
+실행: python -m benchmarks.pdf_cache
+"""
+import logging
+import shutil
+import tempfile
+from flask import Flask
+from benchmarks.fixtures import build_resume_data
+from benchmarks.pdf_generation import measure
+from services import pdf_cache
+
+def post_pdf(client, payload, before=None, expected=200, headers=None):
+    if before is not None:
+        before()
+    response = client.post('/api/pdf/text-to-pdf', json=payload, headers=headers)
+    assert response.status_code == expected, response.get_data(as_text=True)[:200]
+    return response
+
+def main():
+    logging.disable(logging.INFO)
+    from routes.swagger_routes import swagger_bp
+    
+    app = Flask(__name__)
+    app.register_blueprint(swagger_bp, url_prefix='/api')
+    client = app.test_client()
+    
+    cache_dir = tempfile.mkdtemp()
+    cache = pdf_cache._cache = pdf_cache.RenderedPDFCache(128, cache_dir, 64 * 1024 * 1024)
+    try:
+        print(f"{'fixture':<16}{'bytes':>8}{'miss':>10}{'memory':>10}{'disk':>10}{'304':>10}")
+        print("-" * 64)
+        for experiences in (3, 40):
+            resume_data = build_resume_data(experiences)
+            response = post_pdf(client, resume_data)
+            etag = response.headers['ETag']
+            
+            miss = measure(lambda: post_pdf(client, resume_data, cache.clear))
+            post_pdf(client, resume_data)
+            memory = measure(lambda: post_pdf(client, resume_data))
+            disk = measure(lambda: post_pdf(client, resume_data, cache.memory.clear))
+            not_modified = measure(lambda: post_pdf(client, resume_data, expected=304, headers={'If-None-Match': etag}))
+            
+            print(f"{f'{experiences} experiences':<16}{len(response.data):>8}{miss:>10.1f}{memory:>10.1f}{disk:>10.1f}{not_modified:>10.1f}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
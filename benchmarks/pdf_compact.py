@@ -0,0 +1,92 @@
+"""
+생성 PDF 크기/렌더링 시간 회귀 벤치마크 (기본 모드 vs compact 모드)
+
+픽스처 이력서마다 PDF 크기(bytes)와 렌더링 시간(ms)을 측정합니다. 생성 시각과 문서 ID를
+고정하여(invariant) 렌더링하므로 크기는 코드가 같으면 항상 같으며,
+benchmarks/pdf_compact_baseline.json의 기준값보다 1% 넘게 커지면 REGRESSION으로
+표시하고 종료 코드 1을 반환합니다. (기준값은 같은 폰트로 측정한 경우에만 비교)
+
+실행: python -m benchmarks.pdf_compact [--update-baseline]
+"""
+import io
+import json
+import logging
+import os
+import sys
+import time
+from benchmarks.fixtures import build_korean_resume_data, build_resume_data
+from services.pdf_fonts import get_pdf_font_name
+from services.resume_template import get_resume_template
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf_compact_baseline.json')
+
+# 허용하는 크기 증가율
+TOLERANCE = 0.01
+
+def fixture_corpus():
+    """(이름, 이력서 데이터) 목록"""
+    return [
+        ('minimal', {'name': 'Hong Gildong'}),
+        ('en_3', build_resume_data(3)),
+        ('en_40', build_resume_data(40)),
+        ('ko_3', build_korean_resume_data(3)),
+        ('ko_40', build_korean_resume_data(40))
+    ]
+
+def render(resume_data, compact):
+    buffer = io.BytesIO()
+    get_resume_template().render(resume_data, buffer, invariant=True, compact=compact)
+    return buffer.getvalue()
+
+def measure_ms(resume_data, compact, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render(resume_data, compact)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(argv=None, repeat=20):
+    logging.disable(logging.WARNING)
+    argv = sys.argv[1:] if argv is None else argv
+    font_name = get_pdf_font_name()
+    
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file).get(font_name, {})
+    
+    print(f"font: {font_name}")
+    print(f"{'fixture':<10}{'default B':>11}{'compact B':>11}{'saved':>8}{'default ms':>12}{'compact ms':>12}  status")
+    print("-" * 74)
+    
+    results, regressions = {}, 0
+    for name, resume_data in fixture_corpus():
+        sizes = {mode: len(render(resume_data, mode == 'compact')) for mode in ('default', 'compact')}
+        times = {mode: measure_ms(resume_data, mode == 'compact', repeat) for mode in ('default', 'compact')}
+        results[name] = sizes
+        
+        status = 'new'
+        if name in baseline:
+            regressed = [mode for mode in sizes if sizes[mode] > baseline[name][mode] * (1 + TOLERANCE)]
+            status = f"REGRESSION ({', '.join(regressed)})" if regressed else 'ok'
+            regressions += bool(regressed)
+        
+        saved = 1 - sizes['compact'] / sizes['default']
+        print(f"{name:<10}{sizes['default']:>11}{sizes['compact']:>11}{saved:>8.1%}"
+              f"{times['default']:>12.2f}{times['compact']:>12.2f}  {status}")
+    
+    if '--update-baseline' in argv:
+        stored = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, encoding='utf-8') as baseline_file:
+                stored = json.load(baseline_file)
+        stored[font_name] = results
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as baseline_file:
+            json.dump(stored, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f"기준값 저장: {BASELINE_PATH}")
+        return 0
+    
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+PDF 텍스트 추출 벤치마크 (기본 모드 vs 경량 모드)
+
+실행: python -m benchmarks.pdf_extraction
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.fixtures import build_graphics_heavy_pdf, build_text_pdf
+from services.pdf_service import PDFService
+
+def measure(pdf_path, lean, repeat=3):
+    """평균 추출 시간(ms)과 최대 메모리(KB)를 측정합니다."""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = PDFService.extract_text_from_pdf(pdf_path, lean=lean)
+        elapsed.append((time.perf_counter() - start) * 1000)
+    
+    tracemalloc.start()
+    PDFService.extract_text_from_pdf(pdf_path, lean=lean)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return sum(elapsed) / len(elapsed), peak / 1024, text
+
+def main():
+    fixtures = [
+        ('text-only 1p', build_text_pdf(pages=1)),
+        ('graphics 1p', build_graphics_heavy_pdf(pages=1)),
+        ('graphics 10p', build_graphics_heavy_pdf(pages=10)),
+        ('graphics 30p', build_graphics_heavy_pdf(pages=30)),
+    ]
+    
+    print(f"{'fixture':<16}{'full ms':>10}{'lean ms':>10}{'speedup':>9}{'full KB':>11}{'lean KB':>11}  same")
+    print("-" * 74)
+    for name, data in fixtures:
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+            temp_file.write(data)
+            pdf_path = temp_file.name
+        
+        try:
+            full_ms, full_kb, full_text = measure(pdf_path, lean=False)
+            lean_ms, lean_kb, lean_text = measure(pdf_path, lean=True)
+            print(f"{name:<16}{full_ms:>10.1f}{lean_ms:>10.1f}{full_ms / lean_ms:>8.2f}x"
+                  f"{full_kb:>11.0f}{lean_kb:>11.0f}  {full_text == lean_text}")
+        finally:
+            os.unlink(pdf_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+한글 TTF 폰트 등록/서브셋 임베딩 벤치마크
+
+- register: 폰트 파일을 읽어 등록하는 시간 (프로세스당 한 번)
+- per-request: 요청마다 폰트를 새로 등록하고 렌더링할 때의 요청당 시간
+- subset: 한 번 등록한 폰트로 렌더링한 요청당 시간과 PDF 크기 (사용한 글리프만 포함)
+- full: 서브셋 대신 폰트 파일 전체를 포함하여 실제로 렌더링한 PDF의 크기와 요청당 시간
+- text: 생성한 PDF에서 추출한 텍스트에 입력한 이름/회사/직무/설명이 그대로 있는지 (왕복 검사)
+
+reportlab은 사용한 글리프를 256개 단위의 서브셋으로 나누어 서브셋마다 폰트 프로그램을
+하나씩 포함합니다. full 열은 각 서브셋 폰트 프로그램을 전체 폰트 파일로 바꾸어 측정하므로
+(글리프 매핑은 맞지 않아 크기와 시간 측정에만 사용) subsets 열의 수만큼 폰트 파일이 들어갑니다.
+글꼴 파일은 PDF_KOREAN_FONT_PATH(없으면 reportlab 내장 Vera.ttf, 한글 글리프 없음)를 사용하며,
+한글 글꼴일 때 한글 데이터의 왕복 검사가 실패하면 AssertionError로 중단합니다.
+
+실행: python -m benchmarks.pdf_fonts
+"""
+import io
+import logging
+import os
+import time
+from contextlib import contextmanager
+import pdfplumber
+import reportlab
+from reportlab.pdfbase import pdfmetrics
+from benchmarks.fixtures import build_korean_resume_data, build_resume_data
+from config.settings import Config
+from services.pdf_fonts import has_hangul_glyphs, load_ttf_font
+from services.resume_template import ResumeTemplate
+
+def resolve_font_path():
+    if Config.PDF_KOREAN_FONT_PATH and os.path.exists(Config.PDF_KOREAN_FONT_PATH):
+        return Config.PDF_KOREAN_FONT_PATH
+    return os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'Vera.ttf')
+
+def count_subsets(font):
+    """렌더링마다 생성한 서브셋 폰트 프로그램 수를 세도록 font를 감쌉니다."""
+    records = []
+    make_subset = font.face.makeSubset
+    
+    def counting_make_subset(subset):
+        records.append(len(subset))
+        return make_subset(subset)
+    
+    font.face.makeSubset = counting_make_subset
+    return records
+
+@contextmanager
+def full_font_embedding(font, font_bytes):
+    """블록 안에서는 서브셋 폰트 프로그램 대신 폰트 파일 전체를 포함하도록 font를 바꿉니다."""
+    make_subset = font.face.makeSubset
+    font.face.makeSubset = lambda subset: font_bytes
+    try:
+        yield
+    finally:
+        font.face.makeSubset = make_subset
+
+def expected_texts(resume_data):
+    """생성한 PDF에 그대로 나타나야 하는 입력 문자열 (공백 제거, 줄바꿈 위치와 무관하게 비교)"""
+    texts = [resume_data['name'], resume_data['address']]
+    for experience in resume_data['experience']:
+        texts += [experience['company'], experience['position'], experience['description']]
+    return [''.join(text.split()) for text in texts]
+
+def roundtrip_ok(pdf_bytes, resume_data):
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        extracted = ''.join(''.join((page.extract_text() or '') for page in pdf.pages).split())
+    return all(text in extracted for text in expected_texts(resume_data))
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(repeat=30):
+    logging.disable(logging.INFO)
+    path = resolve_font_path()
+    with open(path, 'rb') as font_file:
+        font_bytes = font_file.read()
+    
+    start = time.perf_counter()
+    font = load_ttf_font('BenchFont', path)
+    pdfmetrics.registerFont(font)
+    register_ms = (time.perf_counter() - start) * 1000
+    
+    has_hangul = has_hangul_glyphs(font)
+    
+    print(f"font: {path} ({len(font_bytes)} bytes, {font.face.numGlyphs} glyphs), register {register_ms:.1f}ms")
+    print(
+        f"{'fixture':<16}{'subsets':>8}{'subset B':>10}{'full B':>10}{'subset ms':>11}{'full ms':>10}"
+        f"{'per-request ms':>16}{'text':>6}"
+    )
+    print("-" * 87)
+    
+    template = ResumeTemplate('BenchFont')
+    subsets = count_subsets(font)
+    fixtures = (
+        ('ko 3 exp', build_korean_resume_data(3), True),
+        ('ko 40 exp', build_korean_resume_data(40), True),
+        ('en 3 exp', build_resume_data(3), False)
+    )
+    for label, resume_data, korean in fixtures:
+        def render():
+            buffer = io.BytesIO()
+            template.render(resume_data, buffer)
+            return buffer.getvalue()
+        
+        def render_full():
+            with full_font_embedding(font, font_bytes):
+                return render()
+        
+        def render_with_registration():
+            request_font = load_ttf_font('BenchFontPerRequest', path)
+            pdfmetrics.registerFont(request_font)
+            ResumeTemplate('BenchFontPerRequest').render(resume_data, io.BytesIO())
+        
+        subsets.clear()
+        pdf_bytes = render()
+        subset_count = len(subsets)
+        subset_ms = measure(render, repeat)
+        
+        full_size = len(render_full())
+        full_ms = measure(render_full, repeat)
+        per_request_ms = measure(render_with_registration, max(1, repeat // 3))
+        
+        if korean and not has_hangul:
+            text_status = 'n/a'
+        else:
+            text_ok = roundtrip_ok(pdf_bytes, resume_data)
+            assert text_ok or not korean, f"{label}: 생성한 PDF에서 한글 텍스트를 그대로 추출할 수 없습니다."
+            text_status = 'ok' if text_ok else 'FAIL'
+        
+        print(
+            f"{label:<16}{subset_count:>8}{len(pdf_bytes):>10}{full_size:>10}{subset_ms:>11.1f}{full_ms:>10.1f}"
+            f"{per_request_ms:>16.1f}{text_status:>6}"
+        )
+
+if __name__ == "__main__":
+    main()
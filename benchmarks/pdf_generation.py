@@ -0,0 +1,72 @@
+"""
+이력서 PDF 생성 처리량 벤치마크 (PDFs/sec)
+
+uncached 열은 요청마다 스타일시트, 문단/표 스타일, 정적 플로어블을 새로 만드는
+이전 방식, template 열은 프로세스 전역 템플릿을 재사용하는 create_pdf_from_data의
+처리량입니다. 엔드포인트 열은 Flask 테스트 클라이언트로 요청 처리 전체를 측정합니다.
+(/api/pdf/text-to-pdf는 app.py에 등록되지 않은 swagger_routes 블루프린트를
+벤치마크용 앱에 등록하여 측정)
+
+/api/documents/는 Swagger 모델 검증(age, experience 숫자, education 문자열)을
+통과하도록 경력/학력 목록을 제외한 데이터를 보냅니다. 렌더링 처리량을 재기 위해
+생성된 PDF 캐시는 끄고 측정합니다. (캐시 효과는 benchmarks.pdf_cache)
+
+실행: python -m benchmarks.pdf_generation
+"""
+import io
+import logging
+import time
+from flask import Flask
+from benchmarks.fixtures import build_resume_data
+from config.settings import Config
+from services.pdf_service import PDFService
+from services.resume_template import ResumeTemplate
+
+def measure(func, duration=2.0):
+    """duration초 동안 func를 반복 실행하여 초당 처리량을 측정합니다."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def render_uncached(resume_data):
+    """요청마다 템플릿을 새로 만드는 이전 방식 (비교용)"""
+    ResumeTemplate().render(resume_data, io.BytesIO())
+
+def build_clients():
+    """(/api/documents/ 클라이언트, /api/pdf/text-to-pdf 클라이언트)"""
+    from app import create_app
+    from routes.swagger_routes import swagger_bp
+    
+    swagger_app = Flask(__name__)
+    swagger_app.register_blueprint(swagger_bp, url_prefix='/api')
+    return create_app().test_client(), swagger_app.test_client()
+
+def post_pdf(client, url, payload):
+    response = client.post(url, json=payload)
+    assert response.status_code == 200, response.get_data(as_text=True)[:200]
+
+def main():
+    logging.disable(logging.INFO)
+    Config.PDF_CACHE_ENABLED = False
+    documents_client, swagger_client = build_clients()
+    
+    print(f"{'fixture':<16}{'bytes':>8}{'uncached':>10}{'template':>10}{'/api/documents/':>17}{'text-to-pdf':>13}")
+    print("-" * 74)
+    for experiences in (3, 40):
+        resume_data = build_resume_data(experiences)
+        documents_data = {key: value for key, value in resume_data.items() if key not in ('experience', 'education')}
+        documents_data.update({'age': 30, 'experience': 0})
+        size = len(PDFService.create_pdf_from_data(resume_data))
+        
+        uncached = measure(lambda: render_uncached(resume_data))
+        template = measure(lambda: PDFService.create_pdf_from_data(resume_data))
+        documents = measure(lambda: post_pdf(documents_client, '/api/documents/', documents_data))
+        text_to_pdf = measure(lambda: post_pdf(swagger_client, '/api/pdf/text-to-pdf', resume_data))
+        
+        print(f"{f'{experiences} experiences':<16}{size:>8}{uncached:>10.1f}{template:>10.1f}{documents:>17.1f}{text_to_pdf:>13.1f}")
+
+if __name__ == "__main__":
+    main()
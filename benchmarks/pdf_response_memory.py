@@ -0,0 +1,96 @@
+"""
+이력서 PDF 응답의 요청당 최대 메모리 벤치마크
+
+경력 항목 수를 늘려 여러 페이지의 이력서를 만들고, tracemalloc으로 최대 할당량을 측정합니다.
+응답 본문은 테스트 클라이언트에서 조각 단위로 읽고 버립니다.
+
+- legacy: BytesIO에 렌더링 → getvalue() → BytesIO로 다시 감싸 send_file로 보내던 이전 방식
+- streamed: PDFOutput을 복사 없이 응답 본문으로 넘기는 현재 방식 (pdf_download_response)
+- request 열: 렌더링부터 전송까지 요청 전체의 최대 할당량 (레이아웃 객체 포함)
+- response 열: 렌더링이 끝난 뒤 응답을 만들고 전송하는 구간의 최대 할당량 (PDF 복사본)
+
+실행: python -m benchmarks.pdf_response_memory
+"""
+import gc
+import io
+import logging
+import tracemalloc
+from flask import Flask, request, send_file
+from benchmarks.fixtures import build_resume_data
+from routes.pdf_routes import pdf_download_response
+from services.pdf_service import PDFService
+from services.resume_template import get_resume_template
+
+def legacy_response(buffer):
+    pdf_content = buffer.getvalue()
+    return send_file(io.BytesIO(pdf_content), mimetype='application/pdf',
+                     as_attachment=True, download_name='resume.pdf')
+
+def render_legacy(resume_data):
+    buffer = io.BytesIO()
+    get_resume_template().render(resume_data, buffer)
+    return buffer
+
+def build_client():
+    app = Flask(__name__)
+    # 응답 구간만 측정할 때 미리 렌더링해 둔 결과
+    prerendered = {}
+    
+    @app.route('/legacy', methods=['POST'])
+    def legacy():
+        return legacy_response(render_legacy(request.get_json()))
+    
+    @app.route('/streamed', methods=['POST'])
+    def streamed():
+        return pdf_download_response(PDFService.render_pdf(request.get_json()))
+    
+    @app.route('/legacy/response', methods=['POST'])
+    def legacy_prerendered():
+        return legacy_response(prerendered.pop('legacy'))
+    
+    @app.route('/streamed/response', methods=['POST'])
+    def streamed_prerendered():
+        return pdf_download_response(prerendered.pop('streamed'))
+    
+    return app.test_client(), prerendered
+
+def peak_request_bytes(client, url, payload):
+    """요청 한 번의 최대 할당량(바이트)과 받은 PDF 크기"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        response = client.post(url, json=payload, buffered=False)
+        received = 0
+        for chunk in response.response:
+            received += len(chunk)
+        response.close()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, received
+
+def main():
+    logging.disable(logging.INFO)
+    client, prerendered = build_client()
+    # 템플릿 생성 비용이 측정에 섞이지 않도록 미리 생성
+    get_resume_template()
+    
+    print(f"{'experiences':>12}{'PDF (KB)':>10}{'request (MB)':>26}{'response (KB)':>26}")
+    print(f"{'':>22}{'legacy':>13}{'streamed':>13}{'legacy':>13}{'streamed':>13}")
+    print("-" * 74)
+    for experiences in (100, 500, 2000):
+        payload = build_resume_data(experiences)
+        legacy, size = peak_request_bytes(client, '/legacy', payload)
+        streamed, streamed_size = peak_request_bytes(client, '/streamed', payload)
+        assert size == streamed_size
+        
+        prerendered['legacy'] = render_legacy(payload)
+        legacy_response_peak, _ = peak_request_bytes(client, '/legacy/response', {})
+        prerendered['streamed'] = PDFService.render_pdf(payload)
+        streamed_response_peak, _ = peak_request_bytes(client, '/streamed/response', {})
+        
+        print(f"{experiences:>12}{size / 1024:>10.0f}{legacy / 2**20:>13.1f}{streamed / 2**20:>13.1f}"
+              f"{legacy_response_peak / 1024:>13.0f}{streamed_response_peak / 1024:>13.0f}")
+
+if __name__ == "__main__":
+    main()
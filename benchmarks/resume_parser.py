@@ -0,0 +1,43 @@
+"""
+이력서 파싱 처리량 벤치마크 (resumes/sec)
+
+re 모듈 캐시가 다른 코드의 패턴으로 밀려나는 상황은 매 반복마다
+re.purge()를 호출하여 재현합니다 (purged 열). 파싱 결과 캐시는 cached 열을
+제외하고 매 반복마다 비웁니다.
+
+실행: python -m benchmarks.resume_parser
+"""
+import re
+import time
+from benchmarks.fixtures import build_resume_text
+from services import resume_parser_service
+from services.resume_parser_service import ResumeParserService
+
+def measure(text, duration=2.0, purge=False, cached=False):
+    """duration초 동안 parse_resume을 반복 실행하여 초당 처리량을 측정합니다."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        if purge:
+            re.purge()
+        if not cached:
+            resume_parser_service._parse_cache.clear()
+        ResumeParserService.parse_resume(text)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def main():
+    fixtures = [
+        ('1x resume', build_resume_text(1)),
+        ('5x resume', build_resume_text(5)),
+        ('20x resume', build_resume_text(20)),
+    ]
+    
+    print(f"{'fixture':<14}{'chars':>8}{'resumes/sec':>14}{'purged':>10}{'cached':>12}")
+    print("-" * 58)
+    for name, text in fixtures:
+        print(f"{name:<14}{len(text):>8}{measure(text):>14.1f}{measure(text, purge=True):>10.1f}"
+              f"{measure(text, cached=True):>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+기술 사전 매처 벤치마크
+
+기본 사전에 합성 기술 항목을 추가하여 사전 크기를 늘려가며, Aho-Corasick
+매처의 컴파일 시간과 이력서 스캔 시간을 별칭별 정규식 검색(naive 열)과 비교합니다.
+
+실행: python -m benchmarks.skill_matcher
+"""
+import json
+import re
+import time
+from benchmarks.fixtures import build_resume_text
+from config.settings import Config
+from services.skill_matcher import SkillMatcher
+
+def build_spec(extra_skills):
+    """기본 사전에 합성 기술 extra_skills개를 추가한 사전을 만듭니다."""
+    with open(Config.SKILL_DICTIONARY_PATH, encoding='utf-8') as spec_file:
+        spec = json.load(spec_file)
+    spec['skills'] += [
+        {'id': f'synthetic_{i}', 'name': f'Tech{i}', 'aliases': [f'테크{i}', f'T{i}Lib']}
+        for i in range(extra_skills)
+    ]
+    return spec
+
+def naive_find(patterns, text):
+    """별칭마다 정규식으로 전체 텍스트를 검색 (비교용)"""
+    return [match.span() for pattern in patterns for match in pattern.finditer(text)]
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+def main():
+    text = build_resume_text(20)
+    print(f"resume text: {len(text)} chars")
+    print(f"{'aliases':>9}{'compile (ms)':>14}{'scan (ms)':>11}{'naive (ms)':>12}{'matches':>9}")
+    print("-" * 55)
+    for extra_skills in (0, 1000, 5000):
+        spec = build_spec(extra_skills)
+        compile_ms, matcher = timed(SkillMatcher, spec)
+        scan_ms, matches = timed(matcher.find, text)
+        
+        aliases = [alias for skill in spec['skills']
+                   for alias in [skill['name']] + skill.get('aliases', []) + skill.get('case_sensitive_aliases', [])]
+        patterns = [re.compile(r'(?<![A-Za-z0-9])' + re.escape(alias) + r'(?![A-Za-z0-9])', re.IGNORECASE)
+                    for alias in aliases]
+        naive_ms, _ = timed(naive_find, patterns, text)
+        
+        print(f"{len(aliases):>9}{compile_ms:>14.1f}{scan_ms:>11.2f}{naive_ms:>12.2f}{len(matches):>9}")
+
+if __name__ == "__main__":
+    main()
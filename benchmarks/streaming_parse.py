@@ -0,0 +1,43 @@
+"""
+페이지 단위 스트리밍 파싱(조기 종료) 벤치마크
+
+첫 페이지가 이력서이고 나머지가 포트폴리오인 긴 PDF에서, 전체 텍스트 추출 후
+파싱하는 방식(full 열)과 요청한 필드가 채워지면 추출을 멈추는 방식(early stop 열)의
+처리 시간을 비교합니다.
+
+실행: python -m benchmarks.streaming_parse
+"""
+import time
+from benchmarks.fixtures import build_portfolio_pdf
+from services import resume_parser_service
+from services.pdf_service import PDFService
+from services.resume_parser_service import ResumeParserService
+
+FIELD_SETS = [
+    ('contact', 'phone,email'),
+    ('contact+skills', 'phone,email,links,skills,experiences'),
+    ('all fields', None),
+]
+
+def timed(func, *args):
+    resume_parser_service._parse_cache.clear()
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+def full_parse(pdf_bytes, fields):
+    text = PDFService.extract_text_from_bytes(pdf_bytes)
+    return ResumeParserService.parse_resume(text, fields)
+
+def main():
+    print(f"{'pages':>6}  {'fields':<16}{'full (ms)':>11}{'early stop (ms)':>17}{'pages read':>12}")
+    print("-" * 64)
+    for pages in (5, 20, 60):
+        pdf_bytes = build_portfolio_pdf(pages)
+        for name, fields in FIELD_SETS:
+            full_ms, _ = timed(full_parse, pdf_bytes, fields)
+            early_ms, result = timed(PDFService.parse_resume_streaming_from_bytes, pdf_bytes, fields)
+            print(f"{pages:>6}  {name:<16}{full_ms:>11.1f}{early_ms:>17.1f}{result.pages_read:>12}")
+
+if __name__ == "__main__":
+    main()
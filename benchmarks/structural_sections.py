@@ -0,0 +1,45 @@
+"""
+글꼴 정보 기반 섹션 분할 벤치마크
+
+경력 설명에 섹션 키워드로 시작하는 본문 줄이 있는 이력서(build_styled_resume_pdf)로
+키워드 탐지(parse_resume_timed)와 헤더 줄 탐지(parse_resume_lines_timed)를 비교합니다.
+
+- extract: 텍스트만 추출 / 텍스트와 줄별 글꼴 정보를 함께 추출한 시간
+- sections: 섹션 인덱스 생성 시간 (전체 텍스트 키워드 스캔 / 헤더 후보 줄만 확인)
+- experiences: 파싱된 경력 수 (정답: 입력 경력 수)
+
+실행: python -m benchmarks.structural_sections
+"""
+import io
+import time
+from benchmarks.fixtures import build_styled_resume_pdf
+from services.pdf_service import PDFService
+from services.resume_parser_service import ResumeParserService
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    print(f"{'entries':>8}{'text ms':>10}{'lines ms':>10}{'keyword ms':>12}{'struct ms':>11}{'keyword exp':>13}{'struct exp':>12}")
+    print("-" * 76)
+    for entries in (5, 50, 200):
+        pdf_bytes = build_styled_resume_pdf(entries)
+        text, text_ms = timed(PDFService._extract_text, io.BytesIO(pdf_bytes))
+        extraction, lines_ms = timed(PDFService._extract_lines, io.BytesIO(pdf_bytes))
+        
+        cleaned_text = ResumeParserService._preprocess_text(text)
+        _, keyword_ms = timed(ResumeParserService._build_section_index, cleaned_text)
+        cleaned_lines, line_spans = ResumeParserService._preprocess_lines(extraction.lines)
+        _, struct_ms = timed(ResumeParserService._build_line_section_index, cleaned_lines, line_spans)
+        
+        keyword = ResumeParserService.parse_resume_timed(text, 'experiences')
+        struct = ResumeParserService.parse_resume_lines_timed(extraction.lines, 'experiences')
+        print(
+            f"{entries:>8}{text_ms:>10.1f}{lines_ms:>10.1f}{keyword_ms:>12.3f}{struct_ms:>11.3f}"
+            f"{len(keyword.data['experiences']):>13}{len(struct.data['experiences']):>12}"
+        )
+
+if __name__ == "__main__":
+    main()
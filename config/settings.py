@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 class Config:
     """애플리케이션 설정 클래스"""
@@ -6,7 +7,7 @@ class Config:
     # 기본 설정
     UPLOAD_FOLDER = 'uploads'
     ALLOWED_EXTENSIONS = {'pdf'}
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB 최대 파일 크기
+    MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB 최대 요청 크기
     
     # Flask 설정
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
@@ -17,8 +18,95 @@ class Config:
     PORT = int(os.environ.get('PORT', 5002))
     
     # PDF 설정
-    PDF_FONT_NAME = 'Helvetica'  # 기본 폰트
+    PDF_FONT_NAME = 'Helvetica'  # 한글 폰트가 없을 때 사용하는 기본 폰트
+    # 한글 TTF 폰트 (프로세스당 한 번 등록, 문서에는 사용한 글리프만 서브셋으로 포함)
+    PDF_KOREAN_FONT_NAME = os.environ.get('PDF_KOREAN_FONT_NAME', 'NanumGothic')
+    PDF_KOREAN_FONT_PATH = os.environ.get('PDF_KOREAN_FONT_PATH', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf')
+    PDF_KOREAN_FONT_BOLD_PATH = os.environ.get('PDF_KOREAN_FONT_BOLD_PATH', '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf')
+    # TTF 폰트에 한글 글리프가 없을 때 사용하는 reportlab 내장 한글 CID 폰트 (문서에 포함되지 않고 뷰어 글꼴 사용)
+    PDF_KOREAN_CID_FONT_NAME = os.environ.get('PDF_KOREAN_CID_FONT_NAME', 'HYGothic-Medium')
     PDF_PAGE_SIZE = 'A4'
+    # 요청에서 compact를 지정하지 않았을 때 크기를 줄인 PDF로 생성할지 여부
+    PDF_COMPACT_DEFAULT = os.environ.get('PDF_COMPACT_DEFAULT', 'False').lower() == 'true'
+    
+    # 생성된 PDF 캐시 설정 (메모리 LRU + 디스크 LRU, 디스크 용량이 0이면 메모리만 사용)
+    PDF_CACHE_ENABLED = os.environ.get('PDF_CACHE_ENABLED', 'True').lower() == 'true'
+    PDF_CACHE_MEMORY_ITEMS = int(os.environ.get('PDF_CACHE_MEMORY_ITEMS', 128))
+    PDF_CACHE_DIR = os.environ.get('PDF_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'careerai_pdf_cache'))
+    PDF_CACHE_DISK_MAX_MB = int(os.environ.get('PDF_CACHE_DISK_MAX_MB', 256))
+    
+    # PDF 일괄 생성 설정 (렌더러 프로세스 풀)
+    PDF_RENDER_PROCESSES = int(os.environ.get('PDF_RENDER_PROCESSES', os.cpu_count() or 2))
+    BULK_PDF_MAX_DOCUMENTS = int(os.environ.get('BULK_PDF_MAX_DOCUMENTS', 1000))  # 요청당 최대 이력서 수
+    
+    # PDF 텍스트 추출 설정
+    PDF_LEAN_EXTRACTION = os.environ.get('PDF_LEAN_EXTRACTION', 'True').lower() == 'true'  # 텍스트 전용 경량 추출
+    PDF_PREFLIGHT_ENABLED = os.environ.get('PDF_PREFLIGHT_ENABLED', 'True').lower() == 'true'  # 업로드 사전 검사
+    PDF_PREFLIGHT_TEXT_PAGES = int(os.environ.get('PDF_PREFLIGHT_TEXT_PAGES', 3))  # 텍스트 레이어 확인 페이지 수
+    
+    # PDF 추출 워커 프로세스 설정
+    PDF_WORKER_POOL_ENABLED = os.environ.get('PDF_WORKER_POOL_ENABLED', 'False').lower() == 'true'
+    PDF_WORKER_PROCESSES = int(os.environ.get('PDF_WORKER_PROCESSES', 2))
+    PDF_WORKER_TIMEOUT = float(os.environ.get('PDF_WORKER_TIMEOUT', 30))  # 작업당 제한 시간 (초)
+    PDF_WORKER_MAX_RSS_MB = int(os.environ.get('PDF_WORKER_MAX_RSS_MB', 512))  # 워커 메모리 상한 (MB)
+    PDF_WORKER_MAX_TASKS = int(os.environ.get('PDF_WORKER_MAX_TASKS', 50))  # 워커 교체 주기 (작업 수)
+    PDF_WORKER_START_TIMEOUT = float(os.environ.get('PDF_WORKER_START_TIMEOUT', 60))  # 워커 시작 제한 시간 (초)
+    
+    # 작업 종류별 실행 자원 분리 (벌크헤드)
+    # 켜져 있으면 단건 PDF 렌더링은 렌더러 프로세스 풀(PDF_RENDER_PROCESSES)에서,
+    # PDF 추출/파싱은 PDF 워커 프로세스 풀(PDF_WORKER_PROCESSES)에서 (PDF_WORKER_POOL_ENABLED와 무관),
+    # 기업 확률 예측은 별도 스레드 풀(PREDICTION_POOL_THREADS)에서 실행
+    BULKHEAD_ENABLED = os.environ.get('BULKHEAD_ENABLED', 'False').lower() == 'true'
+    PREDICTION_POOL_THREADS = int(os.environ.get('PREDICTION_POOL_THREADS', 4))  # 예측 스레드 수
+    
+    # 이력서 파싱 패턴 데이터 파일
+    RESUME_PATTERNS_PATH = os.environ.get(
+        'RESUME_PATTERNS_PATH',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_patterns.json')
+    )
+    
+    # 이력서 파싱 결과 캐시 크기 (0이면 비활성화)
+    RESUME_PARSE_CACHE_SIZE = int(os.environ.get('RESUME_PARSE_CACHE_SIZE', 256))
+    # 페이지 단위 스트리밍 파싱 기본값 (요청한 필드가 채워지면 남은 페이지를 읽지 않음)
+    RESUME_EARLY_STOP = os.environ.get('RESUME_EARLY_STOP', 'False').lower() == 'true'
+    # 글꼴 정보(크기, 굵기)로 섹션 헤더 줄을 찾아 섹션을 나눔 (헤더 줄이 없으면 키워드 탐지로 대체)
+    RESUME_STRUCTURAL_SECTIONS = os.environ.get('RESUME_STRUCTURAL_SECTIONS', 'True').lower() == 'true'
+    RESUME_HEADER_SIZE_RATIO = float(os.environ.get('RESUME_HEADER_SIZE_RATIO', 1.15))  # 본문 글꼴 대비 헤더 글꼴 크기 비율
+    
+    # 작업 종류별 동시 실행 수/대기열 제한 (동시 실행 수가 0이면 제한하지 않음)
+    # 대기열이 가득 차면 바로 429와 Retry-After를 반환하고, 대기 시간이 초과되어도 429를 반환
+    ADMISSION_CONTROL_ENABLED = os.environ.get('ADMISSION_CONTROL_ENABLED', 'True').lower() == 'true'
+    ADMISSION_PDF_EXTRACTION_LIMIT = int(os.environ.get('ADMISSION_PDF_EXTRACTION_LIMIT', 4))  # PDF 텍스트 추출/파싱
+    ADMISSION_PDF_EXTRACTION_QUEUE = int(os.environ.get('ADMISSION_PDF_EXTRACTION_QUEUE', 8))
+    ADMISSION_PDF_GENERATION_LIMIT = int(os.environ.get('ADMISSION_PDF_GENERATION_LIMIT', 4))  # PDF 생성
+    ADMISSION_PDF_GENERATION_QUEUE = int(os.environ.get('ADMISSION_PDF_GENERATION_QUEUE', 16))
+    ADMISSION_PREDICTION_LIMIT = int(os.environ.get('ADMISSION_PREDICTION_LIMIT', 16))  # 기업 확률 예측
+    ADMISSION_PREDICTION_QUEUE = int(os.environ.get('ADMISSION_PREDICTION_QUEUE', 64))
+    ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 10))  # 대기열 최대 대기 시간 (초)
+    
+    # 이력서 → 모델 입력 특성 도출 기준
+    RESUME_AWARD_POINTS = float(os.environ.get('RESUME_AWARD_POINTS', 3))  # 수상 1건당 수상경험점수
+    RESUME_ACTIVITY_POINTS = float(os.environ.get('RESUME_ACTIVITY_POINTS', 4))  # 프로젝트 1건당 대외활동점수
+    
+    # 기술 사전 데이터 파일 (정규 ID, 표준 이름, 별칭)
+    SKILL_DICTIONARY_PATH = os.environ.get(
+        'SKILL_DICTIONARY_PATH',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills.json')
+    )
+    
+    # 학교/전공 라벨 테이블 데이터 파일 (라벨값, 표준 이름, 별칭)
+    LABEL_TABLE_PATH = os.environ.get(
+        'LABEL_TABLE_PATH',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'labels.json')
+    )
+    LABEL_MATCH_THRESHOLD = float(os.environ.get('LABEL_MATCH_THRESHOLD', 0.6))  # 유사 일치 최소 유사도 (Dice 계수)
+    LABEL_BATCH_MAX_ITEMS = int(os.environ.get('LABEL_BATCH_MAX_ITEMS', 1000))  # 일괄 조회 요청당 최대 항목 수
+    
+    # 배치 업로드 설정
+    BATCH_MAX_FILES = int(os.environ.get('BATCH_MAX_FILES', 500))  # 배치당 최대 파일 수
+    BATCH_DEFAULT_CONCURRENCY = int(os.environ.get('BATCH_DEFAULT_CONCURRENCY', 4))  # 기본 동시 처리 수
+    BATCH_MAX_CONCURRENCY = int(os.environ.get('BATCH_MAX_CONCURRENCY', 8))  # 배치당 최대 동시 처리 수
+    BATCH_MAX_UNZIPPED_SIZE = int(os.environ.get('BATCH_MAX_UNZIPPED_SIZE', 512 * 1024 * 1024))  # ZIP 압축 해제 최대 크기
     
     @staticmethod
     def init_app(app):
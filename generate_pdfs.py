@@ -0,0 +1,57 @@
+"""
+이력서 PDF 일괄 생성 CLI
+
+이력서 데이터 목록(JSON 배열, {"resumes": [...]} 또는 한 줄에 하나씩인 JSON Lines)을 읽어
+렌더러 프로세스 풀에서 PDF로 생성하고 ZIP 파일로 저장합니다. (/api/documents/generate/batch와 같은 형식)
+
+실행: python generate_pdfs.py resumes.json -o resumes.zip [--processes 4] [--compact]
+"""
+import argparse
+import json
+import sys
+import time
+from config.settings import Config
+from services.batch_service import BatchInputError
+from services.bulk_pdf_service import BulkPDFService
+from services.pdf_render_pool import PDFRenderPool
+
+def load_payload(path):
+    """JSON 또는 JSON Lines 파일을 읽습니다. ('-'이면 표준 입력)"""
+    with (sys.stdin if path == '-' else open(path, encoding='utf-8')) as input_file:
+        text = input_file.read()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='이력서 PDF 일괄 생성 (ZIP)')
+    parser.add_argument('input', help="이력서 데이터 파일 (JSON 또는 JSON Lines, '-'이면 표준 입력)")
+    parser.add_argument('-o', '--output', default='resumes.zip', help='저장할 ZIP 파일 경로 (기본값: resumes.zip)')
+    parser.add_argument('--processes', type=int, default=Config.PDF_RENDER_PROCESSES,
+                        help=f'렌더러 프로세스 수 (기본값: {Config.PDF_RENDER_PROCESSES})')
+    parser.add_argument('--compact', action='store_true', default=Config.PDF_COMPACT_DEFAULT,
+                        help='크기를 줄인 PDF로 생성 (최대 압축, 공유 리소스, 메타데이터 제거)')
+    args = parser.parse_args(argv)
+    
+    try:
+        documents = BulkPDFService.load_documents(load_payload(args.input))
+    except (OSError, ValueError, BatchInputError) as e:
+        print(f"입력 파일 오류: {str(e)}", file=sys.stderr)
+        return 1
+    
+    start = time.perf_counter()
+    pool = PDFRenderPool(args.processes)
+    try:
+        with open(args.output, 'wb') as output_file:
+            for chunk in BulkPDFService.stream_zip(documents, pool, compact=args.compact):
+                output_file.write(chunk)
+    finally:
+        pool.shutdown()
+    
+    elapsed = time.perf_counter() - start
+    print(f"{len(documents)}개 이력서 → {args.output} ({elapsed:.1f}초, {len(documents) / elapsed:.1f} PDFs/sec)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
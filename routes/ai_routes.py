@@ -1,7 +1,18 @@
 from flask import request
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from services.ai_model_service import AIModelService
+from services.resume_pipeline_service import (
+    ResumePipelineService, ResumeTextNotFound, ResumeFeatureError, MODEL_FEATURES
+)
+from services.label_resolver import LABELS
+from services.pdf_worker_pool import PDFExtractionTimeout, PDFExtractionMemoryExceeded
+from services.prediction_pool import run_prediction
+from routes.pdf_routes import admission_controlled, preflight_error_response, pdf_worker_error_response
+from utils.file_utils import allowed_file
+from config.settings import Config
+import io
 import logging
+import time
 import uuid
 from datetime import datetime
 
@@ -40,12 +51,194 @@ analysis_response_model = api.model('AnalysisResponse', {
     'message': fields.String(description='응답 메시지')
 })
 
+resume_analysis_response_model = api.model('ResumeAnalysisResponse', {
+    'user_id': fields.String(description='사용자 ID'),
+    'recruitment_id': fields.String(description='채용공고 ID'),
+    'job_category': fields.String(description='직무 카테고리'),
+    'prediction_id': fields.String(description='예측 ID'),
+    'prediction_time': fields.String(description='예측 시간'),
+    'parsed_data': fields.Raw(description='파싱된 이력서 데이터'),
+    'features': fields.Raw(description='모델 입력 특성 8개'),
+    'feature_sources': fields.Raw(description='특성별 출처 (request: 요청 값, resume: 이력서에서 도출)'),
+    'probabilities': fields.Raw(description='기업별 확률 (퍼센트)'),
+    'top_company': fields.String(description='가장 높은 확률의 기업'),
+    'top_probability': fields.Float(description='가장 높은 확률'),
+    'timings_ms': fields.Raw(description='단계별 소요 시간 (ms)'),
+    'parse_timings_ms': fields.Raw(description='파싱 세부 단계별 소요 시간 (ms)'),
+    'parse_cached': fields.Boolean(description='파싱 결과 캐시 적중 여부'),
+    'message': fields.String(description='응답 메시지')
+})
+
+label_resolve_request_model = api.model('LabelResolveRequest', {
+    'school': fields.List(fields.String, description='학교명 목록'),
+    'major': fields.List(fields.String, description='전공명 목록'),
+    'threshold': fields.Float(description='유사 일치 최소 유사도 (기본값: 설정값)')
+})
+
+label_match_model = api.model('LabelMatch', {
+    'query': fields.String(description='요청한 이름'),
+    'label': fields.Float(description='라벨값 (찾지 못하면 null)'),
+    'name': fields.String(description='표준 이름'),
+    'matched': fields.String(description='일치한 이름/별칭'),
+    'score': fields.Float(description='유사도 (정확 일치 1.0)'),
+    'exact': fields.Boolean(description='정확 일치 여부')
+})
+
 error_model = api.model('Error', {
     'error': fields.String(description='오류 메시지'),
     'code': fields.String(description='오류 코드'),
     'details': fields.String(description='상세 정보')
 })
 
+# 이력서 분석 요청 (Swagger 문서화용, 특성 값은 이력서에서 도출한 값보다 우선)
+resume_analysis_parser = reqparse.RequestParser()
+resume_analysis_parser.add_argument('file', location='files', type='FileStorage', required=True, help='PDF 이력서 파일')
+resume_analysis_parser.add_argument('user_id', location='form', type=str, help='사용자 ID')
+resume_analysis_parser.add_argument('recruitment_id', location='form', type=str, help='채용공고 ID')
+resume_analysis_parser.add_argument('job_category', location='form', type=str, help='직무 카테고리')
+resume_analysis_parser.add_argument('age', location='form', type=float, required=True, help='나이')
+resume_analysis_parser.add_argument('school', location='form', type=str, required=True, help='학교 라벨값 또는 학교명')
+resume_analysis_parser.add_argument('major', location='form', type=str, required=True, help='전공 라벨값 또는 전공명')
+resume_analysis_parser.add_argument('gpa', location='form', type=float, required=True, help='학점')
+resume_analysis_parser.add_argument('language_score', location='form', type=float, help='어학점수 라벨값 (없으면 어학 수준에서 도출)')
+resume_analysis_parser.add_argument('activity_score', location='form', type=float, help='대외활동점수 (없으면 프로젝트 수에서 도출)')
+resume_analysis_parser.add_argument('internship_score', location='form', type=float, help='인턴경험점수 (없으면 경력 기간에서 도출)')
+resume_analysis_parser.add_argument('award_score', location='form', type=float, help='수상경험점수 (없으면 수상 수에서 도출)')
+resume_analysis_parser.add_argument('include_raw_text', location='form', type=str, help='true이면 추출된 원문 텍스트 포함')
+
+def analyze_resume_upload():
+    """
+    업로드된 이력서 PDF로 기업 확률을 분석하는 공통 함수
+    
+    파일은 메모리에서 한 번만 읽고, 사전 검사 → 텍스트 추출 → 파싱 → 특성 도출 →
+    예측을 같은 데이터로 이어서 실행합니다.
+    
+    Returns:
+        분석 응답 또는 (오류 응답, 상태 코드)
+    """
+    total_start = time.perf_counter()
+    
+    if 'multipart/form-data' not in request.headers.get('Content-Type', ''):
+        return {
+            'error': 'Content-Type이 multipart/form-data여야 합니다.',
+            'code': 'INVALID_CONTENT_TYPE',
+            'details': 'PDF 파일을 업로드해주세요.'
+        }, 400
+    
+    file = request.files.get('file')
+    if not file or file.filename == '':
+        return {
+            'error': '파일이 없습니다.',
+            'code': 'MISSING_FILE',
+            'details': 'PDF 파일을 선택해주세요.'
+        }, 400
+    
+    if not allowed_file(file.filename):
+        return {
+            'error': 'PDF 파일만 업로드 가능합니다.',
+            'code': 'INVALID_FILE_TYPE',
+            'details': 'PDF 형식의 파일만 지원합니다.'
+        }, 400
+    
+    # 요청에서 지정한 특성 값 (폼 필드)
+    overrides = {}
+    for feature in MODEL_FEATURES:
+        value = request.form.get(feature)
+        if value is None or value.strip() == '':
+            continue
+        try:
+            overrides[feature] = float(value)
+        except ValueError:
+            # 학교/전공은 이름으로도 받아 라벨값으로 변환
+            if feature in LABELS.kinds:
+                match = LABELS.resolve(feature, value)
+                if match is not None:
+                    overrides[feature] = match.label
+                    continue
+                return {
+                    'error': '라벨값을 찾을 수 없습니다.',
+                    'code': 'UNRESOLVED_LABEL',
+                    'details': f'{feature}: {value}'
+                }, 400
+            return {
+                'error': '특성 값은 숫자여야 합니다.',
+                'code': 'INVALID_FEATURE',
+                'details': f'{feature}: {value}'
+            }, 400
+    
+    try:
+        # AI 모델이 로드되지 않았다면 로드 시도
+        if not ai_service.model_loaded:
+            if not ai_service.load_model():
+                return {
+                    'error': 'AI 모델을 로드할 수 없습니다.',
+                    'code': 'MODEL_LOAD_FAILED',
+                    'details': '모델 파일을 확인해주세요.'
+                }, 500
+        
+        pdf_bytes = file.read()
+        
+        preflight_start = time.perf_counter()
+        preflight_error = preflight_error_response(io.BytesIO(pdf_bytes))
+        if preflight_error:
+            return preflight_error
+        preflight_ms = round((time.perf_counter() - preflight_start) * 1000, 3)
+        
+        result = ResumePipelineService.run(pdf_bytes, overrides, ai_service)
+        
+    except ResumeTextNotFound as e:
+        return {
+            'error': 'PDF에서 텍스트를 추출할 수 없습니다.',
+            'code': 'NO_TEXT_EXTRACTED',
+            'details': str(e)
+        }, 400
+        
+    except ResumeFeatureError as e:
+        return {
+            'error': '모델 입력 특성을 만들 수 없습니다.',
+            'code': 'INVALID_FEATURES',
+            'details': str(e)
+        }, 400
+        
+    except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+        return pdf_worker_error_response(e)
+        
+    except Exception as e:
+        logger.error(f"이력서 분석 오류: {str(e)}")
+        return {
+            'error': '이력서 분석 중 오류가 발생했습니다.',
+            'code': 'RESUME_ANALYSIS_ERROR',
+            'details': str(e)
+        }, 500
+    
+    top_company = max(result.probabilities.items(), key=lambda x: x[1])
+    timings = {'preflight': preflight_ms, **result.timings_ms}
+    timings['total'] = round((time.perf_counter() - total_start) * 1000, 3)
+    
+    response_data = {
+        'user_id': request.form.get('user_id'),
+        'recruitment_id': request.form.get('recruitment_id'),
+        'job_category': request.form.get('job_category'),
+        'prediction_id': str(uuid.uuid4()),
+        'prediction_time': datetime.now().isoformat(),
+        'parsed_data': result.parse.data,
+        'features': result.features,
+        'feature_sources': result.feature_sources,
+        'probabilities': result.probabilities,
+        'top_company': top_company[0],
+        'top_probability': float(top_company[1]),
+        'timings_ms': timings,
+        'parse_timings_ms': result.parse.timings_ms,
+        'parse_cached': result.parse.cached,
+        'message': '분석이 완료되었습니다.'
+    }
+    
+    if (request.form.get('include_raw_text') or '').lower() == 'true':
+        response_data['raw_text'] = result.text
+    
+    logger.info(f"이력서 분석 완료: top_company={top_company[0]}, timings_ms={timings}")
+    return response_data
+
 @api.route('/analyze-probability')
 class AnalyzeProbabilityResource(Resource):
     """기업 확률 분석 엔드포인트"""
@@ -55,6 +248,8 @@ class AnalyzeProbabilityResource(Resource):
     @api.response(200, '분석 성공', analysis_response_model)
     @api.response(400, '잘못된 요청', error_model)
     @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('prediction')
     def post(self):
         """
         사용자 데이터를 기반으로 기업별 확률을 분석합니다.
@@ -105,8 +300,8 @@ class AnalyzeProbabilityResource(Resource):
                         'details': '모델 파일을 확인해주세요.'
                     }, 500
             
-            # 예측 수행
-            probabilities = ai_service.predict_company_probabilities(request_data)
+            # 예측 수행 (BULKHEAD_ENABLED이면 예측 스레드 풀에서 실행)
+            probabilities = run_prediction(ai_service.predict_company_probabilities, request_data)
             
             # 가장 높은 확률의 기업 찾기
             top_company = max(probabilities.items(), key=lambda x: x[1])
@@ -138,6 +333,106 @@ class AnalyzeProbabilityResource(Resource):
                 'details': str(e)
             }, 500
 
+@api.route('/analyze-resume')
+class AnalyzeResumeResource(Resource):
+    """이력서 PDF 기업 확률 분석 엔드포인트"""
+    
+    @api.doc('이력서 PDF 기업 확률 분석')
+    @api.expect(resume_analysis_parser)
+    @api.response(200, '분석 성공', resume_analysis_response_model)
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_extraction')
+    def post(self):
+        """
+        이력서 PDF 하나로 파싱과 기업 확률 분석을 한 번에 수행합니다.
+        
+        요청: multipart/form-data
+        - file: PDF 이력서 파일
+        - age, school, major, gpa: 나이, 학교 라벨값 또는 학교명, 전공 라벨값 또는 전공명, 학점 (필수)
+        - language_score, activity_score, internship_score, award_score: 지정하면 이력서에서 도출한 값 대신 사용
+          (미지정 시 어학 수준, 프로젝트 수, 경력 기간(개월), 수상 수에서 도출)
+        - user_id, recruitment_id, job_category: 응답에 그대로 반환
+        - include_raw_text: true이면 추출된 원문 텍스트 포함 (기본값: 미포함)
+        
+        반환 데이터:
+        - parsed_data: 파싱된 이력서 데이터
+        - features, feature_sources: 모델 입력 특성과 출처
+        - probabilities, top_company, top_probability: 기업별 확률 (퍼센트)
+        - timings_ms: 단계별 소요 시간 (preflight, extract, parse, features, predict, total)
+        """
+        return analyze_resume_upload()
+
+@api.route('/labels/resolve')
+class LabelResolveResource(Resource):
+    """학교/전공 라벨 일괄 조회 엔드포인트"""
+    
+    @api.doc('학교/전공 라벨 일괄 조회')
+    @api.expect(label_resolve_request_model)
+    @api.response(200, '조회 성공')
+    @api.response(400, '잘못된 요청', error_model)
+    def post(self):
+        """
+        학교명/전공명 목록을 모델 라벨값으로 변환합니다.
+        
+        요청 데이터:
+        - school: 학교명 목록 (예: ["세종대", "Yonsei University"])
+        - major: 전공명 목록 (예: ["컴퓨터공학과", "경영학부"])
+        - threshold: 유사 일치 최소 유사도 (선택)
+        
+        반환 데이터:
+        - results: 종류별 조회 결과 목록 (요청 순서, 찾지 못하면 label이 null)
+        - resolved, unresolved: 찾은/찾지 못한 항목 수
+        """
+        request_data = request.get_json(silent=True)
+        if not isinstance(request_data, dict):
+            return {
+                'error': '요청 데이터가 없습니다.',
+                'code': 'MISSING_DATA',
+                'details': 'JSON 데이터를 제공해주세요.'
+            }, 400
+        
+        threshold = request_data.get('threshold')
+        queries = {kind: request_data.get(kind) or [] for kind in LABELS.kinds}
+        
+        if any(not isinstance(names, list) for names in queries.values()) or \
+                (threshold is not None and not isinstance(threshold, (int, float))):
+            return {
+                'error': '요청 형식이 올바르지 않습니다.',
+                'code': 'INVALID_REQUEST',
+                'details': f"{', '.join(LABELS.kinds)}는 문자열 목록, threshold는 숫자여야 합니다."
+            }, 400
+        
+        if sum(len(names) for names in queries.values()) > Config.LABEL_BATCH_MAX_ITEMS:
+            return {
+                'error': f'한 번에 조회할 수 있는 항목 수({Config.LABEL_BATCH_MAX_ITEMS}개)를 초과했습니다.',
+                'code': 'TOO_MANY_ITEMS',
+                'details': '요청을 나누어 보내주세요.'
+            }, 400
+        
+        results = {}
+        resolved = 0
+        for kind, names in queries.items():
+            results[kind] = []
+            for name in names:
+                match = LABELS.resolve(kind, str(name), threshold)
+                if match is not None:
+                    resolved += 1
+                    results[kind].append({'query': name, **match._asdict()})
+                else:
+                    results[kind].append({
+                        'query': name, 'label': None, 'name': None,
+                        'matched': None, 'score': 0.0, 'exact': False
+                    })
+        
+        total = sum(len(items) for items in results.values())
+        return {
+            'results': results,
+            'resolved': resolved,
+            'unresolved': total - resolved
+        }, 200
+
 @api.route('/model/load')
 class ModelLoadResource(Resource):
     """AI 모델 로드 엔드포인트"""
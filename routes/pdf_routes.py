@@ -1,10 +1,18 @@
-from flask import request, send_file
+from flask import request, send_file, Response
 from flask_restx import Namespace, Resource, fields, reqparse
 import tempfile
 import os
 import io
+import json
+from contextlib import nullcontext
+from functools import partial, wraps
 from services.pdf_service import PDFService
-from services.resume_parser_service import ResumeParserService
+from services.resume_parser_service import ResumeParserService, StreamingParseResult
+from services.pdf_worker_pool import PDFExtractionTimeout, PDFExtractionMemoryExceeded
+from services.batch_service import BatchService, BatchInputError
+from services.bulk_pdf_service import BulkPDFService
+from services.pdf_render_pool import get_pdf_render_pool
+from services.admission_control import AdmissionRejected, get_admission_limiter
 from utils.file_utils import allowed_file, ensure_upload_folder
 from config.settings import Config
 
@@ -31,8 +39,10 @@ experience_model = api.model('Experience', {
 })
 
 skill_model = api.model('Skill', {
-    'name': fields.String(description='기술명'),
-    'level': fields.String(description='숙련도')
+    'id': fields.String(description='기술 정규 ID'),
+    'name': fields.String(description='기술명 (표준 이름)'),
+    'level': fields.String(description='숙련도'),
+    'positions': fields.List(fields.List(fields.Integer), description='이력서 텍스트 내 위치 목록 ([시작, 끝])')
 })
 
 link_model = api.model('Link', {
@@ -93,6 +103,39 @@ document_list_model = api.model('DocumentList', {
     'per_page': fields.Integer(description='페이지당 항목 수')
 })
 
+pdf_inspection_model = api.model('PDFInspection', {
+    'page_count': fields.Integer(description='페이지 수'),
+    'encrypted': fields.Boolean(description='암호화 여부'),
+    'password_required': fields.Boolean(description='열람 암호 필요 여부'),
+    'extractable': fields.Boolean(description='텍스트 추출 허용 여부'),
+    'has_text_layer': fields.Boolean(description='텍스트 레이어 존재 여부'),
+    'pages_checked': fields.Integer(description='텍스트 레이어를 확인한 페이지 수'),
+    'elapsed_ms': fields.Float(description='검사 소요 시간 (ms)'),
+    'file_size': fields.Integer(description='파일 크기 (bytes)')
+})
+
+pdf_analysis_model = api.model('PDFAnalysis', {
+    'artifacts': fields.List(fields.String, description='계산한 결과물 목록'),
+    'page_count': fields.Integer(description='페이지 수'),
+    'text': fields.String(description='전체 텍스트 (text 요청 시)'),
+    'pages': fields.List(fields.Raw, description='페이지별 크기와 단어 위치/글꼴 크기(words), 표(tables) (words 또는 tables 요청 시)'),
+    'metadata': fields.Raw(description='문서 정보 사전 (metadata 요청 시)'),
+    'elapsed_ms': fields.Float(description='분석 소요 시간 (ms)'),
+    'file_size': fields.Integer(description='파일 크기 (bytes)')
+})
+
+batch_response_model = api.model('BatchResponse', {
+    'total': fields.Integer(description='전체 파일 수'),
+    'succeeded': fields.Integer(description='성공한 파일 수'),
+    'failed': fields.Integer(description='실패한 파일 수'),
+    'concurrency': fields.Integer(description='배치 내 동시 처리 수'),
+    'results': fields.List(fields.Raw, description='파일별 결과 (index, filename, status_code 및 단일 API 응답 필드)')
+})
+
+bulk_generate_model = api.model('BulkGenerateRequest', {
+    'resumes': fields.List(fields.Raw, required=True, description='이력서 데이터 목록 (각 항목은 /documents/ 생성과 같은 형식)')
+})
+
 error_model = api.model('Error', {
     'error': fields.String(description='오류 메시지'),
     'code': fields.String(description='오류 코드'),
@@ -103,6 +146,270 @@ error_model = api.model('Error', {
 file_upload_parser = reqparse.RequestParser()
 file_upload_parser.add_argument('file', location='files', type='FileStorage', required=True, help='PDF 파일')
 
+# 배치 업로드를 위한 RequestParser (Swagger 문서화용)
+batch_upload_parser = reqparse.RequestParser()
+batch_upload_parser.add_argument('files', location='files', type='FileStorage', action='append', required=True, help='PDF 파일 여러 개 또는 ZIP 파일')
+batch_upload_parser.add_argument('concurrency', location='args', type=int, help='배치 내 동시 처리 수')
+batch_upload_parser.add_argument('stream', location='args', type=str, help='true이면 완료되는 순서대로 NDJSON 스트리밍')
+
+# 이력서 파싱 필드 선택 및 조기 종료 (Swagger 문서화용)
+FIELDS_HELP = '쉼표로 구분한 파싱 필드 (예: phone,email,skills, 기본값: 전체 필드)'
+EARLY_STOP_HELP = 'true이면 페이지 단위로 파싱하여 요청한 필드가 채워지면 남은 페이지를 읽지 않음'
+COMPACT_HELP = 'true이면 크기를 줄인 PDF로 생성 (최대 압축, 공유 리소스, 메타데이터 제거, 기본값: Config.PDF_COMPACT_DEFAULT)'
+resume_upload_parser = file_upload_parser.copy()
+resume_upload_parser.add_argument('fields', location='args', type=str, help=FIELDS_HELP)
+resume_upload_parser.add_argument('early_stop', location='args', type=str, help=EARLY_STOP_HELP)
+ARTIFACTS_HELP = '쉼표로 구분한 분석 결과물 (text, words, tables, metadata, 기본값: text)'
+analysis_upload_parser = file_upload_parser.copy()
+analysis_upload_parser.add_argument('artifacts', location='args', type=str, help=ARTIFACTS_HELP)
+resume_batch_upload_parser = batch_upload_parser.copy()
+resume_batch_upload_parser.add_argument('fields', location='args', type=str, help=FIELDS_HELP)
+resume_batch_upload_parser.add_argument('early_stop', location='args', type=str, help=EARLY_STOP_HELP)
+
+def pdf_download_response(pdf_output, download_name='resume.pdf'):
+    """
+    렌더링된 PDF(PDFOutput)를 첨부 파일 응답으로 만드는 공통 함수
+    
+    PDF 데이터를 BytesIO로 다시 감싸지 않고 응답 본문으로 그대로 넘기며,
+    크기를 알고 있으므로 Content-Length를 설정합니다.
+    """
+    response = Response(pdf_output.chunks, mimetype='application/pdf', direct_passthrough=True)
+    response.content_length = pdf_output.size
+    response.headers['Content-Disposition'] = f'attachment; filename={download_name}'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def cached_pdf_response(resume_data, compact=None, download_name='resume.pdf'):
+    """
+    이력서 데이터를 캐시를 거쳐 PDF 응답으로 만드는 공통 함수
+    
+    캐시 키(입력 데이터, 템플릿 버전, 출력 모드의 해시)를 강한 ETag로 사용하므로, 요청의
+    If-None-Match가 일치하면 렌더링하지 않고 304를 반환합니다.
+    X-PDF-Cache 헤더에 캐시 상태(memory, disk, miss)를 표시합니다.
+    """
+    if not Config.PDF_CACHE_ENABLED:
+        return pdf_download_response(PDFService.render_pdf(resume_data, compact), download_name)
+    
+    etag = PDFService.pdf_cache_key(resume_data, compact)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    pdf_output, cache_status = PDFService.render_pdf_cached(resume_data, etag, compact)
+    response = pdf_download_response(pdf_output, download_name)
+    response.set_etag(etag)
+    response.headers['X-PDF-Cache'] = cache_status
+    return response
+
+def pdf_worker_error_response(error):
+    """PDF 추출 워커의 제한 초과 오류를 응답으로 변환하는 공통 함수"""
+    if isinstance(error, PDFExtractionTimeout):
+        return {
+            'error': 'PDF 텍스트 추출 시간이 초과되었습니다.',
+            'code': 'PDF_EXTRACTION_TIMEOUT',
+            'details': str(error)
+        }, 504
+    
+    return {
+        'error': 'PDF 텍스트 추출 중 메모리 한도를 초과했습니다.',
+        'code': 'PDF_EXTRACTION_MEMORY_EXCEEDED',
+        'details': str(error)
+    }, 422
+
+def admission_error_response(error):
+    """작업 종류별 동시 실행 제한으로 거부된 요청을 429 응답으로 변환하는 공통 함수"""
+    return {
+        'error': '요청이 많아 지금은 처리할 수 없습니다. 잠시 후 다시 시도해주세요.',
+        'code': 'TOO_MANY_REQUESTS',
+        'details': str(error)
+    }, 429, {'Retry-After': str(error.retry_after)}
+
+def admission_controlled(work_class):
+    """
+    라우트 함수를 작업 종류별 동시 실행 제한 안에서 실행하는 데코레이터
+    
+    슬롯과 대기열이 모두 차 있으면 라우트를 실행하지 않고 429(Retry-After)를 반환합니다.
+    스트리밍 응답은 본문 전송이 끝날 때 슬롯을 반환합니다.
+    
+    Args:
+        work_class: 작업 종류 (pdf_extraction, pdf_generation, prediction)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Config.ADMISSION_CONTROL_ENABLED:
+                return func(*args, **kwargs)
+            
+            limiter = get_admission_limiter(work_class)
+            try:
+                start = limiter.acquire()
+            except AdmissionRejected as e:
+                return admission_error_response(e)
+            
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                limiter.release(start)
+                raise
+            
+            if isinstance(result, Response) and result.is_streamed:
+                result.call_on_close(partial(limiter.release, start))
+            else:
+                limiter.release(start)
+            return result
+        return wrapper
+    return decorator
+
+def resolve_fields_argument():
+    """
+    요청의 fields 파라미터(쿼리 또는 폼)를 검증하는 공통 함수
+    
+    Returns:
+        (필드 튜플, None) 또는 (None, 오류 응답)
+    """
+    try:
+        fields = ResumeParserService.resolve_fields(request.args.get('fields') or request.form.get('fields'))
+        return fields, None
+    except ValueError as e:
+        return None, ({
+            'error': '요청한 파싱 필드가 유효하지 않습니다.',
+            'code': 'INVALID_FIELDS',
+            'details': str(e)
+        }, 400)
+
+def resolve_artifacts_argument():
+    """
+    요청의 artifacts 파라미터(쿼리 또는 폼)를 검증하는 공통 함수
+    
+    Returns:
+        (결과물 튜플, None) 또는 (None, 오류 응답)
+    """
+    try:
+        artifacts = PDFService.resolve_artifacts(request.args.get('artifacts') or request.form.get('artifacts'))
+        return artifacts, None
+    except ValueError as e:
+        return None, ({
+            'error': '요청한 분석 결과물이 유효하지 않습니다.',
+            'code': 'INVALID_ARTIFACTS',
+            'details': str(e)
+        }, 400)
+
+def resolve_early_stop_argument():
+    """요청의 early_stop 파라미터를 읽는 공통 함수 (기본값: Config.RESUME_EARLY_STOP)"""
+    early_stop = request.args.get('early_stop') or request.form.get('early_stop')
+    if early_stop is None:
+        return Config.RESUME_EARLY_STOP
+    return early_stop.lower() == 'true'
+
+def resolve_compact_argument():
+    """요청의 compact 파라미터를 읽는 공통 함수 (기본값: Config.PDF_COMPACT_DEFAULT)"""
+    compact = request.args.get('compact')
+    if compact is None:
+        return Config.PDF_COMPACT_DEFAULT
+    return compact.lower() == 'true'
+
+def parsed_resume_response(extracted_text, fields=None, result=None):
+    """
+    이력서 파싱 응답을 만드는 공통 함수
+    
+    result가 없으면 추출된 텍스트를 파싱하며, 스트리밍 파싱 결과이면
+    읽은 페이지 수와 조기 종료 여부를 함께 반환합니다.
+    """
+    from datetime import datetime
+    import uuid
+    
+    if result is None:
+        result = ResumeParserService.parse_resume_timed(extracted_text, fields)
+    
+    response_data = {
+        'id': str(uuid.uuid4()),
+        'type': 'parsed_resume',
+        'parsed_data': result.data,
+        'fields': list(result.data),
+        'parse_timings_ms': result.timings_ms,
+        'parse_cached': result.cached,
+        'raw_text': extracted_text,
+        'file_size': len(extracted_text.encode('utf-8')),
+        'created_at': datetime.now().isoformat(),
+        'status': 'completed'
+    }
+    
+    if isinstance(result, StreamingParseResult):
+        response_data['pages_read'] = result.pages_read
+        response_data['stopped_early'] = result.stopped_early
+    
+    return response_data
+
+def extract_and_parse_resume(source, fields=None, early_stop=False):
+    """
+    PDF에서 텍스트를 추출하고 이력서를 파싱하는 공통 함수
+    
+    Args:
+        source: PDF 파일 경로 또는 PDF 데이터(bytes)
+        fields: 파싱할 필드 (기본값: 전체 필드)
+        early_stop: 페이지 단위 스트리밍 파싱 사용 여부
+        
+    Returns:
+        이력서 파싱 응답 또는 (오류 응답, 상태 코드)
+    """
+    from_bytes = isinstance(source, (bytes, bytearray))
+    
+    if early_stop:
+        if from_bytes:
+            result = PDFService.parse_resume_streaming_from_bytes(source, fields)
+        else:
+            result = PDFService.parse_resume_streaming_from_pdf(source, fields)
+        extracted_text = result.text
+    else:
+        # 추출과 파싱을 한 번에 수행 (RESUME_STRUCTURAL_SECTIONS이면 섹션을 헤더 줄로 나눔,
+        # 워커 풀을 사용하면 두 단계 모두 워커 프로세스에서 실행)
+        if from_bytes:
+            parsed = PDFService.parse_resume_from_bytes(source, fields)
+        else:
+            parsed = PDFService.parse_resume_from_pdf(source, fields)
+        extracted_text, result = parsed.text, parsed.result
+    
+    if not extracted_text:
+        return {
+            'error': 'PDF에서 텍스트를 추출할 수 없습니다.',
+            'code': 'NO_TEXT_EXTRACTED',
+            'details': 'PDF 파일이 텍스트를 포함하지 않거나 이미지로만 구성되어 있습니다.'
+        }, 400
+    
+    return parsed_resume_response(extracted_text, fields, result)
+
+def preflight_error_response(pdf_path):
+    """PDF 사전 검사에서 처리할 수 없는 파일로 판단되면 오류 응답을 반환하는 공통 함수"""
+    if not Config.PDF_PREFLIGHT_ENABLED:
+        return None
+    
+    try:
+        inspection = PDFService.inspect_pdf(pdf_path)
+    except Exception as e:
+        return {
+            'error': '유효한 PDF 파일이 아닙니다.',
+            'code': 'INVALID_PDF',
+            'details': str(e)
+        }, 400
+    
+    if inspection['password_required']:
+        return {
+            'error': '암호로 보호된 PDF입니다.',
+            'code': 'ENCRYPTED_PDF',
+            'details': '암호가 없는 PDF 파일을 업로드해주세요.'
+        }, 400
+    
+    if not inspection['has_text_layer']:
+        return {
+            'error': 'PDF에서 텍스트를 추출할 수 없습니다.',
+            'code': 'NO_TEXT_EXTRACTED',
+            'details': 'PDF 파일이 텍스트를 포함하지 않거나 이미지로만 구성되어 있습니다.'
+        }, 400
+    
+    return None
+
 def extract_text_from_pdf_file(file):
     """PDF 파일에서 텍스트를 추출하는 공통 함수"""
     if not file:
@@ -135,6 +442,10 @@ def extract_text_from_pdf_file(file):
         print(f"PDF 파일 저장됨: {temp_file_path}")
         print(f"파일 크기: {os.path.getsize(temp_file_path)} bytes")
         
+        preflight_error = preflight_error_response(temp_file_path)
+        if preflight_error:
+            return preflight_error
+        
         # PDF에서 텍스트 추출
         extracted_text = PDFService.extract_text_from_pdf(temp_file_path)
         
@@ -156,6 +467,10 @@ def extract_text_from_pdf_file(file):
         print(f"응답 데이터: {response_data}")
         return response_data
         
+    except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+        print(f"텍스트 추출 제한 초과: {str(e)}")
+        return pdf_worker_error_response(e)
+        
     except Exception as e:
         print(f"텍스트 추출 중 오류: {str(e)}")
         return {
@@ -170,8 +485,8 @@ def extract_text_from_pdf_file(file):
             os.unlink(temp_file_path)
             print(f"임시 파일 삭제됨: {temp_file_path}")
 
-def parse_resume_from_pdf_file(file):
-    """PDF 파일에서 이력서 정보를 파싱하는 함수"""
+def parse_resume_from_pdf_file(file, fields=None, early_stop=False):
+    """PDF 파일에서 이력서 정보를 파싱하는 함수 (fields: 파싱할 필드, early_stop: 스트리밍 파싱)"""
     if not file:
         return {
             'error': '파일이 없습니다.',
@@ -201,50 +516,179 @@ def parse_resume_from_pdf_file(file):
     try:
         print(f"이력서 PDF 파일 저장됨: {temp_file_path}")
         
-        # PDF에서 텍스트 추출
-        extracted_text = PDFService.extract_text_from_pdf(temp_file_path)
+        preflight_error = preflight_error_response(temp_file_path)
+        if preflight_error:
+            return preflight_error
         
-        if not extracted_text:
-            return {
-                'error': 'PDF에서 텍스트를 추출할 수 없습니다.',
-                'code': 'NO_TEXT_EXTRACTED',
-                'details': 'PDF 파일이 텍스트를 포함하지 않거나 이미지로만 구성되어 있습니다.'
-            }, 400
+        # PDF에서 텍스트 추출 후 이력서 정보 파싱 (요청한 필드만)
+        response_data = extract_and_parse_resume(temp_file_path, fields, early_stop)
+        if isinstance(response_data, tuple):
+            return response_data
         
-        print(f"추출된 텍스트 길이: {len(extracted_text)}")
+        print(f"추출된 텍스트 길이: {len(response_data['raw_text'])}")
+        print(f"파싱된 이력서 데이터: {response_data['parsed_data']}")
+        print(f"파싱 소요 시간(ms): {response_data['parse_timings_ms']}")
+        return response_data
+        
+    except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+        print(f"텍스트 추출 제한 초과: {str(e)}")
+        return pdf_worker_error_response(e)
+        
+    except Exception as e:
+        print(f"이력서 파싱 중 오류: {str(e)}")
+        return {
+            'error': '이력서 파싱 중 오류가 발생했습니다.',
+            'code': 'RESUME_PARSING_ERROR',
+            'details': str(e)
+        }, 500
+        
+    finally:
+        # 임시 파일 삭제
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+            print(f"임시 파일 삭제됨: {temp_file_path}")
+
+def extract_text_from_pdf_bytes(pdf_bytes):
+    """PDF 데이터에서 텍스트를 추출하는 공통 함수 (배치 처리용)"""
+    try:
+        preflight_error = preflight_error_response(io.BytesIO(pdf_bytes))
+        if preflight_error:
+            return preflight_error
         
-        # 이력서 정보 파싱
-        parsed_resume = ResumeParserService.parse_resume(extracted_text)
+        extracted_text = PDFService.extract_text_from_bytes(pdf_bytes)
         
         from datetime import datetime
         import uuid
         
-        response_data = {
+        return {
             'id': str(uuid.uuid4()),
-            'type': 'parsed_resume',
-            'parsed_data': parsed_resume,
-            'raw_text': extracted_text,
-            'file_size': len(extracted_text.encode('utf-8')),
+            'type': 'text',
+            'content': extracted_text,
+            'file_size': len(extracted_text.encode('utf-8')) if extracted_text else 0,
             'created_at': datetime.now().isoformat(),
             'status': 'completed'
         }
         
-        print(f"파싱된 이력서 데이터: {parsed_resume}")
-        return response_data
+    except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+        return pdf_worker_error_response(e)
+        
+    except Exception as e:
+        return {
+            'error': '텍스트 추출 중 오류가 발생했습니다.',
+            'code': 'TEXT_EXTRACTION_ERROR',
+            'details': str(e)
+        }, 500
+
+def parse_resume_from_pdf_bytes(pdf_bytes, fields=None, early_stop=False):
+    """PDF 데이터에서 이력서 정보를 파싱하는 공통 함수 (배치 처리용, fields: 파싱할 필드, early_stop: 스트리밍 파싱)"""
+    try:
+        preflight_error = preflight_error_response(io.BytesIO(pdf_bytes))
+        if preflight_error:
+            return preflight_error
+        
+        return extract_and_parse_resume(pdf_bytes, fields, early_stop)
+        
+    except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+        return pdf_worker_error_response(e)
         
     except Exception as e:
-        print(f"이력서 파싱 중 오류: {str(e)}")
         return {
             'error': '이력서 파싱 중 오류가 발생했습니다.',
             'code': 'RESUME_PARSING_ERROR',
             'details': str(e)
         }, 500
+
+def batch_item(index, filename, result):
+    """배치 처리 결과 하나를 파일별 응답 항목으로 변환하는 함수"""
+    body, status_code = result if isinstance(result, tuple) else (result, 200)
+    item = {
+        'index': index,
+        'filename': filename,
+        'status_code': status_code
+    }
+    item.update(body)
+    item.setdefault('status', 'failed')
+    return item
+
+def batch_file_handler(handler, work_class='pdf_extraction'):
+    """
+    배치의 파일 하나를 처리하는 함수를 만드는 공통 함수
+    
+    작업 종류별 동시 실행 제한은 배치 전체가 아니라 파일마다 적용하며, 슬롯을 얻은 뒤에
+    파일 데이터를 읽으므로(ZIP 항목은 이때 압축 해제) 대기 중인 파일은 메모리를 차지하지 않습니다.
+    거부된 파일은 429 항목(retry_after 포함)으로, 읽을 수 없는 ZIP 항목은 400 항목으로 반환합니다.
+    
+    Args:
+        handler: PDF 데이터를 받아 단일 API와 같은 결과를 반환하는 함수
+        work_class: 작업 종류 (pdf_extraction, pdf_generation, prediction)
+    """
+    def run(load):
+        try:
+            with get_admission_limiter(work_class).slot() if Config.ADMISSION_CONTROL_ENABLED else nullcontext():
+                try:
+                    pdf_bytes = load()
+                except BatchInputError as e:
+                    return {
+                        'error': 'ZIP 항목을 읽을 수 없습니다.',
+                        'code': 'INVALID_ZIP_ENTRY',
+                        'details': str(e)
+                    }, 400
+                return handler(pdf_bytes)
+        except AdmissionRejected as e:
+            body, status_code, _ = admission_error_response(e)
+            body['retry_after'] = e.retry_after
+            return body, status_code
+    return run
+
+def process_batch_upload(handler):
+    """
+    배치 업로드 요청을 처리하는 공통 함수
+    
+    multipart의 files(또는 file) 필드로 받은 PDF/ZIP 파일을 handler로 병렬 처리합니다.
+    동시 실행 제한은 batch_file_handler로 파일마다 적용합니다.
+    쿼리 파라미터 stream=true이면 완료되는 순서대로 NDJSON으로 스트리밍합니다.
+    """
+    if 'multipart/form-data' not in request.headers.get('Content-Type', ''):
+        return {
+            'error': 'Content-Type이 multipart/form-data여야 합니다.',
+            'code': 'INVALID_CONTENT_TYPE',
+            'details': 'PDF 또는 ZIP 파일을 업로드해주세요.'
+        }, 400
+    
+    files = request.files.getlist('files') + request.files.getlist('file')
+    
+    try:
+        pdf_files = BatchService.collect_pdf_files(files)
+        concurrency = BatchService.resolve_concurrency(request.args.get('concurrency', type=int))
+    except BatchInputError as e:
+        return {
+            'error': '배치 요청이 유효하지 않습니다.',
+            'code': 'INVALID_BATCH',
+            'details': str(e)
+        }, 400
+    
+    results = BatchService.process(pdf_files, batch_file_handler(handler), concurrency)
+    
+    if request.args.get('stream', 'false').lower() == 'true':
+        def generate():
+            for index, filename, result in results:
+                yield json.dumps(batch_item(index, filename, result), ensure_ascii=False) + '\n'
         
-    finally:
-        # 임시 파일 삭제
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
-            print(f"임시 파일 삭제됨: {temp_file_path}")
+        return Response(generate(), mimetype='application/x-ndjson')
+    
+    items = sorted(
+        (batch_item(index, filename, result) for index, filename, result in results),
+        key=lambda item: item['index']
+    )
+    succeeded = sum(1 for item in items if item['status_code'] == 200)
+    
+    return {
+        'total': len(items),
+        'succeeded': succeeded,
+        'failed': len(items) - succeeded,
+        'concurrency': concurrency,
+        'results': items
+    }, 200
 
 @api.route('/')
 class DocumentListResource(Resource):
@@ -284,11 +728,14 @@ class DocumentListResource(Resource):
                 'details': str(e)
             }, 500
     
-    @api.doc('새 문서 생성 (PDF 변환)')
+    @api.doc('새 문서 생성 (PDF 변환)', params={'compact': COMPACT_HELP})
     @api.expect(resume_model)
     @api.response(201, '문서 생성 성공')
+    @api.response(304, '변경 없음 (If-None-Match가 ETag와 일치)')
     @api.response(400, '잘못된 요청', error_model)
     @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_generation')
     def post(self):
         """
         새로운 PDF 문서를 생성합니다.
@@ -301,6 +748,9 @@ class DocumentListResource(Resource):
         - education: 학력 (선택)
         - etc: 기타 정보 (선택)
         
+        쿼리 파라미터:
+        - compact: true이면 크기를 줄인 PDF로 생성
+        
         반환: PDF 파일 (binary)
         """
         try:
@@ -321,16 +771,8 @@ class DocumentListResource(Resource):
                     'details': '이력서 데이터를 제공해주세요.'
                 }, 400
             
-            # PDF 생성
-            pdf_content = PDFService.create_pdf_from_data(data)
-            
-            # PDF 파일로 응답
-            return send_file(
-                io.BytesIO(pdf_content),
-                mimetype='application/pdf',
-                as_attachment=True,
-                download_name='resume.pdf'
-            )
+            # PDF 생성 (캐시 적중 시 렌더링 생략, ETag 일치 시 304)
+            return cached_pdf_response(data, resolve_compact_argument())
             
         except Exception as e:
             return {
@@ -424,6 +866,8 @@ class DocumentConvertResource(Resource):
     @api.response(200, '텍스트 추출 성공', document_response_model)
     @api.response(400, '잘못된 요청', error_model)
     @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_extraction')
     def post(self):
         """
         PDF 파일을 텍스트로 변환합니다.
@@ -464,15 +908,169 @@ class DocumentConvertResource(Resource):
                 'details': str(e)
             }, 500
 
+@api.route('/inspect')
+class DocumentInspectResource(Resource):
+    """PDF 사전 검사"""
+    
+    @api.doc('PDF 사전 검사')
+    @api.expect(file_upload_parser)
+    @api.response(200, '검사 성공', pdf_inspection_model)
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(500, '서버 오류', error_model)
+    def post(self):
+        """
+        전체 텍스트 추출 없이 PDF를 사전 검사합니다.
+        
+        요청: multipart/form-data
+        - file: PDF 파일
+        
+        반환 데이터:
+        - page_count: 페이지 수
+        - encrypted: 암호화 여부
+        - password_required: 열람 암호 필요 여부
+        - extractable: 텍스트 추출 허용 여부
+        - has_text_layer: 텍스트 레이어 존재 여부
+        - pages_checked: 텍스트 레이어를 확인한 페이지 수
+        - elapsed_ms: 검사 소요 시간 (ms)
+        - file_size: 파일 크기 (bytes)
+        """
+        try:
+            # multipart/form-data 확인
+            if 'multipart/form-data' not in request.headers.get('Content-Type', ''):
+                return {
+                    'error': 'Content-Type이 multipart/form-data여야 합니다.',
+                    'code': 'INVALID_CONTENT_TYPE',
+                    'details': 'PDF 파일을 업로드해주세요.'
+                }, 400
+            
+            file = request.files.get('file')
+            
+            if not file or file.filename == '':
+                return {
+                    'error': '파일이 없습니다.',
+                    'code': 'MISSING_FILE',
+                    'details': 'PDF 파일을 선택해주세요.'
+                }, 400
+            
+            if not allowed_file(file.filename):
+                return {
+                    'error': 'PDF 파일만 업로드 가능합니다.',
+                    'code': 'INVALID_FILE_TYPE',
+                    'details': 'PDF 형식의 파일만 지원합니다.'
+                }, 400
+            
+            pdf_bytes = file.read()
+            
+            try:
+                inspection = PDFService.inspect_pdf(io.BytesIO(pdf_bytes))
+            except Exception as e:
+                return {
+                    'error': '유효한 PDF 파일이 아닙니다.',
+                    'code': 'INVALID_PDF',
+                    'details': str(e)
+                }, 400
+            
+            inspection['file_size'] = len(pdf_bytes)
+            return inspection, 200
+            
+        except Exception as e:
+            return {
+                'error': 'PDF 사전 검사 중 오류가 발생했습니다.',
+                'code': 'PDF_INSPECTION_ERROR',
+                'details': str(e)
+            }, 500
+
+@api.route('/analyze')
+class DocumentAnalyzeResource(Resource):
+    """PDF 통합 분석"""
+    
+    @api.doc('PDF 통합 분석')
+    @api.expect(analysis_upload_parser)
+    @api.response(200, '분석 성공', pdf_analysis_model)
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(422, '워커 메모리 한도 초과', error_model)
+    @api.response(500, '서버 오류', error_model)
+    @api.response(504, '분석 시간 초과', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_extraction')
+    def post(self):
+        """
+        PDF를 한 번만 열어 요청한 결과물을 함께 계산합니다.
+        
+        요청: multipart/form-data
+        - file: PDF 파일
+        
+        쿼리 파라미터:
+        - artifacts: 쉼표로 구분한 분석 결과물 (기본값: text)
+          - text: 전체 텍스트
+          - words: 페이지별 단어 위치(x0, top, x1, bottom)와 글꼴 크기/이름
+          - tables: 페이지별 표 (행 목록)
+          - metadata: 문서 정보 사전 (Title, Author, Producer 등)
+          요청한 결과물만 계산하며, 모든 결과물이 같은 페이지 해석 결과를 사용합니다.
+        
+        반환 데이터:
+        - artifacts, page_count, elapsed_ms, file_size 및 요청한 결과물(text, pages, metadata)
+        """
+        try:
+            # multipart/form-data 확인
+            if 'multipart/form-data' not in request.headers.get('Content-Type', ''):
+                return {
+                    'error': 'Content-Type이 multipart/form-data여야 합니다.',
+                    'code': 'INVALID_CONTENT_TYPE',
+                    'details': 'PDF 파일을 업로드해주세요.'
+                }, 400
+            
+            artifacts, artifacts_error = resolve_artifacts_argument()
+            if artifacts_error:
+                return artifacts_error
+            
+            file = request.files.get('file')
+            
+            if not file or file.filename == '':
+                return {
+                    'error': '파일이 없습니다.',
+                    'code': 'MISSING_FILE',
+                    'details': 'PDF 파일을 선택해주세요.'
+                }, 400
+            
+            if not allowed_file(file.filename):
+                return {
+                    'error': 'PDF 파일만 업로드 가능합니다.',
+                    'code': 'INVALID_FILE_TYPE',
+                    'details': 'PDF 형식의 파일만 지원합니다.'
+                }, 400
+            
+            pdf_bytes = file.read()
+            
+            preflight_error = preflight_error_response(io.BytesIO(pdf_bytes))
+            if preflight_error:
+                return preflight_error
+            
+            analysis = PDFService.analyze_pdf_bytes(pdf_bytes, artifacts)
+            analysis['file_size'] = len(pdf_bytes)
+            return analysis, 200
+            
+        except (PDFExtractionTimeout, PDFExtractionMemoryExceeded) as e:
+            return pdf_worker_error_response(e)
+            
+        except Exception as e:
+            return {
+                'error': 'PDF 분석 중 오류가 발생했습니다.',
+                'code': 'PDF_ANALYSIS_ERROR',
+                'details': str(e)
+            }, 500
+
 @api.route('/parse-resume')
 class ResumeParseResource(Resource):
     """이력서 PDF 파싱"""
     
     @api.doc('이력서 PDF 파싱')
-    @api.expect(file_upload_parser)
+    @api.expect(resume_upload_parser)
     @api.response(200, '이력서 파싱 성공')
     @api.response(400, '잘못된 요청', error_model)
     @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_extraction')
     def post(self):
         """
         PDF 이력서를 구조화된 데이터로 파싱합니다.
@@ -480,7 +1078,13 @@ class ResumeParseResource(Resource):
         요청: multipart/form-data
         - file: PDF 이력서 파일
         
-        반환: 파싱된 이력서 데이터
+        쿼리 파라미터:
+        - fields: 쉼표로 구분한 파싱 필드 (예: phone,email,skills, 기본값: 전체 필드)
+          요청한 필드의 추출기와 필요한 섹션 탐지만 실행하며, parse_timings_ms에 단계별 소요 시간을 반환합니다.
+        - early_stop: true이면 페이지 단위로 파싱하여 요청한 필드가 채워지면 남은 페이지를 읽지 않습니다.
+          (응답에 pages_read, stopped_early 포함, raw_text는 읽은 페이지까지의 텍스트)
+        
+        반환: 파싱된 이력서 데이터 (요청한 필드만)
         - phone: 핸드폰 번호
         - email: 이메일
         - introduction: 간단 자기소개
@@ -508,8 +1112,12 @@ class ResumeParseResource(Resource):
                     'details': 'PDF 파일을 선택해주세요.'
                 }, 400
             
+            fields, fields_error = resolve_fields_argument()
+            if fields_error:
+                return fields_error
+            
             file = request.files['file']
-            result = parse_resume_from_pdf_file(file)
+            result = parse_resume_from_pdf_file(file, fields, resolve_early_stop_argument())
             
             if isinstance(result, tuple):
                 return result  # 오류 응답
@@ -523,6 +1131,133 @@ class ResumeParseResource(Resource):
                 'details': str(e)
             }, 500
 
+@api.route('/convert/batch')
+class DocumentConvertBatchResource(Resource):
+    """여러 PDF 문서 일괄 텍스트 추출"""
+    
+    @api.doc('PDF 일괄 텍스트 추출')
+    @api.expect(batch_upload_parser)
+    @api.response(200, '일괄 처리 완료', batch_response_model)
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(500, '서버 오류', error_model)
+    def post(self):
+        """
+        여러 PDF 파일 또는 ZIP 파일의 텍스트를 병렬로 추출합니다.
+        
+        요청: multipart/form-data
+        - files: PDF 파일 여러 개 또는 PDF가 담긴 ZIP 파일
+        
+        쿼리 파라미터:
+        - concurrency: 배치 내 동시 처리 수 (기본값: Config.BATCH_DEFAULT_CONCURRENCY, PDF 추출 동시 실행 제한 이하)
+        - stream: true이면 완료되는 순서대로 NDJSON 스트리밍
+        
+        반환: 파일별 텍스트 추출 결과
+        """
+        try:
+            return process_batch_upload(extract_text_from_pdf_bytes)
+            
+        except Exception as e:
+            return {
+                'error': '일괄 텍스트 추출 중 오류가 발생했습니다.',
+                'code': 'BATCH_TEXT_EXTRACTION_ERROR',
+                'details': str(e)
+            }, 500
+
+@api.route('/parse-resume/batch')
+class ResumeParseBatchResource(Resource):
+    """여러 이력서 PDF 일괄 파싱"""
+    
+    @api.doc('이력서 PDF 일괄 파싱')
+    @api.expect(resume_batch_upload_parser)
+    @api.response(200, '일괄 처리 완료', batch_response_model)
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(500, '서버 오류', error_model)
+    def post(self):
+        """
+        여러 PDF 이력서 또는 ZIP 파일을 병렬로 파싱합니다.
+        
+        요청: multipart/form-data
+        - files: PDF 이력서 여러 개 또는 PDF가 담긴 ZIP 파일
+        
+        쿼리 파라미터:
+        - concurrency: 배치 내 동시 처리 수 (기본값: Config.BATCH_DEFAULT_CONCURRENCY, PDF 추출 동시 실행 제한 이하)
+        - stream: true이면 완료되는 순서대로 NDJSON 스트리밍
+        - fields: 쉼표로 구분한 파싱 필드 (기본값: 전체 필드)
+        - early_stop: true이면 요청한 필드가 채워진 뒤의 페이지는 읽지 않음
+        
+        반환: 파일별 이력서 파싱 결과
+        """
+        try:
+            fields, fields_error = resolve_fields_argument()
+            if fields_error:
+                return fields_error
+            
+            return process_batch_upload(partial(
+                parse_resume_from_pdf_bytes,
+                fields=fields,
+                early_stop=resolve_early_stop_argument()
+            ))
+            
+        except Exception as e:
+            return {
+                'error': '이력서 일괄 파싱 중 오류가 발생했습니다.',
+                'code': 'BATCH_RESUME_PARSING_ERROR',
+                'details': str(e)
+            }, 500
+
+@api.route('/generate/batch')
+class DocumentGenerateBatchResource(Resource):
+    """여러 이력서 PDF 일괄 생성"""
+    
+    @api.doc('이력서 PDF 일괄 생성 (ZIP)', params={'compact': COMPACT_HELP})
+    @api.expect(bulk_generate_model)
+    @api.response(200, 'ZIP 스트리밍 시작')
+    @api.response(400, '잘못된 요청', error_model)
+    @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('pdf_generation')
+    def post(self):
+        """
+        여러 이력서를 PDF로 생성하여 ZIP 파일로 스트리밍합니다.
+        
+        입력 데이터:
+        - resumes: 이력서 데이터 목록 (최대 Config.BULK_PDF_MAX_DOCUMENTS개)
+        
+        쿼리 파라미터:
+        - compact: true이면 크기를 줄인 PDF로 생성
+        
+        렌더러 프로세스 풀에서 병렬로 렌더링하며, 완성된 PDF부터 ZIP 항목으로 전송합니다.
+        마지막 항목 manifest.json에 이력서별 처리 결과(completed/failed)가 기록됩니다.
+        
+        반환: ZIP 파일 (binary)
+        """
+        try:
+            documents = BulkPDFService.load_documents(request.get_json(silent=True))
+        except BatchInputError as e:
+            return {
+                'error': '일괄 생성 요청이 유효하지 않습니다.',
+                'code': 'INVALID_BATCH',
+                'details': str(e)
+            }, 400
+        
+        try:
+            # 렌더러 풀은 스트리밍 시작 전에 준비하여 실패하면 오류 응답을 반환
+            pool = get_pdf_render_pool()
+            response = Response(
+                BulkPDFService.stream_zip(documents, pool, compact=resolve_compact_argument()),
+                mimetype='application/zip'
+            )
+            response.headers['Content-Disposition'] = 'attachment; filename=resumes.zip'
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+            
+        except Exception as e:
+            return {
+                'error': 'PDF 일괄 생성 중 오류가 발생했습니다.',
+                'code': 'BULK_PDF_GENERATION_ERROR',
+                'details': str(e)
+            }, 500
+
 @api.route('/health')
 class HealthResource(Resource):
     """서비스 상태 확인"""
@@ -1,6 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from services.prediction_service import PredictionService
+from services.prediction_pool import run_prediction
+from routes.pdf_routes import admission_controlled
 import logging
 
 logger = logging.getLogger(__name__)
@@ -94,6 +96,8 @@ class PredictionListResource(Resource):
     @api.response(201, '예측 생성 성공', prediction_response_model)
     @api.response(400, '잘못된 요청', error_model)
     @api.response(500, '서버 오류', error_model)
+    @api.response(429, '요청 과다 (Retry-After 이후 재시도)', error_model)
+    @admission_controlled('prediction')
     def post(self):
         """
         새로운 기업 확률 예측을 생성합니다.
@@ -128,8 +132,8 @@ class PredictionListResource(Resource):
             
             logger.info(f"예측 요청 받음: {user_data.get('name', 'Unknown')}")
             
-            # 예측 수행
-            result = prediction_service.predict_company_probability(user_data)
+            # 예측 수행 (BULKHEAD_ENABLED이면 예측 스레드 풀에서 실행)
+            result = run_prediction(prediction_service.predict_company_probability, user_data)
             
             if result['success']:
                 # 예측 ID 생성 (실제로는 UUID 사용)
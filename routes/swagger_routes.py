@@ -5,6 +5,8 @@ import tempfile
 import os
 import io
 from services.pdf_service import PDFService
+from routes.pdf_routes import COMPACT_HELP, cached_pdf_response, resolve_compact_argument
+from services.pdf_worker_pool import PDFExtractionTimeout, PDFExtractionMemoryExceeded
 from utils.file_utils import allowed_file, ensure_upload_folder
 from config.settings import Config
 
@@ -103,14 +105,19 @@ class PDFToText(Resource):
                 if os.path.exists(temp_file_path):
                     os.unlink(temp_file_path)
                     
+        except PDFExtractionTimeout as e:
+            return {'error': str(e)}, 504
+        except PDFExtractionMemoryExceeded as e:
+            return {'error': str(e)}, 422
         except Exception as e:
             return {'error': str(e)}, 500
 
 @pdf_ns.route('/text-to-pdf')
 class TextToPDF(Resource):
-    @pdf_ns.doc('이력서 PDF 생성')
+    @pdf_ns.doc('이력서 PDF 생성', params={'compact': COMPACT_HELP})
     @pdf_ns.expect(resume_model)
     @pdf_ns.response(200, 'PDF 생성 성공')
+    @pdf_ns.response(304, '변경 없음 (If-None-Match가 ETag와 일치)')
     @pdf_ns.response(400, '잘못된 요청', error_model)
     @pdf_ns.response(500, '서버 오류', error_model)
     def post(self):
@@ -121,16 +128,8 @@ class TextToPDF(Resource):
             if not data:
                 return {'error': 'JSON 데이터가 없습니다.'}, 400
             
-            # PDF 생성
-            pdf_content = PDFService.create_pdf_from_data(data)
-            
-            # PDF 파일로 응답
-            return send_file(
-                io.BytesIO(pdf_content),
-                mimetype='application/pdf',
-                as_attachment=True,
-                download_name='resume.pdf'
-            )
+            # PDF 생성 (캐시 적중 시 렌더링 생략, ETag 일치 시 304)
+            return cached_pdf_response(data, resolve_compact_argument())
             
         except Exception as e:
             return {'error': str(e)}, 500
@@ -138,9 +137,10 @@ class TextToPDF(Resource):
 @pdf_ns.route('/convert-resume')
 class ConvertResume(Resource):
     @pdf_ns.doc('통합 이력서 변환',
-                params={'data': 'JSON 데이터 (application/json) 또는 파일 (multipart/form-data)'})
+                params={'data': 'JSON 데이터 (application/json) 또는 파일 (multipart/form-data)', 'compact': COMPACT_HELP})
     @pdf_ns.expect(resume_model)
     @pdf_ns.response(200, '변환 성공')
+    @pdf_ns.response(304, '변경 없음 (If-None-Match가 ETag와 일치)')
     @pdf_ns.response(400, '잘못된 요청', error_model)
     @pdf_ns.response(500, '서버 오류', error_model)
     def post(self):
@@ -156,14 +156,7 @@ class ConvertResume(Resource):
                 if not data:
                     return {'error': 'JSON 데이터가 없습니다.'}, 400
                 
-                pdf_content = PDFService.create_pdf_from_data(data)
-                
-                return send_file(
-                    io.BytesIO(pdf_content),
-                    mimetype='application/pdf',
-                    as_attachment=True,
-                    download_name='resume.pdf'
-                )
+                return cached_pdf_response(data, resolve_compact_argument())
                 
             elif 'multipart/form-data' in content_type:
                 # 파일 업로드로 PDF 변환
@@ -199,5 +192,9 @@ class ConvertResume(Resource):
             else:
                 return {'error': '지원하지 않는 Content-Type입니다.'}, 400
                 
+        except PDFExtractionTimeout as e:
+            return {'error': str(e)}, 504
+        except PDFExtractionMemoryExceeded as e:
+            return {'error': str(e)}, 422
         except Exception as e:
             return {'error': str(e)}, 500 
\ No newline at end of file
@@ -0,0 +1,146 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+from config.settings import Config
+
+# 작업 종류 → 동시 실행 수/대기열 길이 설정 이름
+ADMISSION_CLASSES = {
+    'pdf_extraction': ('ADMISSION_PDF_EXTRACTION_LIMIT', 'ADMISSION_PDF_EXTRACTION_QUEUE'),
+    'pdf_generation': ('ADMISSION_PDF_GENERATION_LIMIT', 'ADMISSION_PDF_GENERATION_QUEUE'),
+    'prediction': ('ADMISSION_PREDICTION_LIMIT', 'ADMISSION_PREDICTION_QUEUE')
+}
+
+class AdmissionRejected(Exception):
+    """동시 실행 수와 대기열이 모두 가득 찼거나 대기 시간이 초과되었을 때 발생하는 예외"""
+    
+    def __init__(self, work_class: str, retry_after: int, message: str):
+        super().__init__(message)
+        self.work_class = work_class
+        self.retry_after = retry_after
+
+class AdmissionLimiter:
+    """
+    작업 종류 하나의 동시 실행 수와 대기열 길이를 제한하는 리미터
+    
+    실행 중인 작업이 limit보다 적으면 바로 실행하고, 아니면 queue_size까지 대기열에서
+    기다립니다. 대기열이 가득 차면 기다리지 않고 바로 거부하므로, 한 종류의 작업이
+    몰려도 다른 종류의 작업은 자기 리미터만 거칩니다. limit이 0 이하이면 제한하지 않습니다.
+    
+    Retry-After는 최근 작업 시간의 지수 이동 평균으로 대기열이 빠지는 시간을 추정합니다.
+    """
+    
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float = 10):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._condition = threading.Condition()
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._avg_seconds = 0.0
+    
+    @contextmanager
+    def slot(self):
+        """실행 슬롯을 얻고, 블록이 끝나면 반환합니다. (거부되면 AdmissionRejected)"""
+        start = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(start)
+    
+    def acquire(self) -> float:
+        """
+        실행 슬롯을 얻습니다.
+        
+        Returns:
+            float: 슬롯을 얻은 시각 (release에 전달하면 작업 시간 평균에 반영)
+        
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 queue_timeout 안에 슬롯을 얻지 못했을 때
+        """
+        with self._condition:
+            if self.limit <= 0 or self.active < self.limit:
+                return self._admit()
+            
+            if self.waiting >= self.queue_size:
+                raise self._reject(f"{self.name} 작업 대기열이 가득 찼습니다. (동시 실행 {self.limit}, 대기열 {self.queue_size})")
+            
+            self.waiting += 1
+            try:
+                deadline = time.monotonic() + self.queue_timeout
+                while self.active >= self.limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._reject(f"{self.name} 작업 대기 시간({self.queue_timeout:g}초)이 초과되었습니다.")
+                    self._condition.wait(remaining)
+                return self._admit()
+            finally:
+                self.waiting -= 1
+    
+    def release(self, start: float = None):
+        """슬롯을 반환하고 대기 중인 요청 하나를 깨웁니다."""
+        with self._condition:
+            self.active -= 1
+            if start is not None:
+                elapsed = time.monotonic() - start
+                self._avg_seconds = elapsed if not self._avg_seconds else self._avg_seconds * 0.8 + elapsed * 0.2
+            self._condition.notify()
+    
+    def retry_after(self) -> int:
+        """대기열이 빠지는 데 걸릴 것으로 추정한 시간 (초, 최소 1)"""
+        if self.limit <= 0:
+            return 1
+        return max(1, math.ceil(self._avg_seconds * (self.waiting + 1) / self.limit))
+    
+    def info(self) -> Dict[str, Any]:
+        """현재 점유 상태 (동시 실행 수, 대기 수, 누적 허용/거부 수)"""
+        with self._condition:
+            return {
+                'limit': self.limit,
+                'queue_size': self.queue_size,
+                'active': self.active,
+                'waiting': self.waiting,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'avg_ms': round(self._avg_seconds * 1000, 1)
+            }
+    
+    def _admit(self) -> float:
+        self.active += 1
+        self.admitted += 1
+        return time.monotonic()
+    
+    def _reject(self, message: str) -> AdmissionRejected:
+        self.rejected += 1
+        return AdmissionRejected(self.name, self.retry_after(), message)
+
+_limiters: Dict[str, AdmissionLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_admission_limiter(work_class: str) -> AdmissionLimiter:
+    """설정값으로 생성한 작업 종류별 프로세스 전역 리미터를 반환합니다."""
+    limiter = _limiters.get(work_class)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(work_class)
+            if limiter is None:
+                limit_name, queue_name = ADMISSION_CLASSES[work_class]
+                limiter = AdmissionLimiter(
+                    work_class,
+                    limit=getattr(Config, limit_name),
+                    queue_size=getattr(Config, queue_name),
+                    queue_timeout=Config.ADMISSION_QUEUE_TIMEOUT
+                )
+                _limiters[work_class] = limiter
+    return limiter
+
+def admission_info() -> Dict[str, Any]:
+    """작업 종류별 현재 점유 상태"""
+    return {
+        'enabled': Config.ADMISSION_CONTROL_ENABLED,
+        'classes': {work_class: get_admission_limiter(work_class).info() for work_class in ADMISSION_CLASSES}
+    }
@@ -0,0 +1,134 @@
+import io
+import logging
+import os
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Callable, Iterator, List, Tuple
+from config.settings import Config
+from utils.file_utils import allowed_file
+
+logger = logging.getLogger(__name__)
+
+class BatchInputError(Exception):
+    """배치 요청 입력이 유효하지 않을 때 발생하는 예외"""
+
+class BatchService:
+    """여러 PDF 파일을 병렬로 처리하는 배치 서비스 클래스"""
+    
+    @staticmethod
+    def collect_pdf_files(files) -> List[Tuple[str, Callable[[], bytes]]]:
+        """
+        업로드된 파일 목록을 (파일명, PDF 데이터를 읽는 함수) 목록으로 변환합니다.
+        
+        ZIP 파일은 목차만 검사하여 PDF 항목으로 펼치고, 항목의 압축은 처리 작업 안에서
+        읽는 함수를 호출할 때 풉니다. PDF가 아닌 항목은 건너뜁니다. 직접 올린 PDF는
+        요청이 끝나면 업로드 스트림이 닫히므로 여기서 읽어 둡니다.
+        
+        Args:
+            files: werkzeug FileStorage 목록
+        
+        Returns:
+            List[Tuple[str, Callable[[], bytes]]]: (파일명, PDF 데이터를 읽는 함수) 목록
+        """
+        pdf_files = []
+        
+        for file in files:
+            if not file or file.filename == '':
+                continue
+            
+            if file.filename.lower().endswith('.zip'):
+                pdf_files.extend(BatchService._list_zip(file.read()))
+            elif allowed_file(file.filename):
+                pdf_files.append((file.filename, partial(bytes, file.read())))
+            else:
+                raise BatchInputError(f"PDF 또는 ZIP 파일만 업로드 가능합니다: {file.filename}")
+            
+            if len(pdf_files) > Config.BATCH_MAX_FILES:
+                raise BatchInputError(f"한 번에 처리할 수 있는 파일 수({Config.BATCH_MAX_FILES}개)를 초과했습니다.")
+        
+        if not pdf_files:
+            raise BatchInputError("처리할 PDF 파일이 없습니다.")
+        
+        return pdf_files
+    
+    @staticmethod
+    def _list_zip(zip_bytes: bytes) -> List[Tuple[str, Callable[[], bytes]]]:
+        """ZIP 목차에서 PDF 항목을 찾아 (파일명, 항목을 읽는 함수) 목록을 만듭니다."""
+        try:
+            archive = zipfile.ZipFile(io.BytesIO(zip_bytes))
+        except zipfile.BadZipFile:
+            raise BatchInputError("유효한 ZIP 파일이 아닙니다.")
+        
+        pdf_files = []
+        total_size = 0
+        with archive:
+            for info in archive.infolist():
+                name = info.filename
+                if info.is_dir() or name.startswith('__MACOSX/') or not allowed_file(name):
+                    continue
+                
+                # 압축 해제 크기 제한 (압축 폭탄 방지, 실제로 읽는 크기도 file_size를 넘지 않음)
+                total_size += info.file_size
+                if info.file_size > Config.MAX_CONTENT_LENGTH or total_size > Config.BATCH_MAX_UNZIPPED_SIZE:
+                    raise BatchInputError("ZIP 파일의 압축 해제 크기가 허용 범위를 초과했습니다.")
+                
+                pdf_files.append((os.path.basename(name), partial(BatchService._read_zip_entry, zip_bytes, info)))
+                if len(pdf_files) > Config.BATCH_MAX_FILES:
+                    raise BatchInputError(f"한 번에 처리할 수 있는 파일 수({Config.BATCH_MAX_FILES}개)를 초과했습니다.")
+        
+        return pdf_files
+    
+    @staticmethod
+    def _read_zip_entry(zip_bytes: bytes, info: zipfile.ZipInfo) -> bytes:
+        """ZIP 항목 하나의 압축을 풀어 읽습니다. (작업마다 ZIP을 따로 열어 스레드 간에 공유하지 않음)"""
+        try:
+            with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+                return archive.read(info)
+        except (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError, RuntimeError) as e:
+            raise BatchInputError(f"ZIP 항목을 읽을 수 없습니다: {info.filename} ({e})")
+    
+    @staticmethod
+    def resolve_concurrency(requested=None) -> int:
+        """
+        요청된 동시 처리 수를 설정 범위 안으로 맞춥니다.
+        
+        파일마다 PDF 추출 동시 실행 슬롯을 하나씩 차지하므로, 동시 실행 제한이 켜져 있으면
+        슬롯 수(Config.ADMISSION_PDF_EXTRACTION_LIMIT)의 절반까지만 사용하여 배치 하나가
+        모든 슬롯을 차지해 단건 업로드가 대기열에서 시간 초과(429)되지 않게 합니다.
+        (슬롯이 하나뿐이면 1)
+        """
+        if requested is None:
+            requested = Config.BATCH_DEFAULT_CONCURRENCY
+        limit = Config.BATCH_MAX_CONCURRENCY
+        if Config.ADMISSION_CONTROL_ENABLED and Config.ADMISSION_PDF_EXTRACTION_LIMIT > 0:
+            limit = min(limit, max(1, Config.ADMISSION_PDF_EXTRACTION_LIMIT // 2))
+        return max(1, min(int(requested), limit))
+    
+    @staticmethod
+    def process(pdf_files: List[Tuple[str, Callable[[], bytes]]], handler: Callable[[Callable[[], bytes]], Any],
+                concurrency: int) -> Iterator[Tuple[int, str, Any]]:
+        """
+        PDF 파일들을 병렬로 처리하고 완료되는 순서대로 결과를 반환합니다.
+        
+        Args:
+            pdf_files: (파일명, PDF 데이터를 읽는 함수) 목록
+            handler: PDF 데이터를 읽는 함수를 받아 결과를 반환하는 함수 (작업 안에서 읽음)
+            concurrency: 배치 내 동시 처리 수
+        
+        Yields:
+            Tuple[int, str, Any]: (입력 순서, 파일명, handler 결과)
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='pdf-batch')
+        try:
+            futures = {
+                executor.submit(handler, load): (index, filename)
+                for index, (filename, load) in enumerate(pdf_files)
+            }
+            for future in as_completed(futures):
+                index, filename = futures[future]
+                yield index, filename, future.result()
+        finally:
+            # 스트리밍 중 클라이언트 연결이 끊기면 남은 작업을 취소
+            executor.shutdown(wait=False, cancel_futures=True)
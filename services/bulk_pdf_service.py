@@ -0,0 +1,101 @@
+import json
+import re
+import zipfile
+from typing import Any, Dict, Iterator, List
+from config.settings import Config
+from services.batch_service import BatchInputError
+from services.pdf_render_pool import PDFRenderPool, get_pdf_render_pool
+
+class _ZipChunkSink:
+    """
+    ZipFile이 쓰는 데이터를 모아 두는 쓰기 전용 파일 객체
+    
+    seek할 수 없는 출력으로 취급되므로 ZipFile은 항목마다 데이터 디스크립터를 붙여
+    순서대로만 쓰며, 모인 조각은 take()로 꺼내 바로 전송할 수 있습니다.
+    """
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def take(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+class BulkPDFService:
+    """여러 이력서를 PDF로 일괄 생성하여 ZIP으로 묶는 서비스 클래스"""
+    
+    @staticmethod
+    def load_documents(payload: Any) -> List[Dict[str, Any]]:
+        """
+        일괄 생성 요청 데이터를 이력서 데이터 목록으로 변환합니다.
+        
+        Args:
+            payload: 이력서 데이터 목록 또는 {"resumes": [...]}
+        
+        Returns:
+            List[Dict[str, Any]]: 이력서 데이터 목록
+        
+        Raises:
+            BatchInputError: 목록이 비었거나, 항목이 객체가 아니거나, 최대 개수를 넘을 때
+        """
+        documents = payload.get('resumes') if isinstance(payload, dict) else payload
+        if not isinstance(documents, list) or not documents:
+            raise BatchInputError("이력서 데이터 목록(resumes)이 비어 있습니다.")
+        
+        if len(documents) > Config.BULK_PDF_MAX_DOCUMENTS:
+            raise BatchInputError(f"한 번에 생성할 수 있는 이력서 수({Config.BULK_PDF_MAX_DOCUMENTS}개)를 초과했습니다.")
+        
+        for index, resume_data in enumerate(documents):
+            if not isinstance(resume_data, dict):
+                raise BatchInputError(f"{index}번째 이력서 데이터가 JSON 객체가 아닙니다.")
+        
+        return documents
+    
+    @staticmethod
+    def entry_name(index: int, resume_data: Dict[str, Any]) -> str:
+        """ZIP 항목 이름 (입력 순서 + 이름, 파일명에 쓸 수 없는 문자는 '_'로 치환)"""
+        name = re.sub(r'[^\w.-]+', '_', str(resume_data.get('name') or 'resume')).strip('._') or 'resume'
+        return f'{index + 1:04d}_{name[:50]}.pdf'
+    
+    @staticmethod
+    def stream_zip(documents: List[Dict[str, Any]], pool: PDFRenderPool = None,
+                   compact: bool = None) -> Iterator[bytes]:
+        """
+        이력서들을 렌더러 프로세스 풀에서 렌더링하면서 ZIP 데이터를 조각 단위로 반환합니다.
+        
+        렌더링이 끝난 PDF부터 ZIP 항목으로 내보내므로 전체 렌더링을 기다리지 않고 전송을
+        시작할 수 있습니다. 마지막 항목인 manifest.json에 이력서별 처리 결과를 기록합니다.
+        
+        Args:
+            documents: 이력서 데이터 목록
+            pool: 렌더러 풀 (기본값: 프로세스 전역 풀)
+            compact: 크기를 줄인 PDF로 생성할지 여부 (기본값: Config.PDF_COMPACT_DEFAULT)
+        
+        Yields:
+            bytes: ZIP 데이터 조각
+        """
+        pool = pool or get_pdf_render_pool()
+        sink = _ZipChunkSink()
+        manifest = [None] * len(documents)
+        
+        with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for index, pdf_bytes, error in pool.render_many(documents, compact=compact):
+                filename = BulkPDFService.entry_name(index, documents[index])
+                if error is None:
+                    archive.writestr(filename, pdf_bytes)
+                    manifest[index] = {'index': index, 'filename': filename, 'status': 'completed', 'file_size': len(pdf_bytes)}
+                else:
+                    manifest[index] = {'index': index, 'filename': filename, 'status': 'failed', 'error': error}
+                yield sink.take()
+            
+            archive.writestr('manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2))
+        
+        yield sink.take()
@@ -0,0 +1,139 @@
+import json
+import math
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from config.settings import Config
+
+# 정규화 시 끝에서 제거하는 일반 접미사 (학교명/전공명마다 반복되어 유사도를 부풀리는 부분)
+_GENERIC_SUFFIXES = {
+    'school': ('university', 'univ', '대학교', '대학', '대'),
+    'major': ('department', 'major', '전공', '과', '부')
+}
+
+# 문자 n-gram 크기 (앞뒤 경계 문자 포함)
+_NGRAM_SIZE = 2
+
+class LabelMatch(NamedTuple):
+    """라벨 조회 결과 (라벨값, 표준 이름, 일치한 이름/별칭, 유사도, 정확 일치 여부)"""
+    label: float
+    name: str
+    matched: str
+    score: float
+    exact: bool
+
+class LabelResolver:
+    """
+    학교/전공 이름 → 모델 라벨값 변환기
+    
+    라벨 테이블(표준 이름, 별칭)을 한 번만 읽어 정규화한 이름의 정확 일치 해시와
+    문자 n-gram 역색인을 만듭니다. 정확 일치는 해시 조회 한 번으로, 오타나 표기
+    차이는 질의의 드문 n-gram을 공유하는 이름만 Dice 계수로 비교하여 찾습니다.
+    """
+    
+    def __init__(self, spec: Dict[str, List[Dict[str, Any]]]):
+        # 종류별 (라벨값, 표준 이름, 원래 이름/별칭, n-gram 집합) 목록
+        self._names: Dict[str, List[Tuple[float, str, str, FrozenSet[str]]]] = {}
+        self._exact: Dict[str, Dict[str, int]] = {}
+        self._index: Dict[str, Dict[str, List[int]]] = {}
+        
+        for kind, entries in spec.items():
+            names, exact, index = [], {}, defaultdict(list)
+            for entry in entries:
+                for name in [entry['name']] + entry.get('aliases', []):
+                    key = self.normalize(kind, name)
+                    if not key:
+                        continue
+                    name_no = len(names)
+                    grams = self._ngrams(key)
+                    names.append((float(entry['label']), entry['name'], name, grams))
+                    exact.setdefault(key, name_no)
+                    for gram in grams:
+                        index[gram].append(name_no)
+            self._names[kind], self._exact[kind], self._index[kind] = names, exact, dict(index)
+    
+    @classmethod
+    def load(cls, path: str = None) -> 'LabelResolver':
+        """데이터 파일에서 변환기를 생성합니다. (기본값: Config.LABEL_TABLE_PATH)"""
+        with open(path or Config.LABEL_TABLE_PATH, encoding='utf-8') as spec_file:
+            return cls(json.load(spec_file))
+    
+    @property
+    def kinds(self) -> List[str]:
+        """지원하는 라벨 종류 (예: school, major)"""
+        return list(self._names)
+    
+    def resolve(self, kind: str, text: str, threshold: float = None) -> Optional[LabelMatch]:
+        """
+        자유 입력 텍스트를 라벨로 변환합니다.
+        
+        Args:
+            kind: 라벨 종류 ('school' 또는 'major')
+            text: 학교명/전공명 (한글, 영문, 약칭, 공백/기호 차이 허용)
+            threshold: 유사 일치로 인정할 최소 유사도 (기본값: Config.LABEL_MATCH_THRESHOLD)
+        
+        Returns:
+            Optional[LabelMatch]: 가장 유사한 라벨 (기준 미달이면 None)
+        
+        Raises:
+            ValueError: 지원하지 않는 라벨 종류일 때
+        """
+        if kind not in self._names:
+            raise ValueError(f"지원하지 않는 라벨 종류입니다: {kind} (가능한 종류: {', '.join(self._names)})")
+        
+        key = self.normalize(kind, text or '')
+        if not key:
+            return None
+        
+        names = self._names[kind]
+        name_no = self._exact[kind].get(key)
+        if name_no is not None:
+            label, name, matched, _ = names[name_no]
+            return LabelMatch(label, name, matched, 1.0, True)
+        
+        if threshold is None:
+            threshold = Config.LABEL_MATCH_THRESHOLD
+        threshold = min(max(threshold, 0.0), 1.0)
+        
+        # 접두 필터링: 유사도가 기준 이상이면 공통 n-gram이 min_common개 이상이므로,
+        # 드문 n-gram부터 (전체 - min_common + 1)개 중 하나는 반드시 공유함
+        grams = self._ngrams(key)
+        index = self._index[kind]
+        min_common = math.ceil(threshold * len(grams) / (2 - threshold) - 1e-9)
+        rare_grams = sorted(grams, key=lambda gram: len(index.get(gram, ())))[:len(grams) - min_common + 1]
+        
+        candidates = set()
+        for gram in rare_grams:
+            candidates.update(index.get(gram, ()))
+        
+        best_no, best_score = None, 0.0
+        for candidate in sorted(candidates):
+            candidate_grams = names[candidate][3]
+            score = 2 * len(grams & candidate_grams) / (len(grams) + len(candidate_grams))
+            if score > best_score:
+                best_no, best_score = candidate, score
+        
+        if best_no is None or best_score < threshold:
+            return None
+        
+        label, name, matched, _ = names[best_no]
+        return LabelMatch(label, name, matched, round(best_score, 3), False)
+    
+    @staticmethod
+    def normalize(kind: str, text: str) -> str:
+        """호환 문자 정규화, 소문자 변환, 공백/기호 제거 후 일반 접미사를 한 번 제거합니다."""
+        text = unicodedata.normalize('NFKC', text).lower()
+        key = ''.join(char for char in text if char.isalnum())
+        for suffix in _GENERIC_SUFFIXES.get(kind, ()):
+            if key.endswith(suffix) and len(key) > len(suffix):
+                return key[:-len(suffix)]
+        return key
+    
+    @staticmethod
+    def _ngrams(key: str) -> FrozenSet[str]:
+        """앞뒤 경계 문자를 붙인 문자 n-gram 집합"""
+        padded = f'^{key}$'
+        return frozenset(padded[i:i + _NGRAM_SIZE] for i in range(len(padded) - _NGRAM_SIZE + 1))
+
+# 프로세스 전역 라벨 변환기 (임포트 시 1회 색인)
+LABELS = LabelResolver.load()
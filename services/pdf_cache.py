@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from config.settings import Config
+from services.result_cache import ResultCache
+from services.resume_template import TEMPLATE_VERSION
+
+logger = logging.getLogger(__name__)
+
+class _DiskLRU:
+    """
+    파일 하나당 PDF 하나를 저장하는 디스크 LRU 계층
+    
+    접근 순서는 파일 수정 시각으로 기록하므로 프로세스를 다시 시작해도 유지되며,
+    여러 프로세스가 같은 디렉터리를 공유해도 다른 프로세스가 지운 파일은 미스로 처리합니다.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, int]' = OrderedDict()
+        self._total = 0
+        
+        os.makedirs(directory, exist_ok=True)
+        # 기존 파일을 접근 시각 순으로 색인
+        existing = []
+        for name in os.listdir(directory):
+            if not name.endswith('.pdf'):
+                continue
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except FileNotFoundError:
+                continue
+            existing.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(existing):
+            self._entries[key] = size
+            self._total += size
+        self._evict()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as pdf_file:
+                data = pdf_file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._total -= self._entries.pop(key, 0)
+            return None
+        
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = len(data)
+                self._total += len(data)
+            self._entries.move_to_end(key)
+        return data
+    
+    def put(self, key: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 함
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"PDF 캐시 파일 저장 실패: {str(e)}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            return
+        
+        with self._lock:
+            self._total += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+    
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+    
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._entries), 'bytes': self._total, 'max_bytes': self.max_bytes}
+    
+    def _evict(self):
+        """전체 크기가 상한 이하가 될 때까지 가장 오래 사용하지 않은 파일을 삭제합니다. (잠금 안에서 호출)"""
+        while self._total > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+    
+    def _remove(self, key: str):
+        self._total -= self._entries.pop(key, 0)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pdf')
+
+class RenderedPDFCache:
+    """
+    생성된 이력서 PDF 캐시 (메모리 LRU + 디스크 LRU)
+    
+    키는 정규화한 이력서 JSON과 템플릿 버전, 렌더링 옵션의 해시입니다. 캐시 경로의
+    렌더링은 생성 시각과 문서 ID를 고정하므로 같은 키는 항상 같은 바이트가 되며,
+    키를 그대로 강한 ETag로 사용할 수 있습니다.
+    """
+    
+    def __init__(self, memory_items: int = 128, directory: str = None, disk_max_bytes: int = 0):
+        self.memory = ResultCache(memory_items)
+        self.disk = _DiskLRU(directory, disk_max_bytes) if directory and disk_max_bytes > 0 else None
+    
+    @staticmethod
+    def key(resume_data: Any, **options) -> str:
+        """
+        이력서 데이터와 렌더링 옵션으로 캐시 키(ETag 값)를 만듭니다.
+        
+        Args:
+            resume_data: 이력서 데이터 (JSON 직렬화 가능)
+            **options: 출력에 영향을 주는 렌더링 옵션 (예: font_name)
+        """
+        canonical = json.dumps(
+            {'data': resume_data, 'options': options, 'template': TEMPLATE_VERSION},
+            sort_keys=True, separators=(',', ':'), ensure_ascii=False
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        캐시된 PDF를 찾습니다.
+        
+        Returns:
+            (PDF 데이터, 적중 계층 'memory' 또는 'disk'), 없으면 (None, None)
+        """
+        data = self.memory.get(key)
+        if data is not None:
+            return data, 'memory'
+        
+        if self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.put(key, data)
+                return data, 'disk'
+        
+        return None, None
+    
+    def put(self, key: str, data: bytes):
+        self.memory.put(key, data)
+        if self.disk is not None:
+            self.disk.put(key, data)
+    
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def info(self) -> Dict[str, Any]:
+        """계층별 캐시 상태"""
+        return {
+            'memory': self.memory.info(),
+            'disk': self.disk.info() if self.disk is not None else None
+        }
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_pdf_cache() -> RenderedPDFCache:
+    """설정값으로 생성한 프로세스 전역 PDF 캐시를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RenderedPDFCache(
+                    memory_items=Config.PDF_CACHE_MEMORY_ITEMS,
+                    directory=Config.PDF_CACHE_DIR,
+                    disk_max_bytes=Config.PDF_CACHE_DISK_MAX_MB * 1024 * 1024
+                )
+    return _cache
@@ -0,0 +1,67 @@
+import zlib
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen.canvas import Canvas
+
+class _FlateMaxCompress:
+    """최대 압축 수준(9)의 FlateDecode 필터 (ASCII85 인코딩 없이 바이너리로 저장)"""
+    pdfname = 'FlateDecode'
+    
+    def encode(self, text):
+        if isinstance(text, str):
+            text = text.encode('utf8')
+        return zlib.compress(text, 9)
+    
+    def decode(self, encoded):
+        return zlib.decompress(encoded)
+
+_FLATE_MAX = _FlateMaxCompress()
+
+class _EmptyInfo(pdfdoc.PDFInfo):
+    """제목, 작성자, 생성 프로그램, 생성/수정 시각을 쓰지 않는 빈 문서 정보 사전"""
+    
+    def format(self, document):
+        return pdfdoc.PDFDictionary({}).format(document)
+
+class CompactCanvas(Canvas):
+    """
+    크기를 줄인 PDF를 쓰는 캔버스 (SimpleDocTemplate.build의 canvasmaker로 사용)
+    
+    - 페이지 내용 스트림: ASCII85 인코딩 없이 최대 수준으로 Flate 압축
+    - 리소스: 이미지/그래픽 상태가 없는 페이지는 폰트 리소스 사전 하나를 참조로 공유하고,
+      PDF 1.4부터 쓰이지 않는 ProcSet과 빈 페이지 전환(Trans), 기본값인 Rotate 0은 생략
+    - 메타데이터: 문서 정보 사전(Producer, Creator, 날짜 등)을 비움
+    
+    TTF 폰트는 등록 방식(pdf_fonts.load_ttf_font)에 따라 이미 사용한 글리프만 포함됩니다.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        kwargs['pageCompression'] = 1
+        super().__init__(*args, **kwargs)
+        self._doc.info = _EmptyInfo()
+        self._shared_resources = None
+    
+    def showPage(self):
+        super().showPage()
+        page = self._doc.Pages.pages[-1]
+        
+        contents = pdfdoc.PDFStream()
+        contents.filters = [_FLATE_MAX]
+        contents.content = page.stream
+        page.Contents = contents
+        
+        if page.Trans is not None and not page.Trans.dict:
+            page.Trans = None
+        if not page.Rotate:
+            page.Rotate = None
+        
+        if not (page.XObjects or getattr(page, 'ExtGState', None) or page._shadingUsed or page._colorsUsed):
+            page.Resources = self._page_resources()
+    
+    def _page_resources(self):
+        """폰트만 사용하는 페이지가 공유하는 리소스 사전 참조"""
+        if self._shared_resources is None:
+            resources = pdfdoc.PDFResourceDictionary()
+            resources.basicFonts()
+            resources.ProcSet = []
+            self._shared_resources = self._doc.Reference(resources, 'CompactPageResources')
+        return self._shared_resources
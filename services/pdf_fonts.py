@@ -0,0 +1,160 @@
+import io
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+import pdfplumber
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+_font_name: Optional[str] = None
+_font_info: Dict[str, Any] = {}
+_font_lock = threading.Lock()
+
+# 폰트 등록 시 왕복 검사에 사용하는 문장 (그린 뒤 추출한 텍스트가 같아야 함)
+ROUNDTRIP_SAMPLE = '홍길동 백엔드 개발자 이력서 Python 2020.03'
+
+# 폰트 등록 시 한글 글리프가 있는지 확인하는 글자 (ToUnicode 왕복만으로는 글리프 누락을 알 수 없음)
+HANGUL_COVERAGE_SAMPLE = '가한'
+
+def load_ttf_font(name: str, path: str) -> TTFont:
+    """
+    TTF 폰트를 읽습니다.
+    
+    글꼴 파일의 체크섬 검사는 건너뛰고(validate=0), 문서에는 실제로 사용한 글리프만
+    서브셋으로 포함하도록 ASCII 글리프를 미리 넣지 않습니다(asciiReadable=False).
+    읽은 글리프 매핑과 폭(메트릭)은 폰트 객체에 보관되어 이후 모든 문서가 공유합니다.
+    """
+    return TTFont(name, path, validate=0, asciiReadable=False)
+
+def has_hangul_glyphs(font: TTFont, chars: str = HANGUL_COVERAGE_SAMPLE) -> bool:
+    """폰트의 문자 → 글리프 매핑에 chars의 모든 글자가 있는지 확인합니다."""
+    return all(ord(char) in font.face.charToGlyph for char in chars)
+
+def extract_roundtrip_text(font_name: str, text: str = ROUNDTRIP_SAMPLE) -> str:
+    """
+    font_name으로 text 한 줄을 그린 PDF를 만들고, 그 PDF에서 다시 추출한 텍스트를 반환합니다.
+    
+    서브셋 임베딩 후에도 글리프의 유니코드 매핑(ToUnicode)이 유지되어 생성한 PDF의
+    텍스트를 복사/검색/파싱할 수 있는지 확인하는 데 사용합니다.
+    """
+    buffer = io.BytesIO()
+    pdf_canvas = canvas.Canvas(buffer)
+    pdf_canvas.setFont(font_name, 12)
+    pdf_canvas.drawString(72, 720, text)
+    pdf_canvas.save()
+    
+    with pdfplumber.open(io.BytesIO(buffer.getvalue())) as pdf:
+        return (pdf.pages[0].extract_text() or '').strip()
+
+def get_pdf_font_name() -> str:
+    """
+    PDF 생성에 사용할 폰트 이름을 반환합니다.
+    
+    처음 호출될 때 한 번만 한글 TTF 폰트(Config.PDF_KOREAN_FONT_PATH)를 등록하며,
+    굵은 글꼴(Config.PDF_KOREAN_FONT_BOLD_PATH)이 없으면 일반 글꼴을 <b>에도 사용합니다.
+    폰트 파일이 없으면 경고를 남기고 Config.PDF_FONT_NAME(한글 미지원)을 사용하며,
+    폰트에 한글 글리프가 없으면 Config.PDF_KOREAN_CID_FONT_NAME(한글 CID 폰트)을 사용합니다.
+    """
+    global _font_name
+    if _font_name is None:
+        with _font_lock:
+            if _font_name is None:
+                _font_name = _register_korean_font()
+    return _font_name
+
+def get_pdf_font_info() -> Dict[str, Any]:
+    """등록된 폰트 정보 (이름, 파일 경로, 글리프 수, 등록 소요 시간, 한글 글리프 여부, 텍스트 왕복 검사 결과)"""
+    get_pdf_font_name()
+    return dict(_font_info)
+
+def _register_korean_font() -> str:
+    name = Config.PDF_KOREAN_FONT_NAME
+    path = Config.PDF_KOREAN_FONT_PATH
+    if not path or not os.path.exists(path):
+        logger.warning(
+            f"한글 폰트 파일을 찾을 수 없어 {Config.PDF_FONT_NAME} 폰트를 사용합니다 "
+            f"(PDF_KOREAN_FONT_PATH={path}). 한글이 표시되지 않을 수 있습니다."
+        )
+        _font_info.update({'name': Config.PDF_FONT_NAME, 'path': None})
+        return Config.PDF_FONT_NAME
+    
+    start = time.perf_counter()
+    try:
+        font = load_ttf_font(name, path)
+    except Exception as e:
+        logger.warning(f"한글 폰트를 읽을 수 없어 {Config.PDF_FONT_NAME} 폰트를 사용합니다 ({path}): {str(e)}")
+        _font_info.update({'name': Config.PDF_FONT_NAME, 'path': None})
+        return Config.PDF_FONT_NAME
+    
+    # 한글 글리프가 없는 폰트는 왕복 검사는 통과해도 한글이 빈 글리프로 그려지므로 CID 폰트를 사용
+    if not has_hangul_glyphs(font):
+        logger.warning(
+            f"폰트에 한글 글리프가 없어 {Config.PDF_KOREAN_CID_FONT_NAME} CID 폰트를 사용합니다 ({path})."
+        )
+        return _register_cid_font(path)
+    pdfmetrics.registerFont(font)
+    
+    bold_name = name
+    bold_path = Config.PDF_KOREAN_FONT_BOLD_PATH
+    if bold_path and os.path.exists(bold_path):
+        bold_font = load_ttf_font(f'{name}-Bold', bold_path)
+        if has_hangul_glyphs(bold_font):
+            bold_name = bold_font.fontName
+            pdfmetrics.registerFont(bold_font)
+        else:
+            logger.warning(f"굵은 폰트에 한글 글리프가 없어 일반 폰트를 굵은 글꼴로 사용합니다 ({bold_path}).")
+    
+    _add_family_mapping(name, bold_name)
+    
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    
+    _font_info.update({
+        'name': name,
+        'path': path,
+        'bold_path': bold_path if bold_name != name else None,
+        'glyphs': font.face.numGlyphs,
+        'register_ms': elapsed_ms,
+        'hangul_glyphs': True,
+        'text_roundtrip': _check_roundtrip(name, path)
+    })
+    logger.info(f"한글 폰트 등록 완료: {name} ({path}, {font.face.numGlyphs} glyphs, {elapsed_ms}ms)")
+    return name
+
+def _register_cid_font(path: str) -> str:
+    """한글 CID 폰트(Config.PDF_KOREAN_CID_FONT_NAME)를 등록합니다. (굵은 글꼴 없음)"""
+    name = Config.PDF_KOREAN_CID_FONT_NAME
+    pdfmetrics.registerFont(UnicodeCIDFont(name))
+    _add_family_mapping(name, name)
+    
+    _font_info.update({
+        'name': name,
+        'path': None,
+        'rejected_path': path,
+        'hangul_glyphs': False,
+        'text_roundtrip': _check_roundtrip(name, name)
+    })
+    return name
+
+def _add_family_mapping(name: str, bold_name: str):
+    """<b>, <i> 태그가 같은 계열의 글꼴을 찾을 수 있도록 매핑합니다. (기울임꼴은 없으므로 일반/굵은 글꼴 사용)"""
+    for bold, italic, font_name in ((0, 0, name), (1, 0, bold_name), (0, 1, name), (1, 1, bold_name)):
+        addMapping(name, bold, italic, font_name)
+
+def _check_roundtrip(name: str, source: str) -> bool:
+    """생성한 PDF에서 한글 텍스트를 그대로 다시 추출할 수 있는지 확인합니다. (실패해도 폰트는 사용)"""
+    try:
+        roundtrip_ok = extract_roundtrip_text(name) == ROUNDTRIP_SAMPLE
+    except Exception as e:
+        logger.warning(f"한글 폰트 텍스트 왕복 검사 중 오류가 발생했습니다 ({source}): {str(e)}")
+        roundtrip_ok = False
+    if not roundtrip_ok:
+        logger.warning(f"한글 폰트로 생성한 PDF에서 텍스트를 그대로 추출할 수 없습니다 ({source}).")
+    return roundtrip_ok
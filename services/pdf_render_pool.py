@@ -0,0 +1,133 @@
+import atexit
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+def _init_renderer():
+    """
+    렌더러 프로세스 초기화 함수
+    
+    템플릿(스타일, 정적 플로어블)을 만들고 짧은 문서를 한 번 렌더링하여 폰트 메트릭과
+    reportlab 모듈을 미리 읽어 두므로, 첫 작업부터 렌더링 비용만 듭니다.
+    """
+    from services.pdf_service import PDFOutput
+    from services.resume_template import get_resume_template
+    
+    get_resume_template().render({'name': 'warmup', 'skills': ['warmup']}, PDFOutput())
+
+def _render_resume(resume_data: Dict[str, Any], compact: Optional[bool] = None, invariant: bool = False) -> bytes:
+    """렌더러 프로세스에서 이력서 하나를 PDF로 렌더링합니다. (BULKHEAD_ENABLED여도 렌더러 풀로 다시 보내지 않음)"""
+    from services.pdf_service import PDFService
+    
+    return PDFService._render_bytes(resume_data, invariant=invariant, compact=compact)
+
+class PDFRenderPool:
+    """
+    이력서 PDF 일괄 생성용 렌더러 프로세스 풀
+    
+    reportlab 렌더링은 순수 파이썬 연산이라 스레드로는 병렬화되지 않으므로 별도 프로세스에서
+    렌더링합니다. 렌더러 프로세스는 풀이 종료될 때까지 유지되며, 시작 시 템플릿과 폰트를
+    미리 읽어 둡니다. Config.BULKHEAD_ENABLED가 켜져 있으면 단건 PDF 생성도 이 풀에서 렌더링합니다.
+    """
+    
+    def __init__(self, processes: int = 2):
+        self.processes = max(1, processes)
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+    
+    def render(self, resume_data: Dict[str, Any], invariant: bool = False,
+               compact: Optional[bool] = None) -> bytes:
+        """
+        이력서 하나를 렌더러 프로세스에서 렌더링하고 결과를 기다립니다.
+        
+        Args:
+            resume_data: 이력서 데이터
+            invariant: True이면 생성 시각과 문서 ID를 고정하여 렌더링
+            compact: 크기를 줄인 PDF로 생성할지 여부 (기본값: Config.PDF_COMPACT_DEFAULT)
+        
+        Returns:
+            bytes: PDF 데이터 (렌더링 오류는 그대로 전달)
+        """
+        return self._submit(resume_data, compact, invariant).result()
+    
+    def render_many(self, documents: Iterable[Dict[str, Any]], max_pending: Optional[int] = None,
+                    compact: Optional[bool] = None) -> Iterator[Tuple[int, Optional[bytes], Optional[str]]]:
+        """
+        이력서들을 렌더러 프로세스에서 렌더링하고 완료되는 순서대로 결과를 반환합니다.
+        
+        렌더링 중인 작업은 max_pending개로 제한하므로 결과를 소비하는 속도가 느려도
+        완성된 PDF가 메모리에 쌓이지 않습니다.
+        
+        Args:
+            documents: 이력서 데이터 목록
+            max_pending: 동시에 제출하는 최대 작업 수 (기본값: 프로세스 수의 2배)
+            compact: 크기를 줄인 PDF로 생성할지 여부 (기본값: Config.PDF_COMPACT_DEFAULT)
+        
+        Yields:
+            Tuple[int, Optional[bytes], Optional[str]]: (입력 순서, PDF 데이터, 오류 메시지)
+        """
+        max_pending = max_pending or self.processes * 2
+        documents = enumerate(documents)
+        pending = {}
+        try:
+            while True:
+                for index, resume_data in documents:
+                    pending[self._submit(resume_data, compact)] = index
+                    if len(pending) >= max_pending:
+                        break
+                
+                if not pending:
+                    return
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        yield index, future.result(), None
+                    except Exception as e:
+                        logger.warning(f"이력서 PDF 렌더링 실패 (index={index}): {str(e)}")
+                        yield index, None, str(e)
+        finally:
+            # 스트리밍 중 클라이언트 연결이 끊기면 남은 작업을 취소
+            for future in pending:
+                future.cancel()
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_renderer
+        )
+    
+    def _submit(self, resume_data, compact=None, invariant=False):
+        """작업을 제출합니다. 렌더러 프로세스가 비정상 종료되어 풀이 깨졌으면 새로 만듭니다."""
+        with self._lock:
+            try:
+                return self._executor.submit(_render_resume, resume_data, compact, invariant)
+            except BrokenProcessPool:
+                logger.warning("렌더러 프로세스 풀이 비정상 종료되어 다시 시작합니다.")
+                self._executor = self._create_executor()
+                return self._executor.submit(_render_resume, resume_data, compact, invariant)
+    
+    def shutdown(self):
+        """렌더러 프로세스를 모두 종료합니다."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pdf_render_pool() -> PDFRenderPool:
+    """설정값으로 생성한 프로세스 전역 렌더러 풀을 반환합니다."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PDFRenderPool(processes=Config.PDF_RENDER_PROCESSES)
+                atexit.register(_pool.shutdown)
+    return _pool
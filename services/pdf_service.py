@@ -1,134 +1,772 @@
 import pdfplumber
 import tempfile
 import io
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+import itertools
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple
+from pdfminer.pdfdocument import PDFDocument, PDFPasswordIncorrect
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, resolve1
+from pdfplumber.page import PDFPageAggregatorWithMarkedContent
 from config.settings import Config
+from services.pdf_worker_pool import get_pdf_worker_pool
+from services.pdf_render_pool import get_pdf_render_pool
+from services.pdf_cache import RenderedPDFCache, get_pdf_cache
+from services.pdf_fonts import get_pdf_font_name
+from services.resume_template import get_resume_template
+
+# 분석 API로 요청할 수 있는 결과물 (응답 순서)
+PDF_ANALYSIS_ARTIFACTS = ('text', 'words', 'tables', 'metadata')
+
+# 콘텐츠 스트림의 텍스트 출력 연산자 (Tj, TJ, ', ")
+_TEXT_SHOW_PATTERN = re.compile(rb'(?<![A-Za-z])T[jJ](?![A-Za-z])|\)\s*[\'"]')
+
+class _TextOnlyPageAggregator(PDFPageAggregatorWithMarkedContent):
+    """텍스트 추출에 필요 없는 도형/이미지 객체를 만들지 않는 레이아웃 수집기"""
+    
+    def paint_path(self, *args, **kwargs):
+        # 선, 사각형, 곡선 객체를 생성하지 않음
+        pass
+    
+    def render_image(self, *args, **kwargs):
+        # 이미지 객체를 생성하지 않음
+        pass
+
+# 굵은 글꼴 이름 (서브셋 접두어 제외, 예: ABCDEF+NanumGothicBold, Helvetica-Bold, Arial,Bold)
+_BOLD_FONT_PATTERN = re.compile(r'bold|black|heavy|semibold|demi|[-,]b$', re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _is_bold_font(fontname: str) -> bool:
+    """글꼴 이름으로 굵은 글꼴인지 판단합니다."""
+    return bool(_BOLD_FONT_PATTERN.search(fontname.rsplit('+', 1)[-1]))
+
+class TextLine(NamedTuple):
+    """글꼴 크기와 굵기 정보가 있는 텍스트 줄"""
+    text: str
+    size: float
+    bold: bool
+    page_number: int
+    top: float
+
+class LineExtraction(NamedTuple):
+    """추출한 텍스트와 같은 패스에서 만든 줄 목록"""
+    text: str
+    lines: List[TextLine]
+
+class ParsedPDF(NamedTuple):
+    """추출한 텍스트와 이력서 파싱 결과 (텍스트가 없으면 result는 None)"""
+    text: str
+    result: Any
+    timings_ms: Dict[str, float]
+
+class PDFOutput:
+    """
+    렌더링된 PDF 데이터를 복사 없이 보관하는 쓰기 전용 파일 객체
+    
+    reportlab은 완성된 PDF 데이터를 bytes로 만들어 write()하므로, BytesIO에 복사한 뒤
+    getvalue()로 다시 복사하는 대신 전달받은 bytes 객체를 그대로 보관합니다.
+    chunks는 WSGI 응답 본문으로 바로 사용할 수 있습니다.
+    """
+    
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+    
+    def write(self, data) -> int:
+        # bytes가 아닌 버퍼(bytearray, memoryview)는 이후 변경될 수 있으므로 복사
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self.chunks.append(data)
+        self.size += len(data)
+        return len(data)
 
 class PDFService:
     """PDF 관련 서비스 클래스"""
     
     @staticmethod
-    def extract_text_from_pdf(pdf_path):
-        """PDF 파일에서 텍스트를 추출합니다."""
+    def use_worker_pool():
+        """
+        PDF 추출/파싱 작업을 워커 프로세스 풀에서 실행할지 여부
+        (Config.PDF_WORKER_POOL_ENABLED 또는 Config.BULKHEAD_ENABLED)
+        
+        워커 풀은 작업마다 제한 시간과 메모리 상한을 적용하는 추출 격리용 풀이며,
+        PDF 렌더링은 Config.BULKHEAD_ENABLED에 따라 렌더러 프로세스 풀에서 실행합니다.
+        """
+        return Config.PDF_WORKER_POOL_ENABLED or Config.BULKHEAD_ENABLED
+    
+    @staticmethod
+    def extract_text_from_pdf(pdf_path, lean=None):
+        """
+        PDF 파일에서 텍스트를 추출합니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
+        """
+        if PDFService.use_worker_pool():
+            with open(pdf_path, 'rb') as pdf_file:
+                return PDFService.extract_text_from_bytes(pdf_file.read(), lean=lean)
+        
+        return PDFService._extract_text(pdf_path, lean)
+    
+    @staticmethod
+    def extract_text_from_bytes(pdf_bytes, lean=None):
+        """
+        PDF 데이터에서 텍스트를 추출합니다.
+        
+        워커 풀을 사용하면(use_worker_pool) 별도 워커 프로세스에서 추출하며,
+        제한 시간 초과 시 PDFExtractionTimeout, 메모리 상한 초과 시
+        PDFExtractionMemoryExceeded가 발생합니다.
+        
+        Args:
+            pdf_bytes: PDF 데이터
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
+        """
+        if PDFService.use_worker_pool():
+            return get_pdf_worker_pool().extract_text(pdf_bytes, lean=lean)
+        
+        return PDFService._extract_text(io.BytesIO(pdf_bytes), lean)
+    
+    @staticmethod
+    def parse_resume_from_pdf(pdf_path, fields=None, lean=None):
+        """
+        PDF 파일에서 텍스트를 추출하고 이력서를 파싱합니다.
+        
+        Config.RESUME_STRUCTURAL_SECTIONS가 켜져 있으면 줄별 글꼴 정보로 섹션을 나눕니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            fields: 파싱할 필드 (기본값: 전체 필드)
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
+            
+        Returns:
+            ParsedPDF: 추출된 텍스트, 파싱 결과(ParseResult), 단계별 소요 시간(extract, parse)
+        """
+        if PDFService.use_worker_pool():
+            with open(pdf_path, 'rb') as pdf_file:
+                return PDFService.parse_resume_from_bytes(pdf_file.read(), fields, lean)
+        
+        return PDFService._parse_resume(pdf_path, fields, lean)
+    
+    @staticmethod
+    def parse_resume_from_bytes(pdf_bytes, fields=None, lean=None):
+        """
+        PDF 데이터에서 텍스트를 추출하고 이력서를 파싱합니다.
+        
+        워커 풀을 사용하면(use_worker_pool) 추출과 파싱을 한 번의 작업으로 워커 프로세스에서
+        수행하므로, 줄 목록을 요청 프로세스로 보내지 않고 파싱도 요청 프로세스의 GIL을 잡지 않습니다.
+        """
+        if PDFService.use_worker_pool():
+            return get_pdf_worker_pool().run('parse_resume', pdf_bytes, fields=fields, lean=lean)
+        
+        return PDFService._parse_resume(io.BytesIO(pdf_bytes), fields, lean)
+    
+    @staticmethod
+    def _parse_resume(source, fields=None, lean=None):
+        """현재 프로세스에서 텍스트(또는 줄 목록)를 추출하고 이력서를 파싱합니다."""
+        from services.resume_parser_service import ResumeParserService
+        
+        timings = {}
+        start = time.perf_counter()
+        if Config.RESUME_STRUCTURAL_SECTIONS:
+            extraction = PDFService._extract_lines(source, lean)
+            text = extraction.text
+        else:
+            text = PDFService._extract_text(source, lean)
+        timings['extract'] = round((time.perf_counter() - start) * 1000, 3)
+        if not text:
+            return ParsedPDF(text, None, timings)
+        
+        start = time.perf_counter()
+        if Config.RESUME_STRUCTURAL_SECTIONS:
+            result = ResumeParserService.parse_resume_lines_timed(extraction.lines, fields)
+        else:
+            result = ResumeParserService.parse_resume_timed(text, fields)
+        timings['parse'] = round((time.perf_counter() - start) * 1000, 3)
+        return ParsedPDF(text, result, timings)
+    
+    @staticmethod
+    def parse_resume_streaming_from_pdf(pdf_path, fields=None, lean=None):
+        """
+        PDF 파일을 페이지 단위로 읽으며 이력서를 파싱하고, 요청한 필드가 모두
+        채워지면 남은 페이지는 읽지 않습니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            fields: 파싱할 필드 (기본값: 전체 필드)
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
+            
+        Returns:
+            StreamingParseResult: 파싱 결과, 읽은 텍스트와 페이지 수, 조기 종료 여부
+        """
+        if PDFService.use_worker_pool():
+            with open(pdf_path, 'rb') as pdf_file:
+                return PDFService.parse_resume_streaming_from_bytes(pdf_file.read(), fields, lean)
+        
+        return PDFService._parse_resume_streaming(pdf_path, fields, lean)
+    
+    @staticmethod
+    def parse_resume_streaming_from_bytes(pdf_bytes, fields=None, lean=None):
+        """
+        PDF 데이터를 페이지 단위로 읽으며 이력서를 파싱합니다.
+        
+        워커 풀을 사용하면(use_worker_pool) 페이지 추출과 파싱을 모두
+        워커 프로세스에서 수행하여 조기 종료도 워커 안에서 이루어집니다.
+        """
+        if PDFService.use_worker_pool():
+            return get_pdf_worker_pool().run('parse_resume_streaming', pdf_bytes, fields=fields, lean=lean)
+        
+        return PDFService._parse_resume_streaming(io.BytesIO(pdf_bytes), fields, lean)
+    
+    @staticmethod
+    def _parse_resume_streaming(source, fields=None, lean=None):
+        """현재 프로세스에서 페이지 텍스트를 이력서 스트리밍 파서에 공급합니다."""
+        from services.resume_parser_service import ResumeParserService
+        
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text.strip()
+            pdf = pdfplumber.open(source, laparams=None)
+        except Exception as e:
+            raise Exception(f"PDF 텍스트 추출 중 오류 발생: {str(e)}")
+        
+        # 전체 페이지 수는 페이지 트리에서 얻으므로 페이지 내용을 해석하지 않음
+        with pdf:
+            return ResumeParserService.parse_resume_streaming(
+                PDFService._iter_pages_text(pdf, lean), fields, page_count=len(pdf.pages)
+            )
+    
+    @staticmethod
+    def iter_page_text(source, lean=None):
+        """
+        PDF 파일 경로 또는 파일 객체의 텍스트를 페이지 단위로 생성합니다.
+        
+        소비자가 제너레이터를 닫으면(close) 남은 페이지는 해석하지 않고 PDF를 닫습니다.
+        
+        Yields:
+            str: 페이지 텍스트 (텍스트가 없는 페이지는 빈 문자열)
+        """
+        try:
+            # laparams=None: pdfminer 레이아웃 분석(텍스트 박스 그룹핑)을 생략
+            pdf = pdfplumber.open(source, laparams=None)
         except Exception as e:
             raise Exception(f"PDF 텍스트 추출 중 오류 발생: {str(e)}")
+        
+        with pdf:
+            yield from PDFService._iter_pages_text(pdf, lean)
     
     @staticmethod
-    def create_pdf_from_data(resume_data):
-        """이력서 데이터를 PDF로 변환합니다."""
+    def _iter_pages_text(pdf, lean=None):
+        """열린 PDF의 텍스트를 페이지 단위로 생성합니다."""
+        if lean is None:
+            lean = Config.PDF_LEAN_EXTRACTION
+        
         try:
-            # PDF 버퍼 생성
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-            story = []
+            for page in pdf.pages:
+                if lean:
+                    page_text = PDFService._extract_page_text_lean(pdf, page)
+                else:
+                    page_text = page.extract_text()
+                yield page_text or ""
+        except Exception as e:
+            raise Exception(f"PDF 텍스트 추출 중 오류 발생: {str(e)}")
+    
+    @staticmethod
+    def _extract_text(source, lean=None):
+        """현재 프로세스에서 PDF 파일 경로 또는 파일 객체의 텍스트를 추출합니다."""
+        text = ""
+        for page_text in PDFService.iter_page_text(source, lean):
+            if page_text:
+                text += page_text + "\n"
+        return text.strip()
+    
+    @staticmethod
+    def extract_lines_from_pdf(pdf_path, lean=None):
+        """
+        PDF 파일에서 텍스트와 줄별 글꼴 정보(크기, 굵기)를 함께 추출합니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
             
-            # 스타일 가져오기
-            styles = getSampleStyleSheet()
+        Returns:
+            LineExtraction: 텍스트(extract_text_from_pdf와 같음)와 TextLine 목록
+        """
+        if PDFService.use_worker_pool():
+            with open(pdf_path, 'rb') as pdf_file:
+                return PDFService.extract_lines_from_bytes(pdf_file.read(), lean=lean)
+        
+        return PDFService._extract_lines(pdf_path, lean)
+    
+    @staticmethod
+    def extract_lines_from_bytes(pdf_bytes, lean=None):
+        """
+        PDF 데이터에서 텍스트와 줄별 글꼴 정보를 함께 추출합니다.
+        
+        워커 풀을 사용하면(use_worker_pool) 워커 프로세스에서 추출합니다.
+        """
+        if PDFService.use_worker_pool():
+            return get_pdf_worker_pool().run('extract_lines', pdf_bytes, lean=lean)
+        
+        return PDFService._extract_lines(io.BytesIO(pdf_bytes), lean)
+    
+    @staticmethod
+    def iter_page_lines(source, lean=None):
+        """
+        PDF 파일 경로 또는 파일 객체의 텍스트 줄을 페이지 단위로 생성합니다.
+        
+        줄은 텍스트 추출과 같은 문자 배치(textmap)에서 만들어지므로, 줄 텍스트를
+        줄바꿈으로 이으면 페이지 텍스트와 같습니다.
+        
+        Yields:
+            List[TextLine]: 페이지의 텍스트 줄 (위에서 아래 순서)
+        """
+        if lean is None:
+            lean = Config.PDF_LEAN_EXTRACTION
+        
+        try:
+            with pdfplumber.open(source, laparams=None) as pdf:
+                for page in pdf.pages:
+                    if lean:
+                        PDFService._load_text_only_layout(pdf, page)
+                    try:
+                        yield PDFService._page_lines(page)
+                    finally:
+                        page.flush_cache()
+                        page.get_textmap.cache_clear()
+        except Exception as e:
+            raise Exception(f"PDF 텍스트 추출 중 오류 발생: {str(e)}")
+    
+    @staticmethod
+    def _extract_lines(source, lean=None):
+        """현재 프로세스에서 텍스트와 줄 목록을 추출합니다."""
+        lines = []
+        page_texts = []
+        for page_lines in PDFService.iter_page_lines(source, lean):
+            lines.extend(page_lines)
+            page_text = "\n".join(line.text for line in page_lines)
+            if page_text:
+                page_texts.append(page_text)
+        return LineExtraction("\n".join(page_texts).strip(), lines)
+    
+    @staticmethod
+    def _page_lines(page):
+        """
+        페이지의 문자 객체로 줄을 만들고 줄마다 대표 글꼴 크기와 굵기를 계산합니다.
+        
+        대표 크기는 줄에서 가장 많은 문자가 사용한 크기이며, 문자 절반 이상이
+        굵은 글꼴이면 굵은 줄로 봅니다.
+        """
+        lines = []
+        for line in page.extract_text_lines(return_chars=True):
+            chars = [char for char in line['chars'] if not char['text'].isspace()]
+            if not chars:
+                continue
+            size = Counter(round(char['size'], 1) for char in chars).most_common(1)[0][0]
+            bold_chars = sum(1 for char in chars if _is_bold_font(char['fontname']))
+            lines.append(TextLine(
+                line['text'],
+                size,
+                bold_chars * 2 >= len(chars),
+                page.page_number,
+                round(line['top'], 2)
+            ))
+        return lines
+    
+    @staticmethod
+    def _extract_page_text_lean(pdf, page):
+        """
+        문자 객체만 수집하여 페이지 텍스트를 추출하고 페이지 캐시를 비웁니다.
+        
+        이미지, 곡선, 사각형, 선 객체는 생성하지 않으므로 사진이나 장식 그래픽이
+        많은 이력서에서 추출 속도가 빨라지고, 페이지마다 캐시를 비워 긴 문서에서도
+        메모리 사용량이 일정하게 유지됩니다.
+        """
+        PDFService._load_text_only_layout(pdf, page)
+        
+        try:
+            return page.extract_text()
+        finally:
+            page.flush_cache()
+            page.get_textmap.cache_clear()
+    
+    @staticmethod
+    def _load_text_only_layout(pdf, page):
+        """문자 객체만 수집한 레이아웃을 pdfplumber 페이지 캐시에 주입합니다."""
+        device = _TextOnlyPageAggregator(
+            pdf.rsrcmgr,
+            pageno=page.page_number,
+            laparams=pdf.laparams
+        )
+        interpreter = PDFPageInterpreter(pdf.rsrcmgr, device)
+        interpreter.process_page(page.page_obj)
+        # pdfplumber가 캐시로 사용하는 레이아웃 속성에 텍스트 전용 결과를 주입
+        page._layout = device.get_result()
+    
+    @staticmethod
+    def resolve_artifacts(artifacts=None):
+        """
+        분석 결과물 선택을 검증하고 응답 순서의 튜플로 정규화합니다.
+        
+        Args:
+            artifacts: 결과물 목록 또는 쉼표로 구분한 문자열 (None 또는 빈 값이면 text만)
             
-            # 기본 폰트 사용
-            font_name = Config.PDF_FONT_NAME
+        Returns:
+            tuple: PDF_ANALYSIS_ARTIFACTS 순서의 결과물 튜플
             
-            # 제목 스타일
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=1,  # 중앙 정렬
-                fontName=font_name
+        Raises:
+            ValueError: 알 수 없는 결과물이 포함된 경우
+        """
+        if isinstance(artifacts, str):
+            artifacts = artifacts.split(',')
+        requested = {artifact.strip() for artifact in artifacts or [] if artifact and artifact.strip()}
+        if not requested:
+            return ('text',)
+        
+        unknown = requested.difference(PDF_ANALYSIS_ARTIFACTS)
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 분석 결과물입니다: {', '.join(sorted(unknown))} "
+                f"(사용 가능한 결과물: {', '.join(PDF_ANALYSIS_ARTIFACTS)})"
             )
+        return tuple(artifact for artifact in PDF_ANALYSIS_ARTIFACTS if artifact in requested)
+    
+    @staticmethod
+    def analyze_pdf(pdf_path, artifacts=None, lean=None):
+        """
+        PDF 파일을 한 번만 열어 요청한 결과물(텍스트, 단어, 표, 메타데이터)을 함께 계산합니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            artifacts: 계산할 결과물 (기본값: text만, PDF_ANALYSIS_ARTIFACTS 참고)
+            lean: 텍스트 전용 경량 모드 사용 여부 (기본값: Config.PDF_LEAN_EXTRACTION)
+        """
+        if PDFService.use_worker_pool():
+            with open(pdf_path, 'rb') as pdf_file:
+                return PDFService.analyze_pdf_bytes(pdf_file.read(), artifacts, lean)
+        
+        return PDFService._analyze(pdf_path, artifacts, lean)
+    
+    @staticmethod
+    def analyze_pdf_bytes(pdf_bytes, artifacts=None, lean=None):
+        """
+        PDF 데이터를 한 번만 열어 요청한 결과물을 함께 계산합니다.
+        
+        워커 풀을 사용하면(use_worker_pool) 워커 프로세스에서 분석합니다.
+        """
+        artifacts = PDFService.resolve_artifacts(artifacts)
+        if PDFService.use_worker_pool():
+            return get_pdf_worker_pool().run('analyze', pdf_bytes, artifacts=artifacts, lean=lean)
+        
+        return PDFService._analyze(io.BytesIO(pdf_bytes), artifacts, lean)
+    
+    @staticmethod
+    def _analyze(source, artifacts=None, lean=None):
+        """
+        현재 프로세스에서 PDF를 한 번 열고 페이지를 한 번씩만 해석하여 결과물을 계산합니다.
+        
+        각 페이지의 레이아웃 객체는 pdfplumber 페이지 캐시에 한 번만 만들어지고, 텍스트,
+        단어, 표 추출이 모두 같은 객체를 사용한 뒤 페이지마다 캐시를 비웁니다.
+        표를 요청하지 않으면 경량 모드에서 선/사각형 객체를 만들지 않으며,
+        메타데이터만 요청하면 페이지 내용은 해석하지 않습니다.
+        
+        Returns:
+            dict: 분석 결과 (요청한 결과물만 포함)
+                - artifacts: 계산한 결과물 목록
+                - page_count: 페이지 수
+                - text: 전체 텍스트 (text)
+                - pages: 페이지별 크기와 단어(words), 표(tables)
+                - metadata: 문서 정보 사전 (metadata)
+                - elapsed_ms: 분석 소요 시간 (ms)
+        """
+        artifacts = PDFService.resolve_artifacts(artifacts)
+        if lean is None:
+            lean = Config.PDF_LEAN_EXTRACTION
+        # 표 탐지는 선/사각형 객체가 필요하므로 경량 레이아웃을 사용할 수 없음
+        lean = lean and 'tables' not in artifacts
+        want_text = 'text' in artifacts
+        want_pages = 'words' in artifacts or 'tables' in artifacts
+        
+        start = time.perf_counter()
+        try:
+            with pdfplumber.open(source, laparams=None) as pdf:
+                result = {'artifacts': list(artifacts), 'page_count': len(pdf.pages)}
+                page_texts = []
+                pages = []
+                
+                if want_text or want_pages:
+                    for page in pdf.pages:
+                        if lean:
+                            PDFService._load_text_only_layout(pdf, page)
+                        try:
+                            if want_text:
+                                page_texts.append(page.extract_text() or "")
+                            if want_pages:
+                                pages.append(PDFService._analyze_page(page, artifacts))
+                        finally:
+                            page.flush_cache()
+                            page.get_textmap.cache_clear()
+                
+                if want_text:
+                    result['text'] = "\n".join(text for text in page_texts if text).strip()
+                if want_pages:
+                    result['pages'] = pages
+                if 'metadata' in artifacts:
+                    result['metadata'] = PDFService._json_metadata(pdf.metadata)
+                
+            result['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            return result
             
-            # 섹션 제목 스타일
-            section_style = ParagraphStyle(
-                'SectionTitle',
-                parent=styles['Heading2'],
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=20,
-                textColor=colors.darkblue,
-                fontName=font_name
-            )
+        except Exception as e:
+            raise Exception(f"PDF 분석 중 오류 발생: {str(e)}")
+    
+    @staticmethod
+    def _analyze_page(page, artifacts):
+        """페이지 크기와 요청한 단어(위치, 글꼴 크기) 및 표 목록"""
+        result = {
+            'page_number': page.page_number,
+            'width': round(float(page.width), 2),
+            'height': round(float(page.height), 2)
+        }
+        if 'words' in artifacts:
+            result['words'] = [
+                {
+                    'text': word['text'],
+                    'x0': round(word['x0'], 2),
+                    'top': round(word['top'], 2),
+                    'x1': round(word['x1'], 2),
+                    'bottom': round(word['bottom'], 2),
+                    'size': round(word['size'], 2),
+                    'fontname': word['fontname']
+                }
+                for word in page.extract_words(extra_attrs=['size', 'fontname'])
+            ]
+        if 'tables' in artifacts:
+            result['tables'] = page.extract_tables()
+        return result
+    
+    @staticmethod
+    def _json_metadata(metadata):
+        """문서 정보 사전을 JSON으로 직렬화할 수 있는 값으로 변환합니다."""
+        result = {}
+        for key, value in (metadata or {}).items():
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', errors='replace')
+            elif not isinstance(value, (str, int, float, bool)) and value is not None:
+                value = str(value)
+            result[str(key)] = value
+        return result
+    
+    @staticmethod
+    def inspect_pdf(source, max_pages=None):
+        """
+        전체 추출 없이 PDF를 사전 검사합니다.
+        
+        trailer, xref와 앞쪽 페이지의 리소스 사전 및 콘텐츠 스트림만 읽어 페이지 수,
+        암호화 여부, 텍스트 레이어(폰트 리소스와 텍스트 출력 연산자) 존재 여부를 확인합니다.
+        
+        Args:
+            source: PDF 파일 경로 또는 파일 객체
+            max_pages: 텍스트 레이어를 확인할 최대 페이지 수 (기본값: Config.PDF_PREFLIGHT_TEXT_PAGES)
             
-            # 내용 스타일
-            content_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontSize=10,
-                fontName=font_name
-            )
+        Returns:
+            dict: 사전 검사 결과
+                - page_count: 페이지 수 (암호가 필요하면 None)
+                - encrypted: 암호화 여부
+                - password_required: 열람 암호 필요 여부
+                - extractable: 텍스트 추출 허용 여부
+                - has_text_layer: 텍스트 레이어 존재 여부 (암호가 필요하면 None)
+                - pages_checked: 텍스트 레이어를 확인한 페이지 수
+                - elapsed_ms: 검사 소요 시간 (ms)
+        """
+        if max_pages is None:
+            max_pages = Config.PDF_PREFLIGHT_TEXT_PAGES
+        
+        start = time.perf_counter()
+        stream = open(source, 'rb') if isinstance(source, str) else source
+        try:
+            parser = PDFParser(stream)
+            result = {
+                'page_count': None,
+                'encrypted': False,
+                'password_required': False,
+                'extractable': True,
+                'has_text_layer': None,
+                'pages_checked': 0
+            }
             
-            # 제목 추가
-            story.append(Paragraph(resume_data.get('name', 'Resume'), title_style))
-            story.append(Spacer(1, 20))
+            try:
+                document = PDFDocument(parser)
+            except PDFPasswordIncorrect:
+                result.update({'encrypted': True, 'password_required': True, 'extractable': False})
+                result['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+                return result
             
-            # 기본 정보
-            story.append(Paragraph('Basic Information', section_style))
-            basic_info = [
-                ['Name:', resume_data.get('name', '')],
-                ['Email:', resume_data.get('email', '')],
-                ['Phone:', resume_data.get('phone', '')],
-                ['Address:', resume_data.get('address', '')]
-            ]
-            basic_table = Table(basic_info, colWidths=[1.5*inch, 4*inch])
-            basic_table.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), font_name),
-                ('FONTNAME', (1, 0), (1, -1), font_name),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            story.append(basic_table)
-            story.append(Spacer(1, 12))
+            result['encrypted'] = document.encryption is not None
+            result['extractable'] = document.is_extractable
             
-            # 학력
-            if resume_data.get('education'):
-                story.append(Paragraph('Education', section_style))
-                for edu in resume_data.get('education', []):
-                    edu_text = f"{edu.get('school', '')} ({edu.get('period', '')})<br/>"
-                    edu_text += f"{edu.get('major', '')} - {edu.get('degree', '')}"
-                    story.append(Paragraph(edu_text, content_style))
-                    story.append(Spacer(1, 6))
-                story.append(Spacer(1, 12))
+            pages_root = resolve1(document.catalog.get('Pages'))
+            page_count = resolve1(pages_root.get('Count')) if isinstance(pages_root, dict) else None
             
-            # 경력
-            if resume_data.get('experience'):
-                story.append(Paragraph('Experience', section_style))
-                for exp in resume_data.get('experience', []):
-                    exp_text = f"<b>{exp.get('company', '')}</b> ({exp.get('period', '')})<br/>"
-                    exp_text += f"<b>{exp.get('position', '')}</b><br/>"
-                    exp_text += f"{exp.get('description', '')}"
-                    story.append(Paragraph(exp_text, content_style))
-                    story.append(Spacer(1, 6))
-                story.append(Spacer(1, 12))
+            has_text_layer = False
+            for page in itertools.islice(PDFPage.create_pages(document), max_pages):
+                result['pages_checked'] += 1
+                if PDFService._has_text_operators(page.resources, page.contents):
+                    has_text_layer = True
+                    break
             
-            # 기술 스택
-            if resume_data.get('skills'):
-                story.append(Paragraph('Skills', section_style))
-                skills_text = ', '.join(resume_data.get('skills', []))
-                story.append(Paragraph(skills_text, content_style))
-                story.append(Spacer(1, 12))
+            if not isinstance(page_count, int):
+                page_count = sum(1 for _ in PDFPage.create_pages(document))
             
-            # 자기소개
-            if resume_data.get('introduction'):
-                story.append(Paragraph('Introduction', section_style))
-                story.append(Paragraph(resume_data.get('introduction', ''), content_style))
+            result['page_count'] = page_count
+            result['has_text_layer'] = has_text_layer
+            result['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            return result
             
-            # PDF 생성
-            doc.build(story)
-            buffer.seek(0)
-            return buffer.getvalue()
+        except Exception as e:
+            raise Exception(f"PDF 사전 검사 중 오류 발생: {str(e)}")
+        finally:
+            if stream is not source:
+                stream.close()
+    
+    @staticmethod
+    def _has_text_operators(resources, streams, depth=0, inherited_resources=None):
+        """
+        폰트 리소스가 있고 콘텐츠 스트림에 텍스트 출력 연산자가 있는지 확인합니다.
+        
+        Form XObject는 자체 리소스와 스트림으로 재귀 확인하며, 자체 /Resources가 없는
+        Form은 상위(페이지 또는 바깥 Form)의 리소스를 사용합니다.
+        """
+        resources = resolve1(resources)
+        if not isinstance(resources, dict):
+            resources = inherited_resources
+        if not isinstance(resources, dict):
+            return False
+        
+        if resolve1(resources.get('Font')):
+            for stream in streams:
+                stream = resolve1(stream)
+                if isinstance(stream, PDFStream) and _TEXT_SHOW_PATTERN.search(stream.get_data()):
+                    return True
+        
+        if depth >= 2:
+            return False
+        
+        xobjects = resolve1(resources.get('XObject'))
+        if not isinstance(xobjects, dict):
+            return False
+        
+        for xobject in xobjects.values():
+            xobject = resolve1(xobject)
+            if not isinstance(xobject, PDFStream):
+                continue
+            if getattr(xobject.get('Subtype'), 'name', None) != 'Form':
+                continue
+            if PDFService._has_text_operators(xobject.get('Resources'), [xobject], depth + 1, resources):
+                return True
+        
+        return False
+    
+    @staticmethod
+    def create_pdf_from_data(resume_data, compact=None):
+        """
+        이력서 데이터를 PDF로 변환합니다.
+        
+        스타일과 정적 플로어블은 프로세스 전역 템플릿(get_resume_template)에서 재사용하고,
+        이력서 데이터에 따라 달라지는 플로어블만 요청마다 만듭니다.
+        
+        Args:
+            resume_data: 이력서 데이터
+            compact: True이면 크기를 줄인 PDF(압축 수준 최대, 공유 리소스, 메타데이터 제거)로 생성
+                     (기본값: Config.PDF_COMPACT_DEFAULT)
+        
+        Returns:
+            bytes: PDF 데이터 (렌더링 결과를 복사하지 않고 그대로 반환)
+        """
+        return b''.join(PDFService.render_pdf(resume_data, compact).chunks)
+    
+    @staticmethod
+    def render_pdf(resume_data, compact=None):
+        """
+        이력서 데이터를 PDFOutput으로 렌더링합니다.
+        
+        렌더링된 데이터는 복사 없이 PDFOutput에 보관되므로, 응답 본문으로 그대로
+        넘기면(pdf_routes.pdf_download_response) 중간 버퍼를 거치지 않습니다.
+        
+        Returns:
+            PDFOutput: PDF 데이터 조각과 전체 크기
+        """
+        return PDFService._render(resume_data, compact=compact)
+    
+    @staticmethod
+    def pdf_cache_key(resume_data, compact=None):
+        """
+        이력서 데이터의 PDF 캐시 키를 반환합니다.
+        
+        정규화한 이력서 JSON, 템플릿 버전, 폰트, 출력 모드의 해시이므로 렌더링하지 않고도
+        응답의 강한 ETag로 사용할 수 있습니다.
+        """
+        compact = Config.PDF_COMPACT_DEFAULT if compact is None else compact
+        return RenderedPDFCache.key(resume_data, font_name=get_pdf_font_name(), compact=bool(compact))
+    
+    @staticmethod
+    def render_pdf_cached(resume_data, key=None, compact=None):
+        """
+        캐시를 거쳐 이력서 데이터를 PDFOutput으로 렌더링합니다.
+        
+        캐시 경로에서는 생성 시각과 문서 ID를 고정하여 렌더링하므로, 캐시에서
+        밀려난 뒤 다시 렌더링해도 같은 키(ETag)는 같은 바이트가 됩니다.
+        
+        Args:
+            resume_data: 이력서 데이터
+            key: 미리 계산한 캐시 키 (기본값: pdf_cache_key(resume_data, compact))
+            compact: 크기를 줄인 PDF로 생성할지 여부 (기본값: Config.PDF_COMPACT_DEFAULT)
+        
+        Returns:
+            (PDFOutput, 캐시 상태 'memory', 'disk' 또는 'miss')
+        """
+        cache = get_pdf_cache()
+        key = key or PDFService.pdf_cache_key(resume_data, compact)
+        
+        data, tier = cache.get(key)
+        if data is not None:
+            output = PDFOutput()
+            output.write(data)
+            return output, tier
+        
+        output = PDFService._render(resume_data, invariant=True, compact=compact)
+        cache.put(key, output.chunks[0] if len(output.chunks) == 1 else b''.join(output.chunks))
+        return output, 'miss'
+    
+    @staticmethod
+    def _render(resume_data, invariant=False, compact=None):
+        if compact is None:
+            compact = Config.PDF_COMPACT_DEFAULT
+        if Config.BULKHEAD_ENABLED:
+            # reportlab 렌더링은 GIL을 잡는 순수 파이썬 연산이므로 렌더러 프로세스에서 실행
+            output = PDFOutput()
+            output.write(get_pdf_render_pool().render(resume_data, invariant=invariant, compact=compact))
+            return output
+        
+        return PDFService._render_local(resume_data, invariant, compact)
+    
+    @staticmethod
+    def _render_bytes(resume_data, invariant=False, compact=None):
+        """현재 프로세스에서 이력서를 렌더링하고 PDF 데이터를 bytes로 반환합니다. (렌더러 프로세스용)"""
+        output = PDFService._render_local(resume_data, invariant, compact)
+        return output.chunks[0] if len(output.chunks) == 1 else b''.join(output.chunks)
+    
+    @staticmethod
+    def _render_local(resume_data, invariant=False, compact=None):
+        if compact is None:
+            compact = Config.PDF_COMPACT_DEFAULT
+        try:
+            output = PDFOutput()
+            get_resume_template().render(resume_data, output, invariant=invariant, compact=compact)
+            return output
             
         except Exception as e:
             raise Exception(f"PDF 생성 중 오류 발생: {str(e)}")
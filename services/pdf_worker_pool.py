@@ -0,0 +1,262 @@
+import atexit
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import resource
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Any, Optional
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+# 워커가 메모리 상한을 넘어 스스로 종료할 때 사용하는 종료 코드
+_RSS_EXCEEDED_EXIT_CODE = 86
+
+class PDFExtractionTimeout(Exception):
+    """PDF 추출 작업이 제한 시간을 초과했을 때 발생하는 예외"""
+
+class PDFExtractionMemoryExceeded(Exception):
+    """PDF 추출 작업이 워커 메모리 상한을 초과했을 때 발생하는 예외"""
+
+def _current_rss_bytes() -> int:
+    """현재 프로세스의 RSS(바이트)를 반환합니다."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        # /proc이 없는 환경에서는 최대 RSS로 대체 (Linux 기준 KB 단위)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _watch_rss(max_rss_bytes: int, interval: float = 0.05):
+    """RSS가 상한을 넘으면 워커 프로세스를 즉시 종료합니다."""
+    while True:
+        if _current_rss_bytes() > max_rss_bytes:
+            os._exit(_RSS_EXCEEDED_EXIT_CODE)
+        time.sleep(interval)
+
+def _worker_main(conn, max_rss_bytes: int):
+    """
+    워커 프로세스 진입점
+    
+    모듈을 읽고 나면 ('ready', None)을 보내며, 부모는 이 응답을 받은 뒤에 작업을 보내므로
+    프로세스 시작과 pdfplumber 임포트 시간은 작업 제한 시간에 포함되지 않습니다.
+    
+    작업 메시지: (작업 이름, 공유 메모리 이름, 데이터 크기, 키워드 인자), None이면 종료
+    응답 메시지: ('ok', 작업 결과) 또는 ('error', 오류 메시지)
+    """
+    from services.pdf_service import PDFService
+    
+    # 작업 이름 → PDF 파일 객체를 첫 인자로 받는 함수
+    tasks = {
+        'extract_text': PDFService._extract_text,
+        'extract_lines': PDFService._extract_lines,
+        'parse_resume': PDFService._parse_resume,
+        'parse_resume_streaming': PDFService._parse_resume_streaming,
+        'analyze': PDFService._analyze
+    }
+    
+    if max_rss_bytes:
+        threading.Thread(target=_watch_rss, args=(max_rss_bytes,), daemon=True).start()
+    
+    conn.send(('ready', None))
+    
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        
+        task_name, shm_name, size, kwargs = task
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            result = tasks[task_name](io.BytesIO(shm.buf[:size]), **kwargs)
+            conn.send(('ok', result))
+        except Exception as e:
+            conn.send(('error', str(e)))
+        finally:
+            shm.close()
+
+class _PDFWorker:
+    """부모 프로세스에서 관리하는 단일 워커 프로세스 핸들"""
+    
+    def __init__(self, ctx, max_rss_bytes: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, max_rss_bytes),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+        self.ready = False
+    
+    def wait_ready(self, timeout: float) -> bool:
+        """워커가 모듈을 모두 읽고 작업을 받을 준비가 될 때까지 기다립니다."""
+        if not self.ready:
+            try:
+                if self.conn.poll(timeout):
+                    self.ready = self.conn.recv()[0] == 'ready'
+            except (EOFError, OSError):
+                pass
+        return self.ready
+    
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+    
+    def stop(self, timeout: float = 1.0):
+        """워커를 정상 종료하고, 응답이 없으면 강제 종료합니다."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+    
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+class PDFWorkerPool:
+    """
+    PDF 처리(텍스트/줄 추출, 이력서 파싱, 분석) 전용 워커 프로세스 풀
+    
+    업로드 데이터는 공유 메모리로 전달되고, 작업마다 제한 시간과 메모리 상한이
+    적용됩니다. 제한을 넘은 워커는 종료 후 교체되며, 정해진 작업 수를 처리한
+    워커도 새 프로세스로 교체됩니다.
+    """
+    
+    def __init__(self, processes: int = 2, timeout: float = 30,
+                 max_rss_mb: int = 512, max_tasks_per_worker: int = 50, start_timeout: float = 60):
+        self.processes = processes
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else 0
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._closed = False
+        
+        # 워커는 첫 작업 시점에 생성 (None은 비어 있는 슬롯)
+        for _ in range(processes):
+            self._idle.put(None)
+    
+    def extract_text(self, pdf_bytes: bytes, lean: Optional[bool] = None,
+                     timeout: Optional[float] = None) -> str:
+        """
+        워커 프로세스에서 PDF 텍스트를 추출합니다.
+        
+        Args:
+            pdf_bytes: PDF 데이터
+            lean: 텍스트 전용 경량 모드 사용 여부
+            timeout: 작업 제한 시간(초), 기본값은 풀 설정값
+        
+        Returns:
+            str: 추출된 텍스트
+        """
+        return self.run('extract_text', pdf_bytes, timeout=timeout, lean=lean)
+    
+    def run(self, task_name: str, pdf_bytes: bytes, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        워커 프로세스에서 PDF 작업을 실행합니다.
+        
+        Args:
+            task_name: 작업 이름 ('extract_text', 'parse_resume', 'parse_resume_streaming' 등)
+            pdf_bytes: PDF 데이터
+            timeout: 작업 제한 시간(초), 기본값은 풀 설정값
+            **kwargs: 작업 함수에 전달할 키워드 인자 (pickle 가능해야 함)
+        
+        Returns:
+            작업 함수의 반환값
+        """
+        if self._closed:
+            raise Exception("PDF 추출 워커 풀이 종료되었습니다.")
+        
+        timeout = self.timeout if timeout is None else timeout
+        worker = self._idle.get()
+        shm = None
+        try:
+            if worker is None or not worker.is_alive():
+                # 새로 만들거나 교체한 워커는 준비 응답을 받은 뒤부터 작업 시간을 잼
+                worker = _PDFWorker(self._ctx, self.max_rss_bytes)
+                if not worker.wait_ready(self.start_timeout):
+                    worker.kill()
+                    worker = None
+                    raise Exception(f"PDF 추출 워커를 시작할 수 없습니다. (시작 제한 시간 {self.start_timeout:g}초)")
+            
+            size = len(pdf_bytes)
+            shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            shm.buf[:size] = pdf_bytes
+            worker.conn.send((task_name, shm.name, size, kwargs))
+            
+            if not worker.conn.poll(timeout):
+                worker.kill()
+                worker = None
+                raise PDFExtractionTimeout(f"PDF 텍스트 추출이 제한 시간({timeout}초)을 초과했습니다.")
+            
+            try:
+                status, payload = worker.conn.recv()
+            except EOFError:
+                worker.process.join()
+                exitcode = worker.process.exitcode
+                worker.conn.close()
+                worker = None
+                if exitcode == _RSS_EXCEEDED_EXIT_CODE:
+                    raise PDFExtractionMemoryExceeded(
+                        f"PDF 텍스트 추출이 메모리 상한({self.max_rss_bytes // (1024 * 1024)}MB)을 초과했습니다."
+                    )
+                raise Exception(f"PDF 추출 워커가 비정상 종료되었습니다 (exit code: {exitcode})")
+            
+            worker.tasks_done += 1
+            if self.max_tasks_per_worker and worker.tasks_done >= self.max_tasks_per_worker:
+                worker.stop()
+                worker = None
+            
+            if status == 'error':
+                raise Exception(payload)
+            return payload
+        
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            self._idle.put(worker)
+    
+    def shutdown(self):
+        """대기 중인 워커 프로세스를 모두 종료합니다."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None and worker.is_alive():
+                worker.stop()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pdf_worker_pool() -> PDFWorkerPool:
+    """설정값으로 생성한 프로세스 전역 워커 풀을 반환합니다."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PDFWorkerPool(
+                    processes=Config.PDF_WORKER_PROCESSES,
+                    timeout=Config.PDF_WORKER_TIMEOUT,
+                    max_rss_mb=Config.PDF_WORKER_MAX_RSS_MB,
+                    max_tasks_per_worker=Config.PDF_WORKER_MAX_TASKS,
+                    start_timeout=Config.PDF_WORKER_START_TIMEOUT
+                )
+                atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,59 @@
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from config.settings import Config
+
+class PredictionPool:
+    """
+    기업 확률 예측 전용 스레드 풀
+    
+    XGBoost 예측은 GIL을 놓고 실행되므로 스레드로 충분히 병렬화됩니다. PDF 렌더링은 렌더러
+    프로세스 풀에서, PDF 추출/파싱은 PDF 워커 프로세스 풀에서 실행되므로, 문서 작업이 몰려도 예측 스레드와 실행 자원을 나누어 쓰지 않으며, 예측 동시
+    실행 수는 이 풀의 크기로만 제한됩니다.
+    """
+    
+    def __init__(self, threads: int = 4):
+        self.threads = max(1, threads)
+        self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='prediction')
+    
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        예측 함수를 풀의 스레드에서 실행하고 결과를 기다립니다.
+        
+        Args:
+            func: 예측 함수 (예: AIModelService.predict_company_probabilities)
+            *args, **kwargs: 예측 함수에 전달할 인자
+        
+        Returns:
+            예측 함수의 반환값 (예외도 그대로 전달)
+        """
+        return self._executor.submit(func, *args, **kwargs).result()
+    
+    def shutdown(self):
+        """예측 스레드를 모두 종료합니다."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_prediction_pool() -> PredictionPool:
+    """설정값으로 생성한 프로세스 전역 예측 스레드 풀을 반환합니다."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PredictionPool(threads=Config.PREDICTION_POOL_THREADS)
+                atexit.register(_pool.shutdown)
+    return _pool
+
+def run_prediction(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    예측 함수를 실행합니다.
+    
+    Config.BULKHEAD_ENABLED가 켜져 있으면 예측 스레드 풀에서 실행하고 결과를 기다리며,
+    꺼져 있으면 현재 스레드에서 바로 실행합니다.
+    """
+    if Config.BULKHEAD_ENABLED:
+        return get_prediction_pool().run(func, *args, **kwargs)
+    return func(*args, **kwargs)
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class FrozenDict(dict):
+    """
+    수정할 수 없는 딕셔너리
+    
+    dict를 상속하므로 JSON 직렬화(jsonify, json.dumps)는 그대로 동작하며,
+    값을 변경하는 메서드는 TypeError를 발생시킵니다.
+    """
+    
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("캐시된 결과는 수정할 수 없습니다.")
+    
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    
+    def __reduce__(self):
+        # copy/pickle 시 __setitem__을 거치지 않고 생성
+        return (FrozenDict, (dict(self),))
+
+def freeze(value: Any) -> Any:
+    """딕셔너리는 FrozenDict로, 리스트는 튜플로 재귀 변환합니다."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """freeze의 역변환: 딕셔너리는 dict로, 튜플은 리스트로 재귀 복사합니다."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+class ResultCache:
+    """
+    크기가 제한된 스레드 안전 LRU 결과 캐시
+    
+    캐시에는 결과를 freeze한 사본을 저장하고, 조회 시에는 thaw한 새 사본을 반환하므로
+    호출자는 일반 dict/list를 받아 자유롭게 수정해도 캐시나 다른 호출자의 결과에
+    영향을 주지 않습니다. maxsize가 0이면 캐시를 사용하지 않습니다.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 결과의 수정 가능한 사본을 반환합니다. (없으면 None)"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return thaw(value)
+    
+    def put(self, key: Hashable, value: Any) -> Any:
+        """결과를 freeze한 사본으로 저장하고, 전달받은 결과를 그대로 반환합니다."""
+        if self.maxsize <= 0:
+            return value
+        
+        frozen = freeze(value)
+        with self._lock:
+            self._entries[key] = frozen
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+    
+    def info(self) -> Dict[str, int]:
+        """캐시 상태 (적중/실패 횟수, 현재 크기, 최대 크기)"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
@@ -1,198 +1,568 @@
+import bisect
+import hashlib
 import re
+import time
 from datetime import datetime
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Iterable, Iterator, Match, NamedTuple, Optional, Pattern, Sequence, Sized, Tuple, Union
+from services.resume_patterns import PATTERNS, EntityMatch
+from services.skill_matcher import SKILLS
+from services.result_cache import ResultCache
+from config.settings import Config
+
+# 파서 버전 (추출 규칙이나 결과 형식이 바뀌면 올려서 캐시된 결과를 무효화)
+PARSER_VERSION = '2.1'
+
+# 전처리 패턴
+_HORIZONTAL_SPACE_PATTERN = re.compile(r'[^\S\n]+')
+_LINE_BREAK_PATTERN = re.compile(r' ?\n\s*')
+
+# 섹션 헤더로 볼 수 있는 줄의 최대 길이 (글꼴이 큰 긴 문장은 헤더로 보지 않음)
+_HEADER_MAX_LENGTH = 40
+
+# 파싱 결과 캐시 (텍스트 해시 + 파서 버전 + 필드 → 결과, 조회할 때마다 새 사본을 반환)
+_parse_cache = ResultCache(Config.RESUME_PARSE_CACHE_SIZE)
+
+# 필드 → (추출 함수 이름, 입력 종류)
+# entities: 엔티티 스캔 결과, section: 같은 이름의 섹션 텍스트, text: 전체 텍스트 + 엔티티
+_FIELD_EXTRACTORS = {
+    'phone': ('_extract_phone', 'entities'),
+    'email': ('_extract_email', 'entities'),
+    'introduction': ('_extract_introduction', 'section'),
+    'experiences': ('_extract_experiences', 'section'),
+    'skills': ('_extract_skills', 'text'),
+    'links': ('_extract_links', 'entities'),
+    'awards': ('_extract_awards', 'section'),
+    'certificates': ('_extract_certificates', 'section'),
+    'languages': ('_extract_languages', 'section'),
+    'projects': ('_extract_projects', 'section')
+}
+
+# 파싱 가능한 필드 목록 (응답 순서)
+RESUME_FIELDS = tuple(_FIELD_EXTRACTORS)
+
+class ParseResult(NamedTuple):
+    """파싱 결과와 단계별 소요 시간"""
+    data: Dict[str, Any]
+    timings_ms: Dict[str, float]
+    cached: bool
+
+class StreamingParseResult(NamedTuple):
+    """페이지 단위 스트리밍 파싱 결과"""
+    data: Dict[str, Any]
+    timings_ms: Dict[str, float]
+    cached: bool
+    text: str
+    pages_read: int
+    stopped_early: bool
 
 class ResumeParserService:
     """이력서 파싱 서비스 클래스"""
     
     @staticmethod
-    def parse_resume(text: str) -> Dict[str, Any]:
+    def parse_resume(text: str, fields: Union[str, Iterable[str]] = None) -> Dict[str, Any]:
         """
         이력서 텍스트를 구조화된 데이터로 파싱합니다.
         
         Args:
             text: PDF에서 추출한 이력서 텍스트
+            fields: 추출할 필드 목록 또는 쉼표로 구분한 문자열 (기본값: 전체 필드)
+            
+        Returns:
+            파싱된 이력서 데이터 딕셔너리 (호출자 소유의 사본이므로 수정해도 캐시에 영향 없음)
+        """
+        return ResumeParserService.parse_resume_timed(text, fields).data
+    
+    @staticmethod
+    def parse_resume_timed(text: str, fields: Union[str, Iterable[str]] = None) -> ParseResult:
+        """
+        요청한 필드의 추출기와 그에 필요한 섹션 탐지/엔티티 스캔만 실행하여 파싱합니다.
+        
+        Args:
+            text: PDF에서 추출한 이력서 텍스트
+            fields: 추출할 필드 목록 또는 쉼표로 구분한 문자열 (기본값: 전체 필드)
             
         Returns:
-            파싱된 이력서 데이터 딕셔너리
+            ParseResult: 파싱 데이터, 단계/추출기별 소요 시간(ms), 캐시 적중 여부
+            
+        Raises:
+            ValueError: 알 수 없는 필드가 포함된 경우
         """
+        return ResumeParserService._parse_timed(text, fields)
+    
+    @staticmethod
+    def parse_resume_lines_timed(lines: Sequence[Any], fields: Union[str, Iterable[str]] = None) -> ParseResult:
+        """
+        글꼴 정보가 있는 텍스트 줄로 이력서를 파싱합니다.
+        
+        본문보다 큰 글꼴이나 굵은 글꼴로 쓰인 짧은 줄을 헤더 후보로 보고, 후보 줄만
+        섹션 키워드와 비교하여 섹션을 나눕니다. (줄 수에 선형, 전체 텍스트 키워드 스캔 없음)
+        헤더 후보가 없는 문서(모든 줄이 같은 글꼴)는 parse_resume_timed와 같이
+        키워드로 섹션을 탐지합니다.
+        
+        Args:
+            lines: 텍스트 줄 목록 (PDFService.extract_lines_* 결과의 TextLine: text, size, bold)
+            fields: 추출할 필드 목록 또는 쉼표로 구분한 문자열 (기본값: 전체 필드)
+            
+        Returns:
+            ParseResult: 파싱 데이터, 단계/추출기별 소요 시간(ms), 캐시 적중 여부
+            
+        Raises:
+            ValueError: 알 수 없는 필드가 포함된 경우
+        """
+        text = "\n".join(line.text for line in lines)
+        return ResumeParserService._parse_timed(text, fields, lines)
+    
+    @staticmethod
+    def _parse_timed(text: str, fields: Union[str, Iterable[str]] = None,
+                     lines: Optional[Sequence[Any]] = None) -> ParseResult:
+        """텍스트(와 줄 목록)를 파싱합니다. 줄 목록이 있으면 섹션을 글꼴 정보로 나눕니다."""
+        fields = ResumeParserService.resolve_fields(fields)
+        
+        cache_key = ResumeParserService._cache_key(text, fields, lines)
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            return ParseResult(cached, {}, True)
+        
+        timings = {}
+        
+        def timed(name, func, *args):
+            start = time.perf_counter()
+            result = func(*args)
+            timings[name] = round((time.perf_counter() - start) * 1000, 3)
+            return result
+        
         try:
-            # 텍스트 전처리
-            cleaned_text = ResumeParserService._preprocess_text(text)
+            # 텍스트 전처리 (줄 목록이 있으면 줄 단위로 정리하며 줄 위치를 함께 기록)
+            if lines is None:
+                cleaned_text = timed('preprocess', ResumeParserService._preprocess_text, text)
+            else:
+                cleaned_text, line_spans = timed('preprocess', ResumeParserService._preprocess_lines, lines)
+            inputs = {'text': cleaned_text}
+            
+            # 섹션 인덱스 생성 (전체 텍스트 1회 스캔 또는 헤더 후보 줄만 확인, 섹션 필드가 있을 때만)
+            if any(_FIELD_EXTRACTORS[field][1] == 'section' for field in fields):
+                if lines is None:
+                    inputs['sections'] = timed('sections', ResumeParserService._build_section_index, cleaned_text)
+                else:
+                    inputs['sections'] = timed(
+                        'sections', ResumeParserService._build_line_section_index, cleaned_text, line_spans
+                    )
             
-            # 각 섹션 파싱
-            parsed_data = {
-                'phone': ResumeParserService._extract_phone(cleaned_text),
-                'email': ResumeParserService._extract_email(cleaned_text),
-                'introduction': ResumeParserService._extract_introduction(cleaned_text),
-                'experiences': ResumeParserService._extract_experiences(cleaned_text),
-                'skills': ResumeParserService._extract_skills(cleaned_text),
-                'links': ResumeParserService._extract_links(cleaned_text),
-                'awards': ResumeParserService._extract_awards(cleaned_text),
-                'certificates': ResumeParserService._extract_certificates(cleaned_text),
-                'languages': ResumeParserService._extract_languages(cleaned_text),
-                'projects': ResumeParserService._extract_projects(cleaned_text)
-            }
+            # 엔티티 스캔 (전화번호, 이메일, URL, 날짜를 1회 스캔, 엔티티가 필요한 필드가 있을 때만)
+            if any(_FIELD_EXTRACTORS[field][1] in ('entities', 'text') for field in fields):
+                inputs['entities'] = timed('entities', PATTERNS.scan_entities, cleaned_text)
             
-            return parsed_data
+            # 요청한 필드만 파싱
+            parsed_data = {}
+            for field in fields:
+                parsed_data[field] = timed(field, *ResumeParserService._extractor_call(field, inputs))
             
         except Exception as e:
             raise Exception(f"이력서 파싱 중 오류 발생: {str(e)}")
+        
+        return ParseResult(_parse_cache.put(cache_key, parsed_data), timings, False)
+    
+    @staticmethod
+    def parse_resume_streaming(pages: Iterable[str], fields: Union[str, Iterable[str]] = None,
+                               page_count: Optional[int] = None) -> StreamingParseResult:
+        """
+        페이지 텍스트를 순서대로 받아 이력서를 파싱하고, 요청한 필드가 모두 채워지면
+        남은 페이지를 읽지 않고 페이지 공급자(제너레이터)를 닫습니다.
+        
+        필드 완료 기준:
+        - phone, email: 첫 번째 값이 나타난 페이지
+        - links: 첫 섹션 헤더가 나타난 페이지 (헤더 앞 연락처 영역의 링크)
+        - 그 외 섹션 필드: 해당 섹션 다음에 다른 섹션 헤더가 나타난 페이지
+        
+        Args:
+            pages: 페이지 텍스트 이터러블 (예: PDFService.iter_page_text)
+            fields: 파싱할 필드 (기본값: 전체 필드)
+            page_count: 전체 페이지 수 (조기 종료 판정용, 기본값: pages의 길이, 알 수 없으면 조기 종료로 보지 않음)
+            
+        Returns:
+            StreamingParseResult: 읽은 페이지까지의 파싱 결과, 텍스트, 읽은 페이지 수, 조기 종료 여부
+        """
+        fields = ResumeParserService.resolve_fields(fields)
+        pending = set(fields)
+        progress = {'open_section': None, 'closed': set(), 'any_header': False}
+        page_texts = []
+        extract_ms = check_ms = 0.0
+        if page_count is None and isinstance(pages, Sized):
+            page_count = len(pages)
+        
+        iterator = iter(pages)
+        try:
+            while pending:
+                start = time.perf_counter()
+                page_text = next(iterator, None)
+                extract_ms += (time.perf_counter() - start) * 1000
+                if page_text is None:
+                    break
+                page_texts.append(page_text)
+                
+                start = time.perf_counter()
+                ResumeParserService._update_pending_fields(pending, page_text, progress)
+                check_ms += (time.perf_counter() - start) * 1000
+        finally:
+            # 페이지 공급자에게 추출 중단을 알림
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+        
+        # 마지막 페이지에서 필드가 모두 채워졌다면 남은 페이지가 없으므로 조기 종료가 아님
+        # (다음 페이지를 추출해 보지 않고 전체 페이지 수와 비교)
+        stopped_early = page_count is not None and len(page_texts) < page_count
+        
+        text = "\n".join(page_text for page_text in page_texts if page_text).strip()
+        result = ResumeParserService.parse_resume_timed(text, fields)
+        timings = {'extract': round(extract_ms, 3), 'stream_check': round(check_ms, 3)}
+        timings.update(result.timings_ms)
+        
+        return StreamingParseResult(result.data, timings, result.cached, text, len(page_texts), stopped_early)
+    
+    @staticmethod
+    def _update_pending_fields(pending: set, page_text: str, progress: Dict[str, Any]):
+        """새 페이지 텍스트만 스캔하여 완료된 필드를 pending에서 제거합니다."""
+        cleaned_text = ResumeParserService._preprocess_text(page_text)
+        
+        if pending.intersection(('phone', 'email')):
+            entities = PATTERNS.scan_entities(cleaned_text)
+            for field in ('phone', 'email'):
+                if entities.get(field):
+                    pending.discard(field)
+        
+        for match in PATTERNS.section_header.finditer(cleaned_text):
+            section = PATTERNS.section_keyword_map[match.group('header').lower()]
+            # 새 헤더가 나타나면 직전 섹션의 범위가 확정됨
+            if progress['open_section'] is not None:
+                progress['closed'].add(progress['open_section'])
+            # 섹션 범위는 타입별 첫 번째 헤더 기준이므로 이미 나온 섹션은 다시 열지 않음
+            progress['open_section'] = section if section not in progress['closed'] else None
+            progress['any_header'] = True
+        
+        if progress['any_header']:
+            pending.discard('links')
+        pending.difference_update(progress['closed'])
+    
+    @staticmethod
+    def resolve_fields(fields: Union[str, Iterable[str]] = None) -> Tuple[str, ...]:
+        """
+        필드 선택을 검증하고 응답 순서의 튜플로 정규화합니다.
+        
+        Args:
+            fields: 필드 목록 또는 쉼표로 구분한 문자열 (None 또는 빈 값이면 전체 필드)
+            
+        Returns:
+            Tuple[str, ...]: RESUME_FIELDS 순서의 필드 튜플
+            
+        Raises:
+            ValueError: 알 수 없는 필드가 포함된 경우
+        """
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        requested = {field.strip() for field in fields or [] if field and field.strip()}
+        if not requested:
+            return RESUME_FIELDS
+        
+        unknown = requested.difference(RESUME_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+                f"(사용 가능한 필드: {', '.join(RESUME_FIELDS)})"
+            )
+        return tuple(field for field in RESUME_FIELDS if field in requested)
+    
+    @staticmethod
+    def _extractor_call(field: str, inputs: Dict[str, Any]):
+        """필드의 추출 함수와 입력 인자를 반환합니다."""
+        name, input_kind = _FIELD_EXTRACTORS[field]
+        extractor = getattr(ResumeParserService, name)
+        
+        if input_kind == 'entities':
+            return extractor, inputs['entities']
+        if input_kind == 'text':
+            return extractor, inputs['text'], inputs['entities']
+        
+        start, end = inputs['sections'].get(field, (0, 0))
+        return extractor, inputs['text'][start:end]
+    
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """파싱 결과 캐시 상태를 반환합니다."""
+        return _parse_cache.info()
+    
+    @staticmethod
+    def _cache_key(text: str, fields: Tuple[str, ...] = RESUME_FIELDS, lines: Sequence[Any] = None) -> str:
+        """파서 버전, 필드 선택, 입력 텍스트(와 줄별 글꼴 정보) 해시로 캐시 키를 만듭니다."""
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16)
+        if lines is None:
+            return f'{PARSER_VERSION}:{",".join(fields)}:{digest.hexdigest()}'
+        
+        digest.update(''.join(f'{line.size:g}{"b" if line.bold else ""};' for line in lines).encode())
+        return f'{PARSER_VERSION}:{",".join(fields)}:lines:{digest.hexdigest()}'
     
     @staticmethod
     def _preprocess_text(text: str) -> str:
         """텍스트 전처리"""
-        # 불필요한 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        # 줄바꿈 정리
-        text = re.sub(r'\n+', '\n', text)
+        # 불필요한 공백 제거 (줄바꿈은 섹션 헤더 인식을 위해 유지)
+        text = _HORIZONTAL_SPACE_PATTERN.sub(' ', text)
+        # 줄바꿈 정리 (줄 앞뒤 공백과 빈 줄 제거)
+        text = _LINE_BREAK_PATTERN.sub('\n', text)
         return text.strip()
     
     @staticmethod
-    def _extract_phone(text: str) -> str:
-        """핸드폰 번호 추출"""
-        # 한국 휴대폰 번호 패턴
-        phone_patterns = [
-            r'01[016789]-?\d{3,4}-?\d{4}',  # 010-1234-5678
-            r'01[016789]\s?\d{3,4}\s?\d{4}',  # 010 1234 5678
-            r'\+82-10-\d{4}-\d{4}',  # +82-10-1234-5678
+    def _build_section_index(text: str) -> Dict[str, Tuple[int, int]]:
+        """
+        텍스트를 한 번 스캔하여 섹션 인덱스를 만듭니다.
+        
+        헤더는 줄 시작에 고정되어 일반 단어 안의 키워드('상', '기술' 등)와는
+        매칭되지 않으며, 각 섹션의 범위는 헤더 다음부터 다음 헤더 직전까지입니다.
+        
+        Args:
+            text: 전처리된 이력서 텍스트
+            
+        Returns:
+            섹션 타입 → (시작 위치, 끝 위치) 딕셔너리 (섹션 타입별 첫 번째 헤더 기준)
+        """
+        headers = [
+            (match.start(), match.end(), PATTERNS.section_keyword_map[match.group('header').lower()])
+            for match in PATTERNS.section_header.finditer(text)
         ]
         
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group()
+        sections = {}
+        for i, (_, content_start, section) in enumerate(headers):
+            content_end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+            sections.setdefault(section, (content_start, content_end))
         
-        return ""
+        return sections
     
     @staticmethod
-    def _extract_email(text: str) -> str:
-        """이메일 주소 추출"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
-        return match.group() if match else ""
+    def _preprocess_lines(lines: Sequence[Any]) -> Tuple[str, List[Tuple[int, Any]]]:
+        """
+        줄 단위로 텍스트를 전처리합니다. (_preprocess_text와 같은 결과)
+        
+        Returns:
+            (전처리된 텍스트, 빈 줄을 제외한 (줄 시작 위치, 줄) 목록)
+        """
+        cleaned_lines = []
+        line_spans = []
+        offset = 0
+        for line in lines:
+            cleaned = _HORIZONTAL_SPACE_PATTERN.sub(' ', line.text).strip()
+            if not cleaned:
+                continue
+            cleaned_lines.append(cleaned)
+            line_spans.append((offset, line))
+            offset += len(cleaned) + 1
+        return "\n".join(cleaned_lines), line_spans
     
     @staticmethod
-    def _extract_introduction(text: str) -> str:
-        """자기소개 추출"""
-        # 자기소개 관련 키워드 찾기
-        intro_keywords = ['자기소개', '소개', 'About', 'Profile', 'Introduction']
-        
-        for keyword in intro_keywords:
-            # 키워드 다음 200자 정도 추출
-            pattern = rf'{keyword}[:\s]*([^\n]{{0,200}})'
-            match = re.search(pattern, text, re.IGNORECASE)
+    def _build_line_section_index(text: str, line_spans: List[Tuple[int, Any]]) -> Dict[str, Tuple[int, int]]:
+        """
+        글꼴 정보로 섹션 인덱스를 만듭니다.
+        
+        - 본문 글꼴: 글자 수 기준으로 가장 많이 쓰인 크기와 굵기
+        - 헤더 후보: 본문보다 Config.RESUME_HEADER_SIZE_RATIO배 이상 크거나, 본문이 굵지 않을 때
+          굵은 글꼴로 쓰인 _HEADER_MAX_LENGTH자 이하의 줄
+        - 섹션 헤더: 섹션 키워드로 시작하는 헤더 후보 (후보 줄에만 헤더 패턴을 적용)
+        - 섹션 경계: 섹션 헤더와, 섹션 헤더 중 가장 작은 글꼴 이상으로 큰 그 밖의 헤더 후보
+          (본문 크기의 굵은 회사명 등은 섹션을 끊지 않음)
+        
+        섹션 헤더가 없으면 _build_section_index로 키워드 탐지를 합니다.
+        
+        Args:
+            text: _preprocess_lines로 전처리된 텍스트
+            line_spans: (줄 시작 위치, 줄) 목록
+            
+        Returns:
+            섹션 타입 → (시작 위치, 끝 위치) 딕셔너리 (섹션 타입별 첫 번째 헤더 기준)
+        """
+        size_weights = Counter()
+        bold_weight = 0
+        for start, line in line_spans:
+            size_weights[line.size] += len(line.text)
+            if line.bold:
+                bold_weight += len(line.text)
+        body_size = size_weights.most_common(1)[0][0] if size_weights else 0
+        body_bold = bold_weight * 2 > sum(size_weights.values())
+        min_header_size = body_size * Config.RESUME_HEADER_SIZE_RATIO
+        
+        # (줄 시작 위치, 내용 시작 위치, 섹션 타입 또는 None, 글꼴 크기)
+        candidates = []
+        for start, line in line_spans:
+            end = text.find('\n', start)
+            end = len(text) if end == -1 else end
+            if end - start > _HEADER_MAX_LENGTH:
+                continue
+            if line.size < min_header_size and not (line.bold and not body_bold):
+                continue
+            match = PATTERNS.section_header.match(text, start, end)
             if match:
-                return match.group(1).strip()
+                section = PATTERNS.section_keyword_map[match.group('header').lower()]
+                candidates.append((start, match.end(), section, line.size))
+            else:
+                candidates.append((start, end, None, line.size))
         
-        return ""
+        section_sizes = [size for _, _, section, size in candidates if section is not None]
+        if not section_sizes:
+            return ResumeParserService._build_section_index(text)
+        
+        boundary_size = min(section_sizes)
+        headers = [
+            (start, content_start, section)
+            for start, content_start, section, size in candidates
+            if section is not None or size >= max(boundary_size, min_header_size)
+        ]
+        
+        sections = {}
+        for i, (_, content_start, section) in enumerate(headers):
+            if section is None:
+                continue
+            content_end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+            sections.setdefault(section, (content_start, content_end))
+        
+        return sections
+    
+    @staticmethod
+    def _find_labeled_anchors(text: str, rules: Dict[str, Pattern]) -> Iterator[Tuple[Match, Match]]:
+        """
+        기준 패턴(날짜, 기간 등)과 바로 앞의 라벨(회사명, 수상명 등)을 찾습니다.
+        
+        기준 패턴은 길이가 제한된 토큰이고, 라벨은 이전 기준 패턴 이후 구간에서
+        기준 패턴 직전에 끝나는 라벨 문자 연속 구간입니다. 각 문자를 최대 한 번씩만
+        검사하므로 입력 길이에 선형 시간으로 동작합니다.
+        
+        Args:
+            text: 섹션 텍스트
+            rules: 'anchor', 'label' 패턴
+            
+        Yields:
+            (라벨 매치, 기준 패턴 매치) - 공백뿐인 라벨은 제외
+        """
+        previous_end = 0
+        for anchor in rules['anchor'].finditer(text):
+            label = None
+            for run in rules['label'].finditer(text, previous_end, anchor.start()):
+                label = run
+            previous_end = anchor.end()
+            
+            if label is not None and label.end() == anchor.start() and label.group().strip():
+                yield label, anchor
+    
+    @staticmethod
+    def _build_line_index(text: str) -> List[int]:
+        """텍스트의 각 줄 시작 위치 목록을 만듭니다."""
+        line_starts = [0]
+        newline = text.find('\n')
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = text.find('\n', newline + 1)
+        return line_starts
+    
+    @staticmethod
+    def _line_number(line_starts: List[int], offset: int) -> int:
+        """텍스트 위치가 속한 줄 번호를 이진 탐색으로 찾습니다."""
+        return max(bisect.bisect_right(line_starts, offset) - 1, 0)
+    
+    @staticmethod
+    def _line_text(text: str, line_starts: List[int], line_no: int) -> str:
+        """줄 번호에 해당하는 줄 내용을 반환합니다. (범위를 벗어나면 빈 문자열)"""
+        if line_no >= len(line_starts):
+            return ""
+        end = line_starts[line_no + 1] - 1 if line_no + 1 < len(line_starts) else len(text)
+        return text[line_starts[line_no]:end]
+    
+    @staticmethod
+    def _extract_phone(entities: Dict[str, List[EntityMatch]]) -> str:
+        """핸드폰 번호 추출 (엔티티 스캔 결과 중 첫 번째 번호)"""
+        phones = entities.get('phone')
+        return phones[0].value if phones else ""
     
     @staticmethod
-    def _extract_experiences(text: str) -> List[Dict[str, str]]:
-        """경력 정보 추출"""
+    def _extract_email(entities: Dict[str, List[EntityMatch]]) -> str:
+        """이메일 주소 추출 (엔티티 스캔 결과 중 첫 번째 주소)"""
+        emails = entities.get('email')
+        return emails[0].value if emails else ""
+    
+    @staticmethod
+    def _extract_introduction(section_text: str) -> str:
+        """자기소개 추출 (자기소개 섹션 범위)"""
+        # 헤더 다음 첫 줄에서 200자 정도 추출
+        match = PATTERNS.extractor('introduction')['line'].match(section_text)
+        return match.group(1).strip() if match else ""
+    
+    @staticmethod
+    def _extract_experiences(section_text: str) -> List[Dict[str, str]]:
+        """경력 정보 추출 (경력 섹션 범위)"""
         experiences = []
         
-        # 경력 관련 섹션 찾기
-        experience_sections = [
-            '경력', 'Experience', 'Work Experience', 'Career',
-            '업무 경험', '직장 경험', '회사 경험'
-        ]
+        if not section_text:
+            return experiences
         
-        for section in experience_sections:
-            # 섹션 시작 위치 찾기
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                # 다음 섹션까지 텍스트 추출
-                section_text = text[start_pos:start_pos + 2000]  # 2000자 제한
-                
-                # 회사명과 기간 패턴 찾기
-                company_patterns = [
-                    r'([가-힣a-zA-Z\s&]+)\s*\(?(\d{4}\.?\d{2})\s*[-~]\s*(\d{4}\.?\d{2}|현재|Present)\)?',
-                    r'([가-힣a-zA-Z\s&]+)\s*(\d{4}\.?\d{2})\s*[-~]\s*(\d{4}\.?\d{2}|현재|Present)',
-                ]
-                
-                for pattern in company_patterns:
-                    matches = re.finditer(pattern, section_text)
-                    for match in matches:
-                        company = match.group(1).strip()
-                        start_date = match.group(2)
-                        end_date = match.group(3)
-                        
-                        # 직책 정보 찾기 (회사명 다음 줄에서)
-                        position = ""
-                        lines = section_text.split('\n')
-                        for i, line in enumerate(lines):
-                            if company in line:
-                                if i + 1 < len(lines):
-                                    position = lines[i + 1].strip()
-                                break
-                        
-                        experiences.append({
-                            'company': company,
-                            'start_date': start_date,
-                            'end_date': end_date,
-                            'position': position,
-                            'description': ""
-                        })
-                
-                break  # 첫 번째 매칭되는 섹션만 처리
+        # 섹션당 한 번만 줄 시작 위치 인덱스 생성
+        line_starts = ResumeParserService._build_line_index(section_text)
+        
+        # 기간 앞의 회사명 찾기
+        for label, anchor in ResumeParserService._find_labeled_anchors(section_text, PATTERNS.extractor('experiences')):
+            # 직책 정보 찾기 (회사명이 있는 줄의 다음 줄에서)
+            line_no = ResumeParserService._line_number(line_starts, label.start())
+            position = ResumeParserService._line_text(section_text, line_starts, line_no + 1).strip()
+            
+            experiences.append({
+                'company': label.group().strip(),
+                'start_date': anchor.group(1),
+                'end_date': anchor.group(2),
+                'position': position,
+                'description': ""
+            })
         
         return experiences
     
     @staticmethod
-    def _extract_skills(text: str) -> List[Dict[str, str]]:
-        """스킬 정보 추출"""
-        skills = []
-        
-        # 스킬 관련 섹션 찾기
-        skill_sections = [
-            '기술', 'Skills', 'Technical Skills', 'Programming Languages',
-            '프로그래밍 언어', '개발 도구', 'Tools'
-        ]
+    def _extract_skills(text: str, entities: Dict[str, List[EntityMatch]] = None) -> List[Dict[str, Any]]:
+        """스킬 정보 추출 (기술 사전으로 이력서 전체를 1회 스캔, URL/이메일 안의 매치는 제외)"""
+        skills = {}
+        excluded = sorted(
+            (entity.start, entity.end)
+            for kind in ('url', 'email')
+            for entity in (entities or {}).get(kind, [])
+        )
+        excluded_index = 0
         
-        for section in skill_sections:
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                section_text = text[start_pos:start_pos + 1000]
-                
-                # 기술명 추출 (쉼표, 줄바꿈으로 구분)
-                skill_names = re.split(r'[,，\n]', section_text)
-                
-                for skill_name in skill_names:
-                    skill_name = skill_name.strip()
-                    if skill_name and len(skill_name) > 1:
-                        skills.append({
-                            'name': skill_name,
-                            'level': ""
-                        })
-                
-                break
+        # 정규 ID별로 묶고 처음 등장한 순서 유지
+        for match in SKILLS.find(text):
+            while excluded_index < len(excluded) and excluded[excluded_index][1] <= match.start:
+                excluded_index += 1
+            if excluded_index < len(excluded) and excluded[excluded_index][0] < match.end:
+                continue
+            
+            skill = skills.get(match.skill_id)
+            if skill is None:
+                skill = skills[match.skill_id] = {
+                    'id': match.skill_id,
+                    'name': match.name,
+                    'level': "",
+                    'positions': []
+                }
+            skill['positions'].append([match.start, match.end])
         
-        return skills
+        return list(skills.values())
     
     @staticmethod
-    def _extract_links(text: str) -> List[Dict[str, str]]:
-        """링크 정보 추출"""
+    def _extract_links(entities: Dict[str, List[EntityMatch]]) -> List[Dict[str, str]]:
+        """링크 정보 추출 (엔티티 스캔 결과의 URL)"""
         links = []
         
-        # URL 패턴 찾기
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, text)
-        
-        for url in urls:
+        for entity in entities.get('url', []):
+            url = entity.value
             link_type = "other"
             
-            # 링크 타입 분류
-            if 'github.com' in url:
-                link_type = "github"
-            elif 'blog' in url or 'tistory.com' in url or 'velog.io' in url:
-                link_type = "blog"
-            elif 'linkedin.com' in url:
-                link_type = "linkedin"
-            elif 'portfolio' in url:
-                link_type = "portfolio"
+            # 링크 타입 분류 (먼저 일치하는 규칙 우선)
+            for rule_type, keywords in PATTERNS.link_types:
+                if any(keyword in url for keyword in keywords):
+                    link_type = rule_type
+                    break
             
             links.append({
                 'type': link_type,
@@ -202,157 +572,70 @@ class ResumeParserService:
         return links
     
     @staticmethod
-    def _extract_awards(text: str) -> List[Dict[str, str]]:
-        """수상 정보 추출"""
+    def _extract_awards(section_text: str) -> List[Dict[str, str]]:
+        """수상 정보 추출 (수상 섹션 범위)"""
         awards = []
         
-        # 수상 관련 섹션 찾기
-        award_sections = [
-            '수상', 'Awards', 'Achievements', '수상 경력',
-            '상', 'Award', 'Achievement'
-        ]
-        
-        for section in award_sections:
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                section_text = text[start_pos:start_pos + 1000]
-                
-                # 수상명과 날짜 패턴 찾기
-                award_patterns = [
-                    r'([^,\n]+)\s*\(?(\d{4}\.?\d{2})\)?',
-                    r'([^,\n]+)\s*(\d{4}\.?\d{2})',
-                ]
-                
-                for pattern in award_patterns:
-                    matches = re.finditer(pattern, section_text)
-                    for match in matches:
-                        title = match.group(1).strip()
-                        date = match.group(2)
-                        
-                        awards.append({
-                            'title': title,
-                            'date': date,
-                            'organization': ""
-                        })
-                
-                break
+        # 날짜 앞의 수상명 찾기
+        for label, anchor in ResumeParserService._find_labeled_anchors(section_text, PATTERNS.extractor('awards')):
+            awards.append({
+                'title': label.group().strip(),
+                'date': anchor.group(1),
+                'organization': ""
+            })
         
         return awards
     
     @staticmethod
-    def _extract_certificates(text: str) -> List[Dict[str, str]]:
-        """자격증 정보 추출"""
+    def _extract_certificates(section_text: str) -> List[Dict[str, str]]:
+        """자격증 정보 추출 (자격증 섹션 범위)"""
         certificates = []
         
-        # 자격증 관련 섹션 찾기
-        cert_sections = [
-            '자격증', 'Certificates', 'Certifications', 'License',
-            '자격', 'Certificate', 'Certification'
-        ]
-        
-        for section in cert_sections:
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                section_text = text[start_pos:start_pos + 1000]
-                
-                # 자격증명과 날짜 패턴 찾기
-                cert_patterns = [
-                    r'([^,\n]+)\s*\(?(\d{4}\.?\d{2})\)?',
-                    r'([^,\n]+)\s*(\d{4}\.?\d{2})',
-                ]
-                
-                for pattern in cert_patterns:
-                    matches = re.finditer(pattern, section_text)
-                    for match in matches:
-                        name = match.group(1).strip()
-                        date = match.group(2)
-                        
-                        certificates.append({
-                            'name': name,
-                            'date': date,
-                            'organization': ""
-                        })
-                
-                break
+        # 날짜 앞의 자격증명 찾기
+        for label, anchor in ResumeParserService._find_labeled_anchors(section_text, PATTERNS.extractor('certificates')):
+            certificates.append({
+                'name': label.group().strip(),
+                'date': anchor.group(1),
+                'organization': ""
+            })
         
         return certificates
     
     @staticmethod
-    def _extract_languages(text: str) -> List[Dict[str, str]]:
-        """어학 정보 추출"""
+    def _extract_languages(section_text: str) -> List[Dict[str, str]]:
+        """어학 정보 추출 (어학 섹션 범위)"""
         languages = []
         
-        # 어학 관련 섹션 찾기
-        lang_sections = [
-            '어학', 'Languages', 'Language Skills', '외국어',
-            'Language', '외국어 능력'
-        ]
+        rules = PATTERNS.extractor('languages')
         
-        for section in lang_sections:
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                section_text = text[start_pos:start_pos + 500]
-                
-                # 언어명과 수준 패턴 찾기
-                lang_patterns = [
-                    r'([가-힣a-zA-Z]+)\s*[:\s]*([가-힣a-zA-Z]+)',
-                    r'([가-힣a-zA-Z]+)\s*\(([가-힣a-zA-Z]+)\)',
-                ]
-                
-                for pattern in lang_patterns:
-                    matches = re.finditer(pattern, section_text)
-                    for match in matches:
-                        name = match.group(1).strip()
-                        level = match.group(2).strip()
-                        
-                        languages.append({
-                            'name': name,
-                            'level': level
-                        })
-                
-                break
+        # 언어명과 수준 찾기 (구분자만 사이에 둔 연속된 두 단어, 예: '영어 상급', '영어(상급)')
+        words = list(rules['word'].finditer(section_text))
+        i = 0
+        while i + 1 < len(words):
+            name, level = words[i], words[i + 1]
+            if rules['gap'].fullmatch(section_text, name.end(), level.start()):
+                languages.append({
+                    'name': name.group(),
+                    'level': level.group()
+                })
+                i += 2
+            else:
+                i += 1
         
         return languages
     
     @staticmethod
-    def _extract_projects(text: str) -> List[Dict[str, Any]]:
-        """프로젝트 경험 추출"""
+    def _extract_projects(section_text: str) -> List[Dict[str, Any]]:
+        """프로젝트 경험 추출 (프로젝트 섹션 범위)"""
         projects = []
         
-        # 프로젝트 관련 섹션 찾기
-        project_sections = [
-            '프로젝트', 'Projects', 'Project Experience', '개발 프로젝트',
-            'Project', 'Portfolio'
-        ]
-        
-        for section in project_sections:
-            section_match = re.search(rf'{section}[:\s]*', text, re.IGNORECASE)
-            if section_match:
-                start_pos = section_match.end()
-                section_text = text[start_pos:start_pos + 2000]
-                
-                # 프로젝트명과 기간 패턴 찾기
-                project_patterns = [
-                    r'([^,\n]+)\s*\(?(\d{4}\.?\d{2}\s*[-~]\s*\d{4}\.?\d{2})\)?',
-                    r'([^,\n]+)\s*(\d{4}\.?\d{2}\s*[-~]\s*\d{4}\.?\d{2})',
-                ]
-                
-                for pattern in project_patterns:
-                    matches = re.finditer(pattern, section_text)
-                    for match in matches:
-                        name = match.group(1).strip()
-                        period = match.group(2)
-                        
-                        projects.append({
-                            'name': name,
-                            'period': period,
-                            'description': "",
-                            'technologies': []
-                        })
-                
-                break
+        # 기간 앞의 프로젝트명 찾기
+        for label, anchor in ResumeParserService._find_labeled_anchors(section_text, PATTERNS.extractor('projects')):
+            projects.append({
+                'name': label.group().strip(),
+                'period': anchor.group(1),
+                'description': "",
+                'technologies': []
+            })
         
-        return projects 
\ No newline at end of file
+        return projects
\ No newline at end of file
@@ -0,0 +1,153 @@
+import json
+import re
+from typing import Any, Dict, List, NamedTuple, Pattern, Tuple
+from config.settings import Config
+
+# 패턴 항목에서 사용할 수 있는 정규식 플래그
+_FLAG_NAMES = {
+    'IGNORECASE': re.IGNORECASE,
+    'MULTILINE': re.MULTILINE,
+    'DOTALL': re.DOTALL
+}
+
+# 인라인 플래그 문자 (통합 스캐너에서 항목별 플래그를 유지하기 위해 사용)
+_INLINE_FLAGS = {
+    re.IGNORECASE: 'i',
+    re.MULTILINE: 'm',
+    re.DOTALL: 's'
+}
+
+class EntityMatch(NamedTuple):
+    """통합 스캐너가 찾은 엔티티 (종류, 시작 위치, 끝 위치, 값)"""
+    kind: str
+    start: int
+    end: int
+    value: str
+
+class ResumePatternRegistry:
+    """
+    이력서 파싱 패턴 레지스트리
+    
+    섹션 키워드, 엔티티 패턴, 날짜 패턴, 추출 패턴을 데이터 파일에서 읽어
+    한 번만 컴파일합니다. 추출 패턴 안의 {{이름}}은 같은 이름의 날짜 패턴으로
+    치환됩니다. 패턴 항목은 문자열 또는 {"pattern": ..., "flags": [...]} 형식입니다.
+    
+    추출 패턴은 섹션별로 역할(anchor, label, separator 등) → 패턴 항목으로
+    정의합니다. 모든 패턴은 선형 시간을 보장하도록 길이가 제한된 토큰이거나
+    뒤따르는 조건이 없는 단일 문자 클래스 반복만 사용해야 합니다.
+    """
+    
+    def __init__(self, spec: Dict[str, Any]):
+        self.section_keywords: Dict[str, List[str]] = spec['sections']
+        self.section_header, self.section_keyword_map = self._compile_section_header(
+            self.section_keywords,
+            spec.get('header_bullets', '')
+        )
+        
+        date_sources = spec.get('dates', {})
+        self.dates: Dict[str, Pattern] = {
+            name: re.compile(source) for name, source in date_sources.items()
+        }
+        self.entities: Dict[str, List[Pattern]] = {
+            name: [self._compile(entry, date_sources) for entry in entries]
+            for name, entries in spec.get('entities', {}).items()
+        }
+        self.entity_scanner, self._scanner_groups = self._compile_entity_scanner(
+            self.entities,
+            spec.get('entity_scan_order', list(self.entities))
+        )
+        self.extractors: Dict[str, Dict[str, Pattern]] = {
+            name: {role: self._compile(entry, date_sources) for role, entry in roles.items()}
+            for name, roles in spec.get('extractors', {}).items()
+        }
+        self.link_types: List[Tuple[str, Tuple[str, ...]]] = [
+            (rule['type'], tuple(rule['contains'])) for rule in spec.get('link_types', [])
+        ]
+    
+    @classmethod
+    def load(cls, path: str = None) -> 'ResumePatternRegistry':
+        """데이터 파일에서 레지스트리를 생성합니다. (기본값: Config.RESUME_PATTERNS_PATH)"""
+        with open(path or Config.RESUME_PATTERNS_PATH, encoding='utf-8') as spec_file:
+            return cls(json.load(spec_file))
+    
+    def entity(self, name: str) -> List[Pattern]:
+        """엔티티 패턴 목록을 반환합니다."""
+        return self.entities.get(name, [])
+    
+    def extractor(self, name: str) -> Dict[str, Pattern]:
+        """섹션 추출 패턴(역할 → 패턴)을 반환합니다."""
+        return self.extractors.get(name, {})
+    
+    def scan_entities(self, text: str) -> Dict[str, List[EntityMatch]]:
+        """
+        텍스트를 한 번 스캔하여 모든 엔티티(전화번호, 이메일, URL, 날짜 등)를 찾습니다.
+        
+        같은 위치에서 여러 엔티티가 가능하면 entity_scan_order의 앞 항목이 우선합니다.
+        
+        Returns:
+            엔티티 종류 → 위치 순 EntityMatch 목록
+        """
+        entities = {kind: [] for kind in self.entities}
+        for match in self.entity_scanner.finditer(text):
+            kind = self._scanner_groups[match.lastgroup]
+            entities[kind].append(EntityMatch(kind, match.start(), match.end(), match.group()))
+        return entities
+    
+    @staticmethod
+    def _compile(entry, date_sources: Dict[str, str] = None) -> Pattern:
+        if isinstance(entry, str):
+            source, flag_names = entry, []
+        else:
+            source, flag_names = entry['pattern'], entry.get('flags', [])
+        
+        for name, date_source in (date_sources or {}).items():
+            source = source.replace('{{' + name + '}}', date_source)
+        
+        flags = 0
+        for flag_name in flag_names:
+            flags |= _FLAG_NAMES[flag_name]
+        return re.compile(source, flags)
+    
+    @staticmethod
+    def _compile_entity_scanner(entities: Dict[str, List[Pattern]], scan_order: List[str]):
+        """엔티티 패턴들을 이름 있는 그룹의 단일 패턴으로 합칩니다."""
+        alternatives = []
+        groups = {}
+        for kind in scan_order:
+            for pattern in entities.get(kind, []):
+                group = f'e{len(groups)}'
+                groups[group] = kind
+                inline = ''.join(flag for bit, flag in _INLINE_FLAGS.items() if pattern.flags & bit)
+                source = f'(?{inline}:{pattern.pattern})' if inline else pattern.pattern
+                alternatives.append(f'(?P<{group}>{source})')
+        return re.compile('|'.join(alternatives) or '(?!)'), groups
+    
+    @staticmethod
+    def _compile_section_header(section_keywords: Dict[str, List[str]], bullets: str):
+        """
+        줄 시작에 고정된 섹션 헤더 패턴과 키워드 → 섹션 타입 매핑을 만듭니다.
+        
+        키워드 뒤에 줄 끝이나 콜론이 올 때만 헤더로 인정합니다. ('상', '기술'이 일반
+        단어 안에서, 'Project', 'Tools'가 "Project 일정 관리" 같은 본문 줄 첫머리에서
+        헤더로 잡혀 섹션이 잘리지 않도록)
+        """
+        keyword_sections = {}
+        for section, keywords in section_keywords.items():
+            for keyword in keywords:
+                keyword_sections.setdefault(keyword.lower(), section)
+        
+        def alternation(keywords):
+            # 긴 키워드를 먼저 시도 (예: 'Programming Languages'가 'Languages'보다 우선)
+            return '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)) or '(?!)'
+        
+        bullet_prefix = rf'(?:[{re.escape(bullets)}]+[ \t]*)?' if bullets else ''
+        
+        pattern = (
+            rf'^[ \t]*{bullet_prefix}'
+            rf'(?P<header>{alternation(keyword_sections)})(?=[ \t]*(?:[:：]|$))'
+            r'[ \t]*[:：]?[ \t]*'
+        )
+        return re.compile(pattern, re.IGNORECASE | re.MULTILINE), keyword_sections
+
+# 프로세스 전역 패턴 레지스트리 (임포트 시 1회 컴파일)
+PATTERNS = ResumePatternRegistry.load()
@@ -0,0 +1,163 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from services.pdf_service import PDFService
+from services.resume_parser_service import ParseResult
+from services.prediction_pool import run_prediction
+from config.settings import Config
+
+# AIModelService 입력 특성 (모델 컬럼 순서)
+MODEL_FEATURES = (
+    'age', 'school', 'major', 'gpa',
+    'language_score', 'activity_score', 'internship_score', 'award_score'
+)
+
+# 어학 수준 → 어학점수 라벨 (1: 하, 2: 중, 3: 상)
+_LANGUAGE_LEVEL_LABELS = {
+    '상': 3, '상급': 3, '고급': 3, '원어민': 3, 'native': 3, 'fluent': 3, 'advanced': 3,
+    '중': 2, '중급': 2, '비즈니스': 2, 'business': 2, 'intermediate': 2,
+    '하': 1, '하급': 1, '초급': 1, 'beginner': 1, 'basic': 1
+}
+
+class ResumeTextNotFound(Exception):
+    """PDF에서 이력서 텍스트를 추출할 수 없을 때 발생하는 예외"""
+
+class ResumeFeatureError(Exception):
+    """이력서와 요청 값으로 모델 입력 특성을 만들 수 없을 때 발생하는 예외"""
+
+class PipelineResult(NamedTuple):
+    """이력서 분석 파이프라인 결과"""
+    parse: ParseResult
+    text: str
+    features: Dict[str, float]
+    feature_sources: Dict[str, str]
+    probabilities: Dict[str, float]
+    timings_ms: Dict[str, float]
+
+class ResumePipelineService:
+    """이력서 PDF → 텍스트 추출 → 파싱 → 특성 도출 → 기업 확률 예측 파이프라인"""
+    
+    @staticmethod
+    def run(pdf_bytes: bytes, overrides: Mapping[str, float], ai_service) -> PipelineResult:
+        """
+        메모리의 PDF 데이터 하나로 전체 단계를 실행합니다.
+        
+        추출한 텍스트와 파싱 결과는 다음 단계에 그대로 전달되며, 임시 파일을
+        만들거나 텍스트를 다시 직렬화하지 않습니다.
+        
+        Args:
+            pdf_bytes: PDF 데이터
+            overrides: 요청에서 지정한 특성 값 (파싱 결과로 도출한 값보다 우선)
+            ai_service: 모델이 로드된 AIModelService 인스턴스
+        
+        Returns:
+            PipelineResult: 파싱 결과, 모델 입력 특성과 출처, 기업별 확률, 단계별 소요 시간(ms)
+        
+        Raises:
+            ResumeTextNotFound: 추출된 텍스트가 없을 때
+            ResumeFeatureError: 필수 특성이 없거나 유효하지 않을 때
+        """
+        timings = {}
+        
+        def timed(name, func, *args):
+            start = time.perf_counter()
+            result = func(*args)
+            timings[name] = round((time.perf_counter() - start) * 1000, 3)
+            return result
+        
+        # 추출과 파싱은 한 번의 호출로 수행 (워커 풀을 사용하면 워커 프로세스에서 실행)
+        parsed = PDFService.parse_resume_from_bytes(pdf_bytes)
+        timings.update(parsed.timings_ms)
+        text, parse = parsed.text, parsed.result
+        if not text:
+            raise ResumeTextNotFound("PDF 파일이 텍스트를 포함하지 않거나 이미지로만 구성되어 있습니다.")
+        
+        features, sources = timed('features', ResumePipelineService.derive_features, parse.data, overrides)
+        
+        if not ai_service._validate_input_data(features):
+            raise ResumeFeatureError(f"모델 입력 특성이 유효하지 않습니다: {features}")
+        probabilities = timed('predict', run_prediction, ai_service.predict_company_probabilities, features)
+        
+        return PipelineResult(parse, text, features, sources, probabilities, timings)
+    
+    @staticmethod
+    def derive_features(parsed_data: Mapping[str, Any],
+                        overrides: Mapping[str, float] = None) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        파싱 결과와 요청 값으로 모델 입력 특성 8개를 만듭니다.
+        
+        - award_score: 수상 건수 × Config.RESUME_AWARD_POINTS
+        - internship_score: 경력 기간의 합 (개월, 진행 중이면 현재까지)
+        - activity_score: 프로젝트 건수 × Config.RESUME_ACTIVITY_POINTS
+        - language_score: 어학 수준 중 가장 높은 라벨 (수준을 알 수 없으면 도출하지 않음)
+        
+        나이, 학교, 전공, 학점은 이력서에서 도출하지 않으므로 요청에 포함되어야 합니다.
+        
+        Args:
+            parsed_data: 이력서 파싱 결과
+            overrides: 요청에서 지정한 특성 값 (None 값은 무시)
+        
+        Returns:
+            (특성 → 값, 특성 → 출처('request' 또는 'resume'))
+        
+        Raises:
+            ResumeFeatureError: 요청에도 없고 이력서에서도 도출할 수 없는 특성이 있을 때
+        """
+        derived = {
+            'award_score': len(parsed_data.get('awards', ())) * Config.RESUME_AWARD_POINTS,
+            'internship_score': ResumePipelineService._experience_months(parsed_data.get('experiences', ())),
+            'activity_score': len(parsed_data.get('projects', ())) * Config.RESUME_ACTIVITY_POINTS,
+            'language_score': ResumePipelineService._language_label(parsed_data.get('languages', ()))
+        }
+        
+        features = {}
+        sources = {}
+        missing = []
+        for feature in MODEL_FEATURES:
+            value = (overrides or {}).get(feature)
+            if value is not None:
+                features[feature], sources[feature] = value, 'request'
+            elif derived.get(feature) is not None:
+                features[feature], sources[feature] = derived[feature], 'resume'
+            else:
+                missing.append(feature)
+        
+        if missing:
+            raise ResumeFeatureError(f"요청에 포함되어야 하는 특성이 없습니다: {', '.join(missing)}")
+        
+        return features, sources
+    
+    @staticmethod
+    def _experience_months(experiences, today: datetime = None) -> int:
+        """경력 기간의 합을 개월 수로 계산합니다. (날짜를 읽을 수 없는 항목은 제외)"""
+        today = today or datetime.now()
+        months = 0
+        
+        for experience in experiences:
+            start = ResumePipelineService._year_month(experience.get('start_date'))
+            end = ResumePipelineService._year_month(experience.get('end_date')) or (today.year, today.month)
+            if start is None or end < start:
+                continue
+            # 시작 월과 종료 월을 모두 포함
+            months += (end[0] - start[0]) * 12 + (end[1] - start[1]) + 1
+        
+        return months
+    
+    @staticmethod
+    def _year_month(value: Optional[str]) -> Optional[Tuple[int, int]]:
+        """'2020.03' 또는 '202003' 형식의 날짜를 (연, 월)로 변환합니다. ('현재' 등은 None)"""
+        digits = (value or '').replace('.', '')
+        if len(digits) != 6 or not digits.isdigit():
+            return None
+        year, month = int(digits[:4]), int(digits[4:])
+        return (year, month) if 1 <= month <= 12 else None
+    
+    @staticmethod
+    def _language_label(languages: List[Mapping[str, str]]) -> Optional[int]:
+        """어학 수준 중 가장 높은 어학점수 라벨을 반환합니다. (알 수 있는 수준이 없으면 None)"""
+        labels = [
+            _LANGUAGE_LEVEL_LABELS.get(language.get('level', '').strip().lower())
+            for language in languages
+        ]
+        labels = [label for label in labels if label is not None]
+        return max(labels) if labels else None
@@ -0,0 +1,164 @@
+import copy
+import threading
+from typing import Any, Dict, List
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Flowable
+from services.pdf_compact import CompactCanvas
+from services.pdf_fonts import get_pdf_font_name
+
+# 템플릿 버전 (레이아웃이나 스타일이 바뀌면 올려서 생성된 PDF 캐시를 무효화)
+TEMPLATE_VERSION = '1'
+
+# 문단 스타일 정의: 이름 → (스타일 이름, 부모 스타일, 속성)
+_PARAGRAPH_STYLES = {
+    'title': ('CustomTitle', 'Heading1', {'fontSize': 24, 'spaceAfter': 30, 'alignment': 1}),  # 중앙 정렬
+    'section': ('SectionTitle', 'Heading2', {
+        'fontSize': 16, 'spaceAfter': 12, 'spaceBefore': 20, 'textColor': colors.darkblue
+    }),
+    'content': ('CustomNormal', 'Normal', {'fontSize': 10})
+}
+
+# 표 스타일 정의: 이름 → 명령 목록 ('{font}'은 템플릿 폰트로 치환)
+_TABLE_STYLES = {
+    'basic_info': [
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), '{font}'),
+        ('FONTNAME', (1, 0), (1, -1), '{font}'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]
+}
+
+# 섹션 정의 (출력 순서): (섹션 이름, 제목, 데이터 키 - None이면 항상 출력)
+_SECTIONS = (
+    ('basic_info', 'Basic Information', None),
+    ('education', 'Education', 'education'),
+    ('experience', 'Experience', 'experience'),
+    ('skills', 'Skills', 'skills'),
+    ('introduction', 'Introduction', 'introduction')
+)
+
+class ResumeTemplate:
+    """
+    이력서 PDF 템플릿
+    
+    문단/표 스타일과 섹션 제목, 간격 같은 데이터와 무관한 플로어블은 생성 시 한 번만
+    만들고, 요청마다 이력서 데이터에 따라 달라지는 플로어블만 새로 만듭니다.
+    정적 플로어블은 레이아웃 중 자신의 속성(크기, 줄 나눔 결과)을 기록하므로
+    요청마다 얕은 복사본을 사용하며, 파싱된 문단 조각은 복사본끼리 공유합니다.
+    """
+    
+    def __init__(self, font_name: str = None):
+        self.font_name = font_name or get_pdf_font_name()
+        stylesheet = getSampleStyleSheet()
+        
+        self.styles: Dict[str, ParagraphStyle] = {
+            key: ParagraphStyle(name, parent=stylesheet[parent], fontName=self.font_name, **attrs)
+            for key, (name, parent, attrs) in _PARAGRAPH_STYLES.items()
+        }
+        self.table_styles: Dict[str, TableStyle] = {
+            key: TableStyle([
+                tuple(self.font_name if value == '{font}' else value for value in command)
+                for command in commands
+            ])
+            for key, commands in _TABLE_STYLES.items()
+        }
+        
+        # 정적 플로어블 원본 (섹션 제목, 간격)
+        self._headings: Dict[str, Paragraph] = {
+            section: Paragraph(title, self.styles['section']) for section, title, _ in _SECTIONS
+        }
+        self._spacers: Dict[int, Spacer] = {height: Spacer(1, height) for height in (6, 12, 20)}
+    
+    def render(self, resume_data: Dict[str, Any], buffer, invariant: bool = False, compact: bool = False):
+        """
+        이력서 데이터를 PDF로 렌더링하여 buffer에 씁니다.
+        
+        Args:
+            resume_data: 이력서 데이터
+            buffer: PDF를 쓸 파일 객체
+            invariant: True이면 생성 시각과 문서 ID를 고정하여 같은 데이터는 항상 같은 바이트로 렌더링
+            compact: True이면 크기를 줄인 PDF로 렌더링 (pdf_compact.CompactCanvas)
+        """
+        doc = SimpleDocTemplate(buffer, pagesize=A4, invariant=1 if invariant else None)
+        if compact:
+            doc.build(self.build_story(resume_data), canvasmaker=CompactCanvas)
+        else:
+            doc.build(self.build_story(resume_data))
+    
+    def build_story(self, resume_data: Dict[str, Any]) -> List[Flowable]:
+        """이력서 데이터로 플로어블 목록을 만듭니다."""
+        story = [
+            Paragraph(resume_data.get('name', 'Resume'), self.styles['title']),
+            self._spacer(20)
+        ]
+        
+        for section, _, data_key in _SECTIONS:
+            if data_key is not None and not resume_data.get(data_key):
+                continue
+            story.append(copy.copy(self._headings[section]))
+            getattr(self, f'_build_{section}')(resume_data, story)
+        
+        return story
+    
+    def _spacer(self, height: int) -> Spacer:
+        return copy.copy(self._spacers[height])
+    
+    def _build_basic_info(self, resume_data, story):
+        """기본 정보 표"""
+        basic_info = [
+            ['Name:', resume_data.get('name', '')],
+            ['Email:', resume_data.get('email', '')],
+            ['Phone:', resume_data.get('phone', '')],
+            ['Address:', resume_data.get('address', '')]
+        ]
+        basic_table = Table(basic_info, colWidths=[1.5*inch, 4*inch])
+        basic_table.setStyle(self.table_styles['basic_info'])
+        story.append(basic_table)
+        story.append(self._spacer(12))
+    
+    def _build_education(self, resume_data, story):
+        """학력"""
+        for edu in resume_data.get('education', []):
+            edu_text = f"{edu.get('school', '')} ({edu.get('period', '')})<br/>"
+            edu_text += f"{edu.get('major', '')} - {edu.get('degree', '')}"
+            story.append(Paragraph(edu_text, self.styles['content']))
+            story.append(self._spacer(6))
+        story.append(self._spacer(12))
+    
+    def _build_experience(self, resume_data, story):
+        """경력"""
+        for exp in resume_data.get('experience', []):
+            exp_text = f"<b>{exp.get('company', '')}</b> ({exp.get('period', '')})<br/>"
+            exp_text += f"<b>{exp.get('position', '')}</b><br/>"
+            exp_text += f"{exp.get('description', '')}"
+            story.append(Paragraph(exp_text, self.styles['content']))
+            story.append(self._spacer(6))
+        story.append(self._spacer(12))
+    
+    def _build_skills(self, resume_data, story):
+        """기술 스택"""
+        skills_text = ', '.join(resume_data.get('skills', []))
+        story.append(Paragraph(skills_text, self.styles['content']))
+        story.append(self._spacer(12))
+    
+    def _build_introduction(self, resume_data, story):
+        """자기소개"""
+        story.append(Paragraph(resume_data.get('introduction', ''), self.styles['content']))
+
+_templates: Dict[str, ResumeTemplate] = {}
+_templates_lock = threading.Lock()
+
+def get_resume_template(font_name: str = None) -> ResumeTemplate:
+    """폰트별로 한 번만 생성한 프로세스 전역 템플릿을 반환합니다. (기본값: 등록된 한글 폰트)"""
+    font_name = font_name or get_pdf_font_name()
+    template = _templates.get(font_name)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(font_name)
+            if template is None:
+                template = _templates[font_name] = ResumeTemplate(font_name)
+    return template
@@ -0,0 +1,143 @@
+import json
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from config.settings import Config
+
+class SkillMatch(NamedTuple):
+    """사전에서 찾은 기술 (정규 ID, 표준 이름, 시작 위치, 끝 위치, 원문)"""
+    skill_id: str
+    name: str
+    start: int
+    end: int
+    text: str
+
+def _is_word_char(char: str) -> bool:
+    """영문/숫자 경계 판정용 문자 여부 (한글 조사는 경계로 취급하지 않음)"""
+    return char.isascii() and char.isalnum()
+
+class SkillMatcher:
+    """
+    Aho-Corasick 오토마톤 기반 기술 사전 매처
+    
+    기술 사전(정규 ID, 표준 이름, 별칭)을 한 번만 컴파일하고, 텍스트를 한 번
+    스캔하여 모든 별칭을 O(텍스트 길이 + 매치 수)로 찾습니다. 영문/숫자로 끝나는
+    별칭은 앞뒤가 영문/숫자가 아닐 때만 인정하며('Java'는 'JavaScript'에서 제외),
+    같은 위치에서 겹치는 매치는 가장 왼쪽의 가장 긴 별칭을 우선합니다.
+    """
+    
+    def __init__(self, spec: Dict[str, Any]):
+        self.skills: Dict[str, Dict[str, Any]] = {}
+        # 노드별 전이 테이블, 실패 링크, 출력 (별칭 길이, 별칭 번호)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, int]]] = [[]]
+        # 별칭 번호 → (정규 ID, 대소문자 구분 시 원래 별칭)
+        self._aliases: List[Tuple[str, Optional[str]]] = []
+        
+        for skill in spec.get('skills', []):
+            skill_id = skill['id']
+            self.skills[skill_id] = skill
+            case_sensitive_aliases = skill.get('case_sensitive_aliases', [])
+            # 표준 이름이 대소문자 구분 별칭이면 대소문자 무시로 다시 추가하지 않음 ('go', 'c' 제외)
+            names = [] if skill['name'] in case_sensitive_aliases else [skill['name']]
+            for alias in names + skill.get('aliases', []):
+                self._add_alias(alias, skill_id, None)
+            for alias in case_sensitive_aliases:
+                self._add_alias(alias, skill_id, alias)
+        
+        self._build_failure_links()
+    
+    @classmethod
+    def load(cls, path: str = None) -> 'SkillMatcher':
+        """데이터 파일에서 매처를 생성합니다. (기본값: Config.SKILL_DICTIONARY_PATH)"""
+        with open(path or Config.SKILL_DICTIONARY_PATH, encoding='utf-8') as spec_file:
+            return cls(json.load(spec_file))
+    
+    def find(self, text: str) -> List[SkillMatch]:
+        """
+        텍스트에서 사전의 기술을 찾습니다.
+        
+        Args:
+            text: 검색할 텍스트
+        
+        Returns:
+            List[SkillMatch]: 위치 순으로 정렬된 겹치지 않는 매치 목록
+        """
+        lowered = self._lower(text)
+        candidates = []
+        state = 0
+        
+        for index, char in enumerate(lowered):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            
+            for length, alias_no in self._output[state]:
+                start, end = index + 1 - length, index + 1
+                if self._accept(text, start, end, alias_no):
+                    candidates.append((start, end, alias_no))
+        
+        # 가장 왼쪽의 가장 긴 매치부터 선택하고 겹치는 매치는 제외
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[0] - candidate[1]))
+        matches = []
+        covered_until = 0
+        for start, end, alias_no in candidates:
+            if start < covered_until:
+                continue
+            skill_id = self._aliases[alias_no][0]
+            matches.append(SkillMatch(skill_id, self.skills[skill_id]['name'], start, end, text[start:end]))
+            covered_until = end
+        
+        return matches
+    
+    def _add_alias(self, alias: str, skill_id: str, case_sensitive: Optional[str]):
+        """별칭을 트라이에 추가합니다."""
+        alias_no = len(self._aliases)
+        self._aliases.append((skill_id, case_sensitive))
+        
+        state = 0
+        for char in self._lower(alias):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(alias), alias_no))
+    
+    def _build_failure_links(self):
+        """너비 우선으로 실패 링크를 만들고 출력을 병합합니다."""
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+                pending.append(next_state)
+    
+    def _accept(self, text: str, start: int, end: int, alias_no: int) -> bool:
+        """대소문자 구분 별칭과 영문/숫자 단어 경계를 확인합니다."""
+        case_sensitive = self._aliases[alias_no][1]
+        if case_sensitive is not None and text[start:end] != case_sensitive:
+            return False
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+            return False
+        return True
+    
+    @staticmethod
+    def _lower(text: str) -> str:
+        """위치가 바뀌지 않도록 문자 단위로 소문자 변환합니다."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+# 프로세스 전역 기술 사전 (임포트 시 1회 컴파일)
+SKILLS = SkillMatcher.load()
@@ -397,6 +397,36 @@ def test_pdf_text_extraction():
     except Exception as e:
         print(f"❌ 오류 발생: {str(e)}")
 
+def test_pdf_inspection():
+    """PDF 사전 검사 테스트"""
+    print("\n=== PDF 사전 검사 테스트 ===")
+    
+    # 테스트용 PDF 파일 경로 (실제 파일이 있어야 함)
+    pdf_file_path = "test_resume.pdf"
+    
+    if not os.path.exists(pdf_file_path):
+        print(f"테스트 파일이 없습니다: {pdf_file_path}")
+        return
+    
+    try:
+        with open(pdf_file_path, 'rb') as f:
+            files = {'file': f}
+            response = requests.post(f"{BASE_URL}/api/documents/inspect", files=files)
+        
+        if response.status_code == 200:
+            result = response.json()
+            print("✅ 사전 검사 성공!")
+            print(f"페이지 수: {result.get('page_count')}")
+            print(f"암호화 여부: {result.get('encrypted')}")
+            print(f"텍스트 레이어: {result.get('has_text_layer')}")
+            print(f"검사 시간: {result.get('elapsed_ms')}ms")
+        else:
+            print(f"❌ 사전 검사 실패: {response.status_code}")
+            print(response.text)
+            
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
 def test_resume_parsing():
     """이력서 파싱 테스트"""
     print("\n=== 이력서 파싱 테스트 ===")
@@ -449,6 +479,41 @@ def test_resume_parsing():
     except Exception as e:
         print(f"❌ 오류 발생: {str(e)}")
 
+def test_resume_batch_parsing():
+    """이력서 일괄 파싱 테스트"""
+    print("\n=== 이력서 일괄 파싱 테스트 ===")
+    
+    # 테스트용 PDF 파일 경로 (실제 파일이 있어야 함)
+    pdf_file_path = "test_resume.pdf"
+    
+    if not os.path.exists(pdf_file_path):
+        print(f"테스트 파일이 없습니다: {pdf_file_path}")
+        return
+    
+    try:
+        with open(pdf_file_path, 'rb') as f:
+            pdf_content = f.read()
+        
+        files = [('files', (f"resume_{i}.pdf", pdf_content, 'application/pdf')) for i in range(3)]
+        response = requests.post(
+            f"{BASE_URL}/api/documents/parse-resume/batch",
+            params={'concurrency': 2},
+            files=files
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            print("✅ 일괄 파싱 성공!")
+            print(f"전체: {result.get('total')}, 성공: {result.get('succeeded')}, 실패: {result.get('failed')}")
+            for item in result.get('results', []):
+                print(f"  - {item.get('filename')}: {item.get('status')}")
+        else:
+            print(f"❌ 일괄 파싱 실패: {response.status_code}")
+            print(response.text)
+            
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
 def test_legacy_endpoints():
     """기존 URL 엔드포인트 테스트"""
     print("\n=== 기존 URL 호환성 테스트 ===")
@@ -598,9 +663,15 @@ def main():
     # PDF 텍스트 추출 테스트
     test_pdf_text_extraction()
     
+    # PDF 사전 검사 테스트
+    test_pdf_inspection()
+    
     # 이력서 파싱 테스트
     test_resume_parsing()
     
+    # 이력서 일괄 파싱 테스트
+    test_resume_batch_parsing()
+    
     # 기존 URL 호환성 테스트
     test_legacy_endpoints()
     
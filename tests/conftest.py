@@ -0,0 +1,18 @@
+import contextlib
+import io
+import pytest
+from config.settings import Config
+
+@pytest.fixture(scope='session')
+def app():
+    """테스트용 Flask 앱 (생성 시 출력되는 로그는 숨김)"""
+    from app import create_app
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        return create_app()
+
+@pytest.fixture
+def client(app, monkeypatch):
+    """PDF 캐시를 끈 테스트 클라이언트 (요청마다 실제로 렌더링/추출)"""
+    monkeypatch.setattr(Config, 'PDF_CACHE_ENABLED', False)
+    return app.test_client()
@@ -0,0 +1,135 @@
+import io
+import zipfile
+import pytest
+from benchmarks.fixtures import PREDICTION_REQUEST, build_text_pdf
+from config.settings import Config
+from services import admission_control
+from services.admission_control import AdmissionLimiter, AdmissionRejected
+from services.batch_service import BatchInputError, BatchService
+
+@pytest.fixture
+def saturated(monkeypatch):
+    """작업 종류 하나의 리미터를 슬롯 1개, 대기열 0개로 바꾸고 슬롯을 점유합니다."""
+    monkeypatch.setattr(Config, 'ADMISSION_CONTROL_ENABLED', True)
+    held = []
+    
+    def saturate(work_class):
+        limiter = AdmissionLimiter(work_class, limit=1, queue_size=0, queue_timeout=0.05)
+        monkeypatch.setitem(admission_control._limiters, work_class, limiter)
+        held.append((limiter, limiter.acquire()))
+        return limiter
+    
+    yield saturate
+    for limiter, start in held:
+        limiter.release(start)
+
+def build_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+def test_limiter_rejects_when_queue_is_full():
+    limiter = AdmissionLimiter('test', limit=1, queue_size=0)
+    start = limiter.acquire()
+    
+    with pytest.raises(AdmissionRejected) as excinfo:
+        limiter.acquire()
+    assert excinfo.value.work_class == 'test' and excinfo.value.retry_after >= 1
+    
+    limiter.release(start)
+    limiter.release(limiter.acquire())
+    assert limiter.info()['admitted'] == 2 and limiter.info()['rejected'] == 1
+
+def test_limiter_rejects_after_queue_timeout():
+    limiter = AdmissionLimiter('test', limit=1, queue_size=1, queue_timeout=0.05)
+    start = limiter.acquire()
+    
+    with pytest.raises(AdmissionRejected):
+        limiter.acquire()
+    assert limiter.info()['waiting'] == 0
+    limiter.release(start)
+
+def test_route_returns_429_with_retry_after(client, saturated):
+    saturated('prediction')
+    
+    response = client.post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+    assert response.status_code == 429
+    assert response.get_json()['code'] == 'TOO_MANY_REQUESTS'
+    assert int(response.headers['Retry-After']) >= 1
+
+def test_other_work_classes_are_not_rejected(client, saturated):
+    saturated('pdf_generation')
+    
+    response = client.post('/api/ai/analyze-probability', json=PREDICTION_REQUEST)
+    assert response.status_code == 200
+
+def test_batch_charges_admission_per_file(client, saturated):
+    saturated('pdf_extraction')
+    pdf_bytes = build_text_pdf(pages=1)
+    
+    response = client.post(
+        '/api/documents/convert/batch',
+        data={'files': [(io.BytesIO(pdf_bytes), 'a.pdf'), (io.BytesIO(pdf_bytes), 'b.pdf')]},
+        content_type='multipart/form-data'
+    )
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [item['status_code'] for item in body['results']] == [429, 429]
+    assert all(item['retry_after'] >= 1 for item in body['results'])
+
+def test_batch_concurrency_is_capped_by_admission_limit(monkeypatch):
+    monkeypatch.setattr(Config, 'ADMISSION_CONTROL_ENABLED', True)
+    monkeypatch.setattr(Config, 'ADMISSION_PDF_EXTRACTION_LIMIT', 4)
+    # 단건 업로드용으로 슬롯의 절반을 남김
+    assert BatchService.resolve_concurrency(8) == 2
+    assert BatchService.resolve_concurrency(1) == 1
+    
+    monkeypatch.setattr(Config, 'ADMISSION_PDF_EXTRACTION_LIMIT', 1)
+    assert BatchService.resolve_concurrency(8) == 1
+    
+    monkeypatch.setattr(Config, 'ADMISSION_CONTROL_ENABLED', False)
+    assert BatchService.resolve_concurrency(8) == min(8, Config.BATCH_MAX_CONCURRENCY)
+
+def test_zip_entries_are_read_inside_the_task(monkeypatch):
+    pdf_bytes = build_text_pdf(pages=1)
+    reads = []
+    read_zip_entry = BatchService._read_zip_entry
+    
+    def recording_read(zip_bytes, info):
+        reads.append(info.filename)
+        return read_zip_entry(zip_bytes, info)
+    
+    monkeypatch.setattr(BatchService, '_read_zip_entry', staticmethod(recording_read))
+    upload = type('Upload', (), {'filename': 'resumes.zip', 'read': lambda self: build_zip([
+        ('a.pdf', pdf_bytes), ('notes.txt', b'skip'), ('dir/b.pdf', pdf_bytes)
+    ])})()
+    
+    pdf_files = BatchService.collect_pdf_files([upload])
+    assert [name for name, _ in pdf_files] == ['a.pdf', 'b.pdf'] and reads == []
+    
+    results = list(BatchService.process(pdf_files, lambda load: len(load()), concurrency=2))
+    assert sorted(reads) == ['a.pdf', 'dir/b.pdf']
+    assert {size for _, _, size in results} == {len(pdf_bytes)}
+
+def test_unreadable_zip_entry_becomes_a_failed_item(client):
+    pdf_bytes = build_text_pdf(pages=1)
+    zip_bytes = bytearray(build_zip([('a.pdf', pdf_bytes), ('b.pdf', pdf_bytes)]))
+    # 첫 항목의 압축 데이터만 손상 (목차는 그대로 유지)
+    offset = zip_bytes.index(b'a.pdf') + len('a.pdf')
+    zip_bytes[offset + 10:offset + 60] = b'\x00' * 50
+    
+    response = client.post(
+        '/api/documents/convert/batch',
+        data={'files': [(io.BytesIO(bytes(zip_bytes)), 'resumes.zip')]},
+        content_type='multipart/form-data'
+    )
+    items = {item['filename']: item for item in response.get_json()['results']}
+    assert items['a.pdf']['status_code'] == 400 and items['a.pdf']['code'] == 'INVALID_ZIP_ENTRY'
+    assert items['b.pdf']['status_code'] == 200
+
+def test_invalid_zip_is_rejected_up_front():
+    upload = type('Upload', (), {'filename': 'resumes.zip', 'read': lambda self: b'not a zip'})()
+    with pytest.raises(BatchInputError):
+        BatchService.collect_pdf_files([upload])
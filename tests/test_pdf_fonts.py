@@ -0,0 +1,36 @@
+import os
+import pytest
+import reportlab
+from config.settings import Config
+from services import pdf_fonts
+
+VERA_PATH = os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'Vera.ttf')
+
+@pytest.fixture
+def register(monkeypatch):
+    """프로세스 전역 폰트 등록 상태를 비우고 지정한 폰트 파일로 다시 등록합니다."""
+    
+    def register_font(name, path, bold_path=''):
+        monkeypatch.setattr(pdf_fonts, '_font_name', None)
+        monkeypatch.setattr(pdf_fonts, '_font_info', {})
+        monkeypatch.setattr(Config, 'PDF_KOREAN_FONT_NAME', name)
+        monkeypatch.setattr(Config, 'PDF_KOREAN_FONT_PATH', path)
+        monkeypatch.setattr(Config, 'PDF_KOREAN_FONT_BOLD_PATH', bold_path)
+        return pdf_fonts.get_pdf_font_name(), pdf_fonts.get_pdf_font_info()
+    
+    return register_font
+
+def test_font_without_hangul_falls_back_to_cid_font(register):
+    # Vera는 ToUnicode 왕복은 통과하지만 한글 글리프가 없음
+    assert not pdf_fonts.has_hangul_glyphs(pdf_fonts.load_ttf_font('VeraCoverage', VERA_PATH))
+    
+    name, info = register('VeraKorean', VERA_PATH)
+    assert name == Config.PDF_KOREAN_CID_FONT_NAME
+    assert info['hangul_glyphs'] is False and info['rejected_path'] == VERA_PATH
+    assert info['text_roundtrip'] is True
+
+@pytest.mark.skipif(not os.path.exists(Config.PDF_KOREAN_FONT_PATH), reason='한글 TTF 폰트가 없는 환경')
+def test_korean_font_is_used_when_it_has_hangul(register):
+    name, info = register('KoreanCoverage', Config.PDF_KOREAN_FONT_PATH)
+    assert name == 'KoreanCoverage'
+    assert info['hangul_glyphs'] is True and info['text_roundtrip'] is True
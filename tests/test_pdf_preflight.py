@@ -0,0 +1,57 @@
+import io
+import pytest
+from config.settings import Config
+from services.pdf_service import PDFService
+
+FORM_TEXT = b'BT /F1 12 Tf 72 720 Td (Hello resume) Tj ET\n'
+HELVETICA = b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+
+def build_pdf(objects):
+    """객체 본문 목록(1번부터 번호 부여, 1번은 Catalog)으로 xref가 있는 PDF를 만듭니다."""
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(out)
+
+def stream(entries, data):
+    return b'<< ' + entries + b' /Length %d >>\nstream\n' % len(data) + data + b'\nendstream'
+
+def build_form_pdf(page_font=True, form_resources=b''):
+    """페이지 콘텐츠는 Form XObject 호출뿐이고 텍스트는 Form 안에만 있는 PDF"""
+    page_resources = (b'/Font << /F1 6 0 R >> ' if page_font else b'') + b'/XObject << /Fm1 5 0 R >>'
+    return build_pdf([
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << ' + page_resources
+        + b' >> /Contents 4 0 R >>',
+        stream(b'', b'/Fm1 Do\n'),
+        stream(b'/Type /XObject /Subtype /Form /BBox [0 0 612 792] ' + form_resources, FORM_TEXT),
+        HELVETICA
+    ])
+
+@pytest.mark.parametrize('page_font, form_resources, expected', [
+    # 자체 /Resources가 없는 Form은 페이지 리소스(폰트)를 상속
+    (True, b'', True),
+    (False, b'/Resources << /Font << /F1 6 0 R >> >>', True),
+    (False, b'', False)
+])
+def test_text_inside_form_xobject(page_font, form_resources, expected):
+    inspection = PDFService.inspect_pdf(io.BytesIO(build_form_pdf(page_font, form_resources)))
+    assert inspection['has_text_layer'] is expected
+
+def test_form_inheriting_page_resources_is_not_rejected(client, monkeypatch):
+    monkeypatch.setattr(Config, 'PDF_PREFLIGHT_ENABLED', True)
+    
+    response = client.post(
+        '/api/documents/convert',
+        data={'file': (io.BytesIO(build_form_pdf()), 'resume.pdf')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 200
+    assert response.get_json()['content'] == 'Hello resume'
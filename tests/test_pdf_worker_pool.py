@@ -0,0 +1,87 @@
+import io
+import os
+import pytest
+from benchmarks.fixtures import build_text_pdf
+from config.settings import Config
+from services import pdf_worker_pool
+from services.pdf_worker_pool import PDFExtractionMemoryExceeded, PDFExtractionTimeout, PDFWorkerPool
+
+@pytest.fixture
+def make_pool():
+    pools = []
+    
+    def make(**kwargs):
+        pool = PDFWorkerPool(processes=1, **kwargs)
+        pools.append(pool)
+        return pool
+    
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+def worker_rss_mb(pool):
+    """유휴 워커 프로세스의 현재 RSS (MB)"""
+    worker = pool._idle.queue[0]
+    with open(f'/proc/{worker.process.pid}/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def test_worker_start_up_is_not_charged_to_the_task_timeout(make_pool):
+    # 프로세스 시작과 pdfplumber 임포트만으로도 0.3초를 넘지만 작업 시간에는 포함되지 않음
+    pool = make_pool(timeout=0.3, max_tasks_per_worker=1)
+    pdf_bytes = build_text_pdf(pages=1)
+    
+    for _ in range(3):
+        assert pool.extract_text(pdf_bytes).startswith('Page 1')
+
+def test_timeout_kills_worker_and_pool_recovers(make_pool):
+    pool = make_pool(timeout=30)
+    pool.extract_text(build_text_pdf(pages=1))
+    
+    with pytest.raises(PDFExtractionTimeout):
+        pool.run('analyze', build_text_pdf(pages=20), timeout=0.05, artifacts=('text', 'words'))
+    assert pool.extract_text(build_text_pdf(pages=1)).startswith('Page 1')
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason='/proc이 없는 환경')
+def test_memory_cap_kills_worker_and_pool_recovers(make_pool):
+    probe = make_pool(max_rss_mb=0)
+    probe.extract_text(build_text_pdf(pages=1))
+    idle_rss_mb = worker_rss_mb(probe)
+    
+    pool = make_pool(max_rss_mb=int(idle_rss_mb) + 2)
+    with pytest.raises(PDFExtractionMemoryExceeded):
+        pool.run('analyze', build_text_pdf(pages=40), artifacts=('text', 'words'))
+    assert pool.extract_text(build_text_pdf(pages=1)).startswith('Page 1')
+
+@pytest.mark.parametrize('error, status_code, code', [
+    (PDFExtractionTimeout('timeout'), 504, 'PDF_EXTRACTION_TIMEOUT'),
+    (PDFExtractionMemoryExceeded('memory'), 422, 'PDF_EXTRACTION_MEMORY_EXCEEDED')
+])
+def test_worker_errors_map_to_responses(error, status_code, code):
+    from routes.pdf_routes import pdf_worker_error_response
+    
+    body, status = pdf_worker_error_response(error)
+    assert (status, body['code'], body['details']) == (status_code, code, str(error))
+
+@pytest.mark.parametrize('worker_pool, bulkhead, expected', [
+    (False, False, False), (True, False, True), (False, True, True)
+])
+def test_bulkhead_alone_isolates_extraction(monkeypatch, worker_pool, bulkhead, expected):
+    from services.pdf_service import PDFService
+    
+    monkeypatch.setattr(Config, 'PDF_WORKER_POOL_ENABLED', worker_pool)
+    monkeypatch.setattr(Config, 'BULKHEAD_ENABLED', bulkhead)
+    assert PDFService.use_worker_pool() is expected
+
+def test_convert_route_returns_504_on_worker_timeout(client, make_pool, monkeypatch):
+    monkeypatch.setattr(Config, 'PDF_WORKER_POOL_ENABLED', True)
+    monkeypatch.setattr(Config, 'PDF_PREFLIGHT_ENABLED', False)
+    pool = make_pool(timeout=0.01)
+    monkeypatch.setattr(pdf_worker_pool, '_pool', pool)
+    
+    response = client.post(
+        '/api/documents/convert',
+        data={'file': (io.BytesIO(build_text_pdf(pages=20)), 'resume.pdf')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 504
+    assert response.get_json()['code'] == 'PDF_EXTRACTION_TIMEOUT'
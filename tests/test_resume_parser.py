@@ -0,0 +1,149 @@
+import pytest
+from benchmarks.fixtures import SAMPLE_RESUME_TEXT
+from services import resume_parser_service
+from services.resume_parser_service import PARSER_VERSION, RESUME_FIELDS, ResumeParserService
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    resume_parser_service._parse_cache.clear()
+    yield
+    resume_parser_service._parse_cache.clear()
+
+def test_parse_resume_fields():
+    data = ResumeParserService.parse_resume(SAMPLE_RESUME_TEXT)
+    
+    assert tuple(data) == RESUME_FIELDS
+    assert data['phone'] == '010-1234-5678'
+    assert data['email'] == 'hong@example.com'
+    assert data['introduction'] == '백엔드 개발자로서 대용량 트래픽 처리 경험이 있습니다.'
+    assert [(e['company'], e['start_date'], e['end_date'], e['position']) for e in data['experiences']] == [
+        ('네이버', '2020.03', '2022.02', '백엔드 개발자'),
+        ('카카오', '2022.03', '현재', '서버 개발자')
+    ]
+    assert [skill['id'] for skill in data['skills']] == [
+        'python', 'flask', 'spring', 'docker', 'kubernetes', 'mysql', 'redis'
+    ]
+    assert data['links'] == [
+        {'type': 'github', 'url': 'https://github.com/hong'},
+        {'type': 'blog', 'url': 'https://hong.tistory.com'}
+    ]
+    assert [(a['title'], a['date']) for a in data['awards']] == [
+        ('교내 해커톤 대상', '2019.11'), ('공개SW 개발자대회 은상', '2020.10')
+    ]
+    assert [(c['name'], c['date']) for c in data['certificates']] == [('정보처리기사', '2019.08'), ('SQLD', '2020.05')]
+    assert data['languages'] == [{'name': '영어', 'level': '상급'}, {'name': '일본어', 'level': '중급'}]
+    assert [(p['name'], p['period']) for p in data['projects']] == [
+        ('채용 추천 시스템', '2021.01 - 2021.06'), ('실시간 채팅 서버', '2021.07 - 2021.12')
+    ]
+
+def test_body_line_starting_with_keyword_is_not_a_header():
+    text = ResumeParserService._preprocess_text(
+        "프로젝트\n"
+        "채용 추천 시스템 2021.01 - 2021.06\n"
+        "Project 일정 관리와 Career 코칭 기능 개발\n"
+        "Experience with Kafka, Tools used: Jira\n"
+        "수상:\n"
+        "교내 해커톤 대상 (2019.11)"
+    )
+    sections = ResumeParserService._build_section_index(text)
+    
+    assert set(sections) == {'projects', 'awards'}
+    start, end = sections['projects']
+    assert text[start:end].strip().endswith('Tools used: Jira')
+
+def test_skill_positions_point_at_matched_text():
+    data = ResumeParserService.parse_resume(SAMPLE_RESUME_TEXT, 'skills')
+    cleaned_text = ResumeParserService._preprocess_text(SAMPLE_RESUME_TEXT)
+    
+    for skill in data['skills']:
+        start, end = skill['positions'][0]
+        assert cleaned_text[start:end].lower() == skill['name'].lower()
+
+def test_selected_fields_only_run_their_extractors():
+    result = ResumeParserService.parse_resume_timed(SAMPLE_RESUME_TEXT, 'email,phone')
+    
+    assert result.data == {'phone': '010-1234-5678', 'email': 'hong@example.com'}
+    assert 'sections' not in result.timings_ms
+    assert set(result.timings_ms) == {'preprocess', 'entities', 'phone', 'email'}
+
+def test_resolve_fields():
+    assert ResumeParserService.resolve_fields(None) == RESUME_FIELDS
+    assert ResumeParserService.resolve_fields('') == RESUME_FIELDS
+    assert ResumeParserService.resolve_fields('email, phone') == ('phone', 'email')
+    with pytest.raises(ValueError):
+        ResumeParserService.resolve_fields('email,bogus')
+
+def test_cache_key_depends_on_version_fields_and_lines():
+    from services.pdf_service import TextLine
+    
+    key = ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('email',))
+    lines = [TextLine(line, 10.0, False, 1, 0.0) for line in SAMPLE_RESUME_TEXT.splitlines()]
+    bold_lines = [line._replace(bold=True) for line in lines]
+    
+    assert key.startswith(f'{PARSER_VERSION}:email:')
+    assert key == ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('email',))
+    assert key != ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('phone', 'email'))
+    assert key != ResumeParserService._cache_key(SAMPLE_RESUME_TEXT + ' ', ('email',))
+    assert ':lines:' in ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('email',), lines)
+    assert (ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('email',), lines)
+            != ResumeParserService._cache_key(SAMPLE_RESUME_TEXT, ('email',), bold_lines))
+
+def test_cached_results_are_mutable_copies():
+    first = ResumeParserService.parse_resume_timed(SAMPLE_RESUME_TEXT)
+    first.data['skills'].clear()
+    first.data['extra'] = True
+    
+    second = ResumeParserService.parse_resume_timed(SAMPLE_RESUME_TEXT)
+    assert not first.cached and second.cached
+    assert type(second.data) is dict and type(second.data['experiences']) is list
+    assert len(second.data['skills']) == 7 and 'extra' not in second.data
+    
+    second.data['experiences'].clear()
+    assert len(ResumeParserService.parse_resume(SAMPLE_RESUME_TEXT)['experiences']) == 2
+
+def test_streaming_stops_early_when_pages_remain():
+    pages = ['홍길동\n010-1234-5678 hong@example.com', '경력\n네이버 2020.03 - 2022.02']
+    extracted = []
+    closed = []
+    
+    def page_iter():
+        try:
+            for page_text in pages:
+                extracted.append(page_text)
+                yield page_text
+        finally:
+            closed.append(True)
+    
+    result = ResumeParserService.parse_resume_streaming(page_iter(), 'phone,email', page_count=len(pages))
+    assert result.data == {'phone': '010-1234-5678', 'email': 'hong@example.com'}
+    assert result.pages_read == 1 and result.stopped_early
+    assert '네이버' not in result.text
+    # 조기 종료 여부를 알기 위해 다음 페이지를 추출하지 않음
+    assert extracted == pages[:1] and closed == [True]
+
+def test_streaming_pdf_stops_without_extracting_remaining_pages(monkeypatch):
+    from benchmarks.fixtures import build_text_pdf
+    from services.pdf_service import PDFService
+    
+    extract_page = PDFService._extract_page_text_lean
+    extracted = []
+    
+    def recording_extract(pdf, page):
+        extracted.append(page.page_number)
+        return '홍길동\n010-1234-5678 hong@example.com' if page.page_number == 1 else extract_page(pdf, page)
+    
+    monkeypatch.setattr(PDFService, '_extract_page_text_lean', staticmethod(recording_extract))
+    result = PDFService.parse_resume_streaming_from_bytes(build_text_pdf(pages=3), 'phone,email', lean=True)
+    assert result.pages_read == 1 and result.stopped_early
+    assert extracted == [1]
+
+def test_streaming_not_stopped_early_when_last_page_completes_fields():
+    pages = ['홍길동', '010-1234-5678 hong@example.com']
+    
+    result = ResumeParserService.parse_resume_streaming(iter(pages), 'phone,email')
+    assert result.pages_read == 2 and not result.stopped_early
+
+def test_streaming_not_stopped_early_when_fields_never_complete():
+    result = ResumeParserService.parse_resume_streaming(iter(['홍길동', '자기소개 없음']), 'email')
+    assert result.data == {'email': ''}
+    assert result.pages_read == 2 and not result.stopped_early
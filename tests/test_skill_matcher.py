@@ -0,0 +1,23 @@
+import pytest
+from services.skill_matcher import SKILLS, SkillMatcher
+
+@pytest.mark.parametrize('text', [
+    'I will go there',
+    'plan c is ok',
+    'Grade: A, B, c',
+    'spring season',
+    'rust on metal'
+])
+def test_common_words_are_not_skills(text):
+    assert SKILLS.find(text) == []
+
+def test_case_sensitive_names_match_exact_case():
+    matches = SKILLS.find('Go, C, Rust, Spring, spring boot, golang')
+    assert [match.skill_id for match in matches] == ['go', 'c', 'rust', 'spring', 'spring_boot', 'go']
+
+def test_name_is_case_insensitive_unless_listed():
+    matcher = SkillMatcher({'skills': [
+        {'id': 'kotlin', 'name': 'Kotlin'},
+        {'id': 'gin', 'name': 'Gin', 'case_sensitive_aliases': ['Gin']}
+    ]})
+    assert [match.skill_id for match in matcher.find('KOTLIN kotlin gin GIN Gin')] == ['kotlin', 'kotlin', 'gin']